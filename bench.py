@@ -0,0 +1,195 @@
+"""
+Headless frame benchmark
+
+Runs a scripted game session under SDL's dummy video driver and writes
+per-frame timings for GameScreen.update and GameScreen.draw, plus a
+per-subsystem breakdown from game.profiler, to JSON:
+
+    python bench.py --frames 2000 --output bench_results.json
+
+With --replay it plays back input recorded by `python main.py --record PATH`
+instead, as fast as possible and with the recorded frame times, so a session
+that hitched can be rerun exactly:
+
+    python bench.py --replay session.rec
+"""
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+
+# Must be set before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from main import GameState, init_display, WORLD_SIZE
+from screens.game_screen import GameScreen
+from game.profiler import profiler
+from game.replay import Recording
+
+SPRITE_SHEET_PATH = os.path.join("assets", "sprites", "character.png")
+FRAME_MS = 1000 / 60
+
+# Scripted session: (frames, held keys, keys pressed on the first frame)
+SCRIPT = [
+    (30, (), ()),
+    (60, (pygame.K_w,), ()),
+    (20, (), (pygame.K_1, pygame.K_SPACE)),
+    (40, (pygame.K_d,), ()),
+    (20, (), (pygame.K_2, pygame.K_SPACE)),
+    (40, (pygame.K_s, pygame.K_a), ()),
+    (20, (), (pygame.K_3, pygame.K_SPACE)),
+    (30, (), (pygame.K_F3, pygame.K_e)),
+    (60, (pygame.K_a,), ()),
+    (20, (), (pygame.K_4, pygame.K_SPACE, pygame.K_F3, pygame.K_e)),
+    (60, (pygame.K_d, pygame.K_w), ()),
+]
+
+class ScriptedKeys:
+    """Stand-in for pygame.key.get_pressed() holding a fixed set of keys"""
+    def __init__(self, held):
+        self.held = set(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+def scripted_input(frames):
+    """Yield (frame_ms, keys, events) for each frame, looping the script as needed"""
+    frame = 0
+    while frame < frames:
+        for length, held, pressed in SCRIPT:
+            keys = ScriptedKeys(held)
+            for i in range(length):
+                if frame >= frames:
+                    return
+                events = []
+                if i == 0:
+                    events = [pygame.event.Event(pygame.KEYDOWN, key=key) for key in pressed]
+                yield FRAME_MS, keys, events
+                frame += 1
+
+def summarize(samples):
+    samples = np.asarray(samples)
+    return {
+        'mean_ms': float(samples.mean()),
+        'p50_ms': float(np.percentile(samples, 50)),
+        'p95_ms': float(np.percentile(samples, 95)),
+        'p99_ms': float(np.percentile(samples, 99)),
+        'max_ms': float(samples.max()),
+    }
+
+def ensure_assets():
+    # The sprite sheet and icon atlas are build artifacts; build them on fresh checkouts
+    from tools.build_assets import build_icon_atlas
+    if not os.path.exists(SPRITE_SHEET_PATH):
+        from tools.character_generator import main as build_character_sheet
+        build_character_sheet([])
+    build_icon_atlas()
+
+def run_benchmark(frames, warmup, replay=None):
+    """
+    Run the benchmark and return its results
+    replay: Recording to play back instead of the scripted session; every
+            recorded frame is measured after the warmup
+    Quicksaves and quickloads (F5/F9) go to a temporary directory, so a
+    replay neither overwrites nor depends on the player's quicksave, and
+    loading skips offline catch-up so replays don't depend on wall time
+    """
+    screen = init_display()
+    ensure_assets()
+    if replay is None:
+        frame_input = scripted_input(warmup + frames)
+        world_size = WORLD_SIZE
+    else:
+        frame_input = Recording(replay)
+        world_size = frame_input.world_size
+    game_state = GameState(screen)
+    game_state.state = "game"
+    game_state.game_screen = GameScreen(screen, world_size)
+    game_screen = game_state.game_screen
+    save_dir = tempfile.TemporaryDirectory()
+    game_screen.save_path = os.path.join(save_dir.name, "quicksave.pdsave")
+    game_screen.catch_up = False
+
+    update_times = []
+    draw_times = []
+    profiler.history.clear()
+    try:
+        for frame, (frame_ms, keys, events) in enumerate(frame_input):
+            if frame == warmup:
+                profiler.history.clear()
+            profiler.begin_frame()
+            pygame.event.pump()
+            state = "game"
+            for event in events:
+                state = game_screen.handle_event(event)
+                if state != "game":
+                    break
+            
+            # The game went back to the title screen this frame, so it neither
+            # updated nor drew; the next recorded frame time covers the gap
+            if state != "game":
+                profiler.end_frame()
+                continue
+
+            # Simulate fixed frame times so every run does the same amount of work
+            start = time.perf_counter()
+            game_screen.update(keys, frame_ms=frame_ms)
+            updated = time.perf_counter()
+            game_screen.draw()
+            drawn = time.perf_counter()
+            profiler.end_frame()
+
+            if frame >= warmup:
+                update_times.append((updated - start) * 1000)
+                draw_times.append((drawn - updated) * 1000)
+    finally:
+        game_screen.world.close()
+        save_dir.cleanup()
+
+    if not update_times:
+        raise SystemExit("No frames were measured; use a longer recording or a shorter warmup")
+    frame_times = np.add(update_times, draw_times)
+    return {
+        'frames': len(update_times),
+        'replay': replay,
+        'warmup': warmup,
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'update': summarize(update_times),
+        'draw': summarize(draw_times),
+        'frame': summarize(frame_times),
+        'sections': {name: summarize(profiler.samples(name))
+                     for name in profiler.section_names()},
+        'samples': {
+            'update_ms': update_times,
+            'draw_ms': draw_times,
+        },
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Plant Daddy frame benchmark")
+    parser.add_argument("--frames", type=int, default=1000, help="number of measured frames")
+    parser.add_argument("--warmup", type=int, default=60, help="frames run before measuring")
+    parser.add_argument("--output", default="bench_results.json", help="JSON file to write")
+    parser.add_argument("--replay", help="input recording to play back instead of the script")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.frames, args.warmup, args.replay)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    for name in ('update', 'draw', 'frame'):
+        stats = results[name]
+        print(f"{name:>6}: p50 {stats['p50_ms']:.3f} ms  p95 {stats['p95_ms']:.3f} ms  "
+              f"p99 {stats['p99_ms']:.3f} ms  max {stats['max_ms']:.3f} ms")
+    print(f"Results written to {args.output}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import numpy as np
+
+class ClipTable:
+    def __init__(self):
+        """
+        Frame counts and timings of every animation clip, indexed by clip id
+        Clips are registered once and shared by everything that plays them
+        """
+        self.names = {}
+        self.frame_counts = np.zeros(0, dtype=np.int32)
+        self.frame_durations = np.zeros(0, dtype=np.float64)
+        self.loops = np.zeros(0, dtype=bool)
+
+    def register(self, name, frame_count, frame_duration, loop=True):
+        """
+        Add a clip, returning its id (registering the same name again returns the existing id)
+        frame_duration: Milliseconds per frame at speed 1.0
+        loop: Whether the clip wraps around or holds its last frame
+        """
+        clip_id = self.names.get(name)
+        if clip_id is not None:
+            return clip_id
+        clip_id = len(self.names)
+        self.names[name] = clip_id
+        self.frame_counts = np.append(self.frame_counts, frame_count)
+        self.frame_durations = np.append(self.frame_durations, frame_duration)
+        self.loops = np.append(self.loops, loop)
+        return clip_id
+
+class Animator:
+    def __init__(self, clips, capacity=64):
+        """
+        Stateless playback for any number of animations
+        Each animation is one slot holding (clip id, start time, speed); the
+        frame index of every slot is computed from the clock in one pass
+        """
+        self.clips = clips
+        self.clip = np.zeros(capacity, dtype=np.int32)
+        self.start = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.active = np.zeros(capacity, dtype=bool)
+        
+        # Frame index of every slot as of the last update
+        self.indices = np.zeros(capacity, dtype=np.int32)
+        self.free = list(range(capacity - 1, -1, -1))
+
+    def grow(self):
+        capacity = len(self.clip)
+        for name in ('clip', 'start', 'speed', 'active', 'indices'):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+        self.free.extend(range(capacity * 2 - 1, capacity - 1, -1))
+
+    def add(self, clip_id, start=None, speed=1.0):
+        """
+        Start playing a clip in a new slot and return the slot
+        start: Clock time the clip started at; None starts it at the next update
+        """
+        if not self.free:
+            self.grow()
+        slot = self.free.pop()
+        self.active[slot] = True
+        self.indices[slot] = 0
+        self.play(slot, clip_id, start, speed)
+        return slot
+
+    def play(self, slot, clip_id, start=None, speed=None):
+        """Switch a slot to a clip, restarting it from the first frame"""
+        self.clip[slot] = clip_id
+        self.start[slot] = np.nan if start is None else start
+        if speed is not None:
+            self.speed[slot] = speed
+        self.indices[slot] = 0
+
+    def remove(self, slot):
+        self.active[slot] = False
+        self.free.append(slot)
+
+    def update(self, now):
+        """Compute the frame index of every slot at clock time now"""
+        if not self.clips.names:
+            return self.indices
+        
+        # Slots started since the last update begin now
+        pending = np.isnan(self.start)
+        self.start[pending] = now
+        
+        clip = self.clip
+        frames = ((now - self.start) * self.speed // self.clips.frame_durations[clip]).astype(np.int32)
+        counts = self.clips.frame_counts[clip]
+        self.indices = np.where(self.clips.loops[clip],
+                                frames % counts,
+                                np.minimum(frames, counts - 1))
+        self.indices[~self.active] = 0
+        return self.indices
+
+    def frame(self, slot):
+        """Frame index of a slot as of the last update"""
+        return int(self.indices[slot])
+
+# Shared by everything animated in the game; advanced once per rendered frame
+clips = ClipTable()
+animator = Animator(clips)
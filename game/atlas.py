@@ -0,0 +1,80 @@
+import json
+import os
+import pygame
+
+# Tool and item icons, built by tools/build_assets.py
+ICON_ATLAS_PATH = os.path.join("assets", "ui", "icons.png")
+ICON_MANIFEST_PATH = os.path.join("assets", "ui", "icons.json")
+
+class Atlas:
+    def __init__(self, surface: pygame.Surface, rects: dict):
+        """
+        A single surface holding many images, plus where each one lives
+        surface: The packed image
+        rects: Dict of image name to its pygame.Rect inside the surface
+        """
+        self.surface = surface
+        self.rects = rects
+        self._subsurfaces = {}
+
+    def get(self, name: str) -> pygame.Surface:
+        """Return an image as a subsurface (shares pixels with the atlas)"""
+        image = self._subsurfaces.get(name)
+        if image is None:
+            image = self.surface.subsurface(self.rects[name])
+            self._subsurfaces[name] = image
+        return image
+
+    def __contains__(self, name):
+        return name in self.rects
+
+    @classmethod
+    def pack(cls, images: dict, max_width: int = 1024) -> "Atlas":
+        """Pack named surfaces into one atlas, shelf by shelf"""
+        rects = {}
+        x = y = shelf_height = width = 0
+        for name, image in sorted(images.items(), key=lambda item: -item[1].get_height()):
+            w, h = image.get_size()
+            if x + w > max_width and x > 0:
+                # Start a new shelf
+                y += shelf_height
+                x = shelf_height = 0
+            rects[name] = pygame.Rect(x, y, w, h)
+            x += w
+            width = max(width, x)
+            shelf_height = max(shelf_height, h)
+
+        surface = pygame.Surface((max(1, width), max(1, y + shelf_height)), pygame.SRCALPHA)
+        surface.blits([(images[name], rect) for name, rect in rects.items()], doreturn=False)
+        return cls(surface, rects)
+
+    def save(self, image_path, manifest_path, **metadata):
+        """Write the atlas image and a JSON manifest of frame rects"""
+        os.makedirs(os.path.dirname(image_path) or ".", exist_ok=True)
+        pygame.image.save(self.surface, image_path)
+        manifest = dict(metadata)
+        manifest['image'] = os.path.basename(image_path)
+        manifest['frames'] = {name: list(rect) for name, rect in self.rects.items()}
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+
+    @classmethod
+    def load(cls, image_path, manifest_path) -> "Atlas":
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        surface = pygame.image.load(image_path)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        rects = {name: pygame.Rect(rect) for name, rect in manifest['frames'].items()}
+        atlas = cls(surface, rects)
+        atlas.manifest = manifest
+        return atlas
+
+_icon_atlas = None
+
+def load_icon_atlas():
+    """Return the shared UI icon atlas, or None if it has not been built"""
+    global _icon_atlas
+    if _icon_atlas is None and os.path.exists(ICON_ATLAS_PATH):
+        _icon_atlas = Atlas.load(ICON_ATLAS_PATH, ICON_MANIFEST_PATH)
+    return _icon_atlas
@@ -0,0 +1,184 @@
+import os
+import tempfile
+import numpy as np
+
+# Number of tiles along each side of a chunk
+CHUNK_SIZE = 16
+
+def chunk_key(grid_x, grid_y):
+    """Return the (chunk_x, chunk_y) key of the chunk containing a tile"""
+    return grid_x // CHUNK_SIZE, grid_y // CHUNK_SIZE
+
+class ChunkStore:
+    def __init__(self, grid_width, grid_height, generator, cache_dir=None, dtype=np.uint8):
+        """
+        Tile layer stored as a dict of small chunks, created on first access
+        grid_width, grid_height: Size of the whole layer in tiles
+        generator: Called as generator(chunk_x, chunk_y) to build a chunk that
+                   has never been stored before
+        cache_dir: Directory that evicted chunks are written to (a temporary
+                   directory is created when first needed if not given, and
+                   removed again by close() or at exit)
+        """
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.generator = generator
+        self.cache_dir = cache_dir
+        self.temp_dir = None
+        self.dtype = dtype
+        self.chunks = {}
+
+        # Chunks changed since they were generated or loaded
+        self.dirty = set()
+
+        # Chunks whose tiles differ from what the generator would build
+        self.modified = set()
+
+        # Extra places to look for a chunk before generating it, e.g. a save
+        # file; each is called as source(chunk_x, chunk_y) and returns None
+        # if it does not have the chunk
+        self.sources = []
+
+        # Callbacks run as hook(key, tiles) after a chunk is loaded / before it is evicted
+        self.load_hooks = []
+        self.evict_hooks = []
+
+    @property
+    def chunks_wide(self):
+        return (self.grid_width + CHUNK_SIZE - 1) // CHUNK_SIZE
+
+    @property
+    def chunks_high(self):
+        return (self.grid_height + CHUNK_SIZE - 1) // CHUNK_SIZE
+
+    def in_bounds(self, grid_x, grid_y):
+        return 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height
+
+    def chunk_path(self, key):
+        if self.cache_dir is None:
+            self.temp_dir = tempfile.TemporaryDirectory(prefix="plant_daddy_chunks_")
+            self.cache_dir = self.temp_dir.name
+        return os.path.join(self.cache_dir, f"{key[0]}_{key[1]}.npy")
+
+    def get_chunk(self, chunk_x, chunk_y):
+        """Return the tile array for a chunk, loading or generating it if needed"""
+        key = (chunk_x, chunk_y)
+        tiles = self.chunks.get(key)
+        if tiles is None:
+            tiles = self.load_chunk(key)
+            self.chunks[key] = tiles
+            for hook in self.load_hooks:
+                hook(key, tiles)
+        return tiles
+
+    def load_chunk(self, key):
+        if self.cache_dir is not None:
+            path = self.chunk_path(key)
+            if os.path.exists(path):
+                return np.load(path)
+
+        for source in self.sources:
+            tiles = source(*key)
+            if tiles is not None:
+                self.modified.add(key)
+                return np.array(tiles, dtype=self.dtype)
+        return np.asarray(self.generator(*key), dtype=self.dtype)
+
+    def read_chunk(self, key):
+        """Return a chunk's tiles without making it resident"""
+        tiles = self.chunks.get(key)
+        if tiles is None:
+            tiles = self.load_chunk(key)
+        return tiles
+
+    def mark_dirty(self, key):
+        self.dirty.add(key)
+        self.modified.add(key)
+
+    def get(self, grid_x, grid_y):
+        if not self.in_bounds(grid_x, grid_y):
+            return None
+        tiles = self.get_chunk(grid_x // CHUNK_SIZE, grid_y // CHUNK_SIZE)
+        return tiles[grid_y % CHUNK_SIZE, grid_x % CHUNK_SIZE]
+
+    def set(self, grid_x, grid_y, value):
+        """Set a tile, returning True if its value changed"""
+        if not self.in_bounds(grid_x, grid_y):
+            return False
+        key = chunk_key(grid_x, grid_y)
+        tiles = self.get_chunk(*key)
+        local = (grid_y % CHUNK_SIZE, grid_x % CHUNK_SIZE)
+        if tiles[local] == value:
+            return False
+        tiles[local] = value
+        self.mark_dirty(key)
+        return True
+
+    def get_region(self, grid_x, grid_y, width, height):
+        """Copy a rectangle of tiles into one dense array (clipped to the layer)"""
+        x0, y0 = max(0, grid_x), max(0, grid_y)
+        x1 = min(self.grid_width, grid_x + width)
+        y1 = min(self.grid_height, grid_y + height)
+        region = np.zeros((max(0, y1 - y0), max(0, x1 - x0)), dtype=self.dtype)
+
+        for chunk_y in range(y0 // CHUNK_SIZE, (y1 - 1) // CHUNK_SIZE + 1):
+            for chunk_x in range(x0 // CHUNK_SIZE, (x1 - 1) // CHUNK_SIZE + 1):
+                tiles = self.get_chunk(chunk_x, chunk_y)
+
+                # Overlap between this chunk and the requested region
+                left = max(x0, chunk_x * CHUNK_SIZE)
+                top = max(y0, chunk_y * CHUNK_SIZE)
+                right = min(x1, (chunk_x + 1) * CHUNK_SIZE)
+                bottom = min(y1, (chunk_y + 1) * CHUNK_SIZE)
+                region[top - y0:bottom - y0, left - x0:right - x0] = tiles[
+                    top - chunk_y * CHUNK_SIZE:bottom - chunk_y * CHUNK_SIZE,
+                    left - chunk_x * CHUNK_SIZE:right - chunk_x * CHUNK_SIZE]
+        return region
+
+    def evict(self, key):
+        """Drop a chunk from memory, writing it to disk first if it was changed"""
+        tiles = self.chunks.get(key)
+        if tiles is None:
+            return
+        for hook in self.evict_hooks:
+            hook(key, tiles)
+        if key in self.dirty:
+            np.save(self.chunk_path(key), tiles)
+            self.dirty.discard(key)
+        del self.chunks[key]
+
+    def update_residency(self, center_x, center_y, load_radius=2, keep_radius=4):
+        """
+        Stream chunks around a point
+        center_x, center_y: Center in tile coordinates (usually the camera)
+        load_radius: Chunks within this many chunks of the center are loaded
+        keep_radius: Chunks farther than this are evicted
+        Returns the list of evicted chunk keys
+        """
+        center_chunk_x, center_chunk_y = chunk_key(int(center_x), int(center_y))
+
+        for chunk_y in range(max(0, center_chunk_y - load_radius),
+                             min(self.chunks_high, center_chunk_y + load_radius + 1)):
+            for chunk_x in range(max(0, center_chunk_x - load_radius),
+                                 min(self.chunks_wide, center_chunk_x + load_radius + 1)):
+                self.get_chunk(chunk_x, chunk_y)
+
+        evicted = [key for key in self.chunks
+                   if max(abs(key[0] - center_chunk_x), abs(key[1] - center_chunk_y)) > keep_radius]
+        for key in evicted:
+            self.evict(key)
+        return evicted
+
+    def close(self):
+        """
+        Delete the temporary chunk cache, if one was created
+        Only call this once the store is no longer used, as evicted chunks are lost
+        """
+        if self.temp_dir is not None:
+            self.temp_dir.cleanup()
+            self.temp_dir = None
+            self.cache_dir = None
+
+    def memory_bytes(self):
+        """Bytes of tile data currently held in memory"""
+        return sum(tiles.nbytes for tiles in self.chunks.values())
@@ -0,0 +1,153 @@
+import heapq
+
+# Simulation rate, independent of the rendering frame rate
+TICK_RATE = 60
+TICK_MS = 1000 / TICK_RATE
+
+class FixedStepClock:
+    def __init__(self, step_ms=TICK_MS, max_steps=8):
+        """
+        Accumulates real frame time and hands it out in fixed simulation steps
+        step_ms: Length of one simulation tick in milliseconds
+        max_steps: Most ticks run for a single frame; time beyond that is
+                   dropped so a long stall can't snowball into ever longer frames
+        """
+        self.step_ms = step_ms
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.ticks = 0
+
+    def advance(self, frame_ms):
+        """Add a frame's worth of time and return how many ticks to simulate"""
+        self.accumulator += frame_ms
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_ms
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """How far rendering is between the last two ticks (0.0 - 1.0)"""
+        return self.accumulator / self.step_ms
+
+def lerp(previous, current, alpha):
+    return previous + (current - previous) * alpha
+
+# Game time runs in minutes; one real second is one game hour
+MINUTES_PER_DAY = 24 * 60
+GAME_MINUTES_PER_MS = 60 / 1000
+
+class ScheduledEvent:
+    __slots__ = ('time', 'interval', 'callback', 'batch', 'cancelled')
+
+    def __init__(self, time, interval, callback, batch=None):
+        self.time = time
+        self.interval = interval
+        self.callback = callback
+        self.batch = batch
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+class GameClock:
+    def __init__(self, minutes=0.0):
+        """
+        In-game time with a scheduler for timed and recurring events
+        minutes: Game minutes since the start of day 1
+        Events wait in a heap ordered by due time, so advancing the clock
+        only touches the events that are actually due
+        """
+        self.minutes = minutes
+        self.queue = []  # (time, order, event)
+        self.order = 0   # Keeps events due at the same time in scheduling order
+
+    @property
+    def day(self):
+        return int(self.minutes // MINUTES_PER_DAY) + 1
+
+    @property
+    def time_of_day(self):
+        """Minutes since midnight"""
+        return self.minutes % MINUTES_PER_DAY
+
+    def push(self, event):
+        heapq.heappush(self.queue, (event.time, self.order, event))
+        self.order += 1
+
+    def schedule_at(self, time, callback, interval=None, batch=None):
+        """
+        Call callback() once the clock reaches time (in game minutes)
+        interval: If given, repeat every interval minutes after that
+        batch: For repeating events, called as batch(count) to run count
+               occurrences at once when the clock is fast-forwarded
+        Returns the event, which can be cancelled
+        """
+        event = ScheduledEvent(time, interval, callback, batch)
+        self.push(event)
+        return event
+
+    def schedule_in(self, delay, callback, interval=None, batch=None):
+        return self.schedule_at(self.minutes + delay, callback, interval, batch)
+
+    def every_day(self, callback, at=0.0, batch=None):
+        """Call callback() every day at a time of day (minutes since midnight)"""
+        start = (self.day - 1) * MINUTES_PER_DAY + at
+        if start <= self.minutes:
+            start += MINUTES_PER_DAY
+        return self.schedule_at(start, callback, MINUTES_PER_DAY, batch)
+
+    def next_due(self):
+        """Time of the next pending event, or None"""
+        while self.queue and self.queue[0][2].cancelled:
+            heapq.heappop(self.queue)
+        return self.queue[0][0] if self.queue else None
+
+    def advance(self, minutes, batched=False):
+        """
+        Move the clock forward, running every event that falls due in order
+        While an event runs the clock reads that event's due time
+        batched: Run each repeating event that has a batch callback only once,
+                 for all of its occurrences up to the new time (used to skip
+                 ahead quickly; the event runs at its last occurrence)
+        Returns the number of callbacks run
+        """
+        target = self.minutes + minutes
+        fired = 0
+        while True:
+            due = self.next_due()
+            if due is None or due > target:
+                break
+            _, _, event = heapq.heappop(self.queue)
+            if batched and event.batch is not None and event.interval:
+                count = int((target - event.time) // event.interval) + 1
+                self.minutes = event.time + (count - 1) * event.interval
+                event.batch(count)
+                event.time += count * event.interval
+            else:
+                self.minutes = event.time
+                event.callback()
+                if event.interval:
+                    event.time += event.interval
+            fired += 1
+            if event.interval and not event.cancelled:
+                self.push(event)
+        self.minutes = target
+        return fired
+
+    def reset(self, minutes):
+        """
+        Jump to a time without running anything in between, e.g. after loading
+        Recurring events move to their first occurrence after the new time
+        """
+        self.minutes = minutes
+        for _, _, event in self.queue:
+            if event.interval and event.time <= minutes:
+                periods = (minutes - event.time) // event.interval + 1
+                event.time += periods * event.interval
+        self.queue = [(event.time, order, event) for _, order, event in self.queue]
+        heapq.heapify(self.queue)
@@ -0,0 +1,200 @@
+import math
+import numpy as np
+from game.chunks import CHUNK_SIZE
+
+# Each chunk row of walkability bits fits in one integer
+ROW_DTYPE = np.uint16 if CHUNK_SIZE <= 16 else np.uint32
+FULL_ROW = (1 << CHUNK_SIZE) - 1
+
+# Small gap kept between a blocked box and the tile it ran into
+EPSILON = 1e-4
+
+class WalkabilityMask:
+    def __init__(self, tiles, tile_size, walkable_table):
+        """
+        Packed walkability bits for a ChunkStore, kept in sync as chunks load
+        tiles: The world's ChunkStore
+        tile_size: Tile size in pixels
+        walkable_table: Bool array mapping tile type to walkable
+        Each chunk is stored as CHUNK_SIZE row bitmasks (bit x set = walkable)
+        """
+        self.tiles = tiles
+        self.tile_size = tile_size
+        self.walkable_table = walkable_table
+        self.masks = {}
+        self._bit_values = (1 << np.arange(CHUNK_SIZE)).astype(ROW_DTYPE)
+        self._empty = np.zeros(CHUNK_SIZE, dtype=ROW_DTYPE)
+        
+        tiles.load_hooks.append(self.on_chunk_loaded)
+        tiles.evict_hooks.append(self.on_chunk_evicted)
+        for key, chunk in tiles.chunks.items():
+            self.on_chunk_loaded(key, chunk)
+
+    def pack(self, key, chunk):
+        walkable = self.walkable_table[chunk]
+        
+        # Tiles past the edge of the world are never walkable
+        valid_width = self.tiles.grid_width - key[0] * CHUNK_SIZE
+        valid_height = self.tiles.grid_height - key[1] * CHUNK_SIZE
+        walkable[:, max(0, valid_width):] = False
+        walkable[max(0, valid_height):, :] = False
+        return (walkable * self._bit_values).sum(axis=1, dtype=ROW_DTYPE)
+
+    def on_chunk_loaded(self, key, chunk):
+        self.masks[key] = self.pack(key, chunk)
+
+    def on_chunk_evicted(self, key, chunk):
+        self.masks.pop(key, None)
+
+    def update_tile(self, grid_x, grid_y, tile_type):
+        """Keep the mask in sync after a tile changed"""
+        key = (grid_x // CHUNK_SIZE, grid_y // CHUNK_SIZE)
+        mask = self.masks.get(key)
+        if mask is None:
+            return
+        bit = ROW_DTYPE(1 << (grid_x % CHUNK_SIZE))
+        if self.walkable_table[tile_type] and self.tiles.in_bounds(grid_x, grid_y):
+            mask[grid_y % CHUNK_SIZE] |= bit
+        else:
+            mask[grid_y % CHUNK_SIZE] &= ~bit
+
+    def get_mask(self, chunk_x, chunk_y):
+        mask = self.masks.get((chunk_x, chunk_y))
+        if mask is None:
+            if not (0 <= chunk_x < self.tiles.chunks_wide and 0 <= chunk_y < self.tiles.chunks_high):
+                return self._empty
+            self.tiles.get_chunk(chunk_x, chunk_y)  # load hook fills in the mask
+            mask = self.masks[(chunk_x, chunk_y)]
+        return mask
+
+    def is_walkable(self, grid_x, grid_y):
+        mask = self.get_mask(grid_x // CHUNK_SIZE, grid_y // CHUNK_SIZE)
+        return bool((int(mask[grid_y % CHUNK_SIZE]) >> (grid_x % CHUNK_SIZE)) & 1)
+
+    def area_walkable(self, first_x, first_y, last_x, last_y):
+        """True if every tile in the inclusive rect of tiles is walkable"""
+        for grid_y in range(first_y, last_y + 1):
+            chunk_y, row = divmod(grid_y, CHUNK_SIZE)
+            # Test each chunk's slice of the row with a single bit mask
+            for chunk_x in range(first_x // CHUNK_SIZE, last_x // CHUNK_SIZE + 1):
+                low = max(first_x - chunk_x * CHUNK_SIZE, 0)
+                high = min(last_x - chunk_x * CHUNK_SIZE, CHUNK_SIZE - 1)
+                span = ((1 << (high - low + 1)) - 1) << low
+                if int(self.get_mask(chunk_x, chunk_y)[row]) & span != span:
+                    return False
+        return True
+
+    def move_box(self, x, y, width, height, dx, dy):
+        """
+        Move a box (top left x, y) by dx, dy, stopping at unwalkable tiles
+        Each axis is swept separately, so the box slides along walls and
+        can't tunnel through them however far it moves in one step
+        Returns the new (x, y)
+        """
+        x = self.sweep(x, y, width, height, dx, horizontal=True)
+        y = self.sweep(y, x, height, width, dy, horizontal=False)
+        return x, y
+
+    def sweep(self, position, cross, size, cross_size, delta, horizontal):
+        """Sweep one axis; cross/cross_size describe the box on the other axis"""
+        if delta == 0:
+            return position
+        tile = self.tile_size
+        first_cross = math.floor(cross / tile)
+        last_cross = math.floor((cross + cross_size - EPSILON) / tile)
+        
+        # Tiles the leading edge passes into, in order of travel
+        if delta > 0:
+            edge = position + size
+            start = math.floor((edge - EPSILON) / tile) + 1
+            end = math.floor((edge + delta - EPSILON) / tile)
+            step = 1
+        else:
+            edge = position
+            start = math.floor(edge / tile) - 1
+            end = math.floor((edge + delta) / tile)
+            step = -1
+        
+        for line in range(start, end + step, step):
+            if horizontal:
+                clear = self.area_walkable(line, first_cross, line, last_cross)
+            else:
+                clear = self.area_walkable(first_cross, line, last_cross, line)
+            if not clear:
+                # Stop flush against the blocking tile
+                if delta > 0:
+                    return line * tile - size - EPSILON
+                return (line + 1) * tile + EPSILON
+        return position + delta
+
+    def gather(self, grid_x, grid_y):
+        """Vectorized walkability lookup for arrays of tile coordinates"""
+        grid_x = np.asarray(grid_x, dtype=np.int64)
+        grid_y = np.asarray(grid_y, dtype=np.int64)
+        chunk_x, local_x = np.divmod(grid_x, CHUNK_SIZE)
+        chunk_y, local_y = np.divmod(grid_y, CHUNK_SIZE)
+        
+        # One mask lookup per distinct chunk, then pure array indexing
+        keys, inverse = np.unique(np.stack((chunk_x.ravel(), chunk_y.ravel()), axis=1),
+                                  axis=0, return_inverse=True)
+        masks = np.stack([self.get_mask(int(cx), int(cy)) for cx, cy in keys])
+        rows = masks[inverse.ravel(), local_y.ravel()].astype(np.int64)
+        return ((rows >> local_x.ravel()) & 1).astype(bool).reshape(grid_x.shape)
+
+    def move_bodies(self, positions, sizes, deltas):
+        """
+        Move many boxes at once, with the same rules as move_box
+        positions: (N, 2) array of top left corners in pixels
+        sizes: (N, 2) array of box widths and heights (each at most one tile
+               per axis is checked per sub-step, so any size up to a tile works)
+        deltas: (N, 2) array of movement for this step
+        Returns the new (N, 2) positions
+        """
+        positions = np.array(positions, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        deltas = np.asarray(deltas, dtype=np.float64)
+        if len(positions) == 0:
+            return positions
+        
+        # Sub-step so no body moves more than one tile per axis per step
+        steps = max(1, int(np.ceil(np.abs(deltas).max() / self.tile_size)))
+        step_deltas = deltas / steps
+        for _ in range(steps):
+            for axis in (0, 1):
+                self._sweep_bodies(positions, sizes, step_deltas[:, axis], axis)
+        return positions
+
+    def _sweep_bodies(self, positions, sizes, delta, axis):
+        tile = self.tile_size
+        cross_axis = 1 - axis
+        moving = delta != 0
+        if not moving.any():
+            return
+        
+        position = positions[:, axis]
+        size = sizes[:, axis]
+        
+        # The one line of tiles each leading edge may enter this sub-step
+        forward = delta > 0
+        edge = np.where(forward, position + size, position)
+        current = np.where(forward, np.floor((edge - EPSILON) / tile), np.floor(edge / tile))
+        target = np.where(forward, np.floor((edge + delta - EPSILON) / tile), np.floor((edge + delta) / tile))
+        entering = moving & (target != current)
+        
+        # Check every tile the box spans on the other axis
+        cross_first = np.floor(positions[:, cross_axis] / tile)
+        cross_last = np.floor((positions[:, cross_axis] + sizes[:, cross_axis] - EPSILON) / tile)
+        span = int((cross_last - cross_first).max()) + 1
+        cross = cross_first[:, None] + np.arange(span)[None, :]
+        cross = np.minimum(cross, cross_last[:, None])
+        line = np.repeat(target[:, None], span, axis=1)
+        if axis == 0:
+            clear = self.gather(line, cross).all(axis=1)
+        else:
+            clear = self.gather(cross, line).all(axis=1)
+        
+        blocked = entering & ~clear
+        new_position = position + delta
+        new_position[blocked & forward] = (target * tile - size - EPSILON)[blocked & forward]
+        new_position[blocked & ~forward] = ((target + 1) * tile + EPSILON)[blocked & ~forward]
+        positions[:, axis] = np.where(moving, new_position, position)
@@ -0,0 +1,173 @@
+import numpy as np
+from game.items import Items
+from game.chunks import CHUNK_SIZE, chunk_key
+
+class CropMeta(type):
+    def __getattr__(cls, name):
+        """
+        Resolve the crop item tables to registry indices on first use, so
+        importing crops doesn't load the item registry
+        """
+        if name not in ('SEEDS', 'PRODUCE', 'SEED_CROPS'):
+            raise AttributeError(f"type object 'Crop' has no attribute {name!r}")
+        registry = Items.registry
+        cls.SEEDS = np.array([0] + [registry.get(item_id).index for item_id in cls.SEED_IDS[1:]],
+                             dtype=np.int32)
+        cls.PRODUCE = np.array([0] + [registry.get(item_id).index for item_id in cls.PRODUCE_IDS[1:]],
+                               dtype=np.int32)
+        
+        # Crop grown from each item, indexed by registry index (Crop.NONE for non-seeds)
+        cls.SEED_CROPS = np.zeros(len(registry) + 1, dtype=np.uint8)
+        cls.SEED_CROPS[cls.SEEDS[1:]] = np.arange(1, len(cls.SEEDS))
+        return getattr(cls, name)
+
+class Crop(metaclass=CropMeta):
+    NONE = 0
+    CARROT = 1
+    TOMATO = 2
+    POTATO = 3
+
+    # Per-crop properties, indexed by crop type; SEEDS and PRODUCE hold the
+    # registry indices of these items
+    SEED_IDS = (None, 'carrot_seeds', 'tomato_seeds', 'potato_seeds')
+    PRODUCE_IDS = (None, 'carrot', 'tomato', 'potato')
+    COLORS = [(0, 0, 0), (255, 140, 0), (220, 20, 60), (222, 184, 135)]
+    SPROUT_COLOR = (50, 205, 50)
+
+    # Watered days needed before a crop can be harvested
+    GROWTH_DAYS = np.array([0, 3, 5, 4], dtype=np.uint8)
+
+    @staticmethod
+    def from_seed(item_type):
+        """Return the crop grown from a seed item, or Crop.NONE"""
+        return int(Crop.SEED_CROPS[item_type.index])
+
+    @staticmethod
+    def produce(crop):
+        """Return the item type a crop is harvested as"""
+        return Items.registry[int(Crop.PRODUCE[crop])]
+
+class CropField:
+    def __init__(self):
+        """
+        Crop state stored as parallel arrays aligned with the world's chunks
+        Each array has shape (chunks, CHUNK_SIZE, CHUNK_SIZE); a chunk only
+        gets a slot once something is planted in it.
+        """
+        self.slots = {}  # (chunk_x, chunk_y) -> index into the arrays
+        self.keys = []   # index -> (chunk_x, chunk_y)
+        self.allocate(0)
+
+    def allocate(self, capacity):
+        """Resize the crop arrays to hold capacity chunks"""
+        shape = (capacity, CHUNK_SIZE, CHUNK_SIZE)
+        arrays = {
+            'crop_type': np.zeros(shape, dtype=np.uint8),
+            'growth_stage': np.zeros(shape, dtype=np.uint8),
+            'days_watered': np.zeros(shape, dtype=np.uint16),
+            'planted_at': np.zeros(shape, dtype=np.int32),
+            'watered': np.zeros(shape, dtype=bool),
+        }
+        count = len(self.keys)
+        for name, array in arrays.items():
+            if count:
+                array[:count] = getattr(self, name)[:count]
+            setattr(self, name, array)
+
+    def restore(self, keys, arrays):
+        """
+        Replace all crop state with previously saved chunks
+        keys: Sequence of (chunk_x, chunk_y), one per chunk
+        arrays: Dict of array name to an array of shape (len(keys), CHUNK_SIZE, CHUNK_SIZE)
+        """
+        self.keys = [tuple(key) for key in np.asarray(keys).tolist()]
+        self.slots = {key: slot for slot, key in enumerate(self.keys)}
+        for name, array in arrays.items():
+            setattr(self, name, array)
+
+    def locate(self, grid_x, grid_y, create=False):
+        """Return (slot, local_y, local_x) for a tile, or None if its chunk has no slot"""
+        key = chunk_key(grid_x, grid_y)
+        slot = self.slots.get(key)
+        if slot is None:
+            if not create:
+                return None
+            slot = len(self.keys)
+            if slot == len(self.crop_type):
+                self.allocate(max(4, slot * 2))
+            self.slots[key] = slot
+            self.keys.append(key)
+        return slot, grid_y % CHUNK_SIZE, grid_x % CHUNK_SIZE
+
+    def get_chunk(self, chunk_x, chunk_y):
+        """Return (crop_type, growth_stage) arrays for a chunk, or None"""
+        slot = self.slots.get((chunk_x, chunk_y))
+        if slot is None:
+            return None
+        return self.crop_type[slot], self.growth_stage[slot]
+
+    def has_crop(self, grid_x, grid_y):
+        cell = self.locate(grid_x, grid_y)
+        return cell is not None and self.crop_type[cell] != Crop.NONE
+
+    def is_mature(self, grid_x, grid_y):
+        cell = self.locate(grid_x, grid_y)
+        if cell is None:
+            return False
+        crop = self.crop_type[cell]
+        return crop != Crop.NONE and self.growth_stage[cell] >= Crop.GROWTH_DAYS[crop]
+
+    def plant(self, grid_x, grid_y, crop, day):
+        if crop == Crop.NONE or self.has_crop(grid_x, grid_y):
+            return False
+        cell = self.locate(grid_x, grid_y, create=True)
+        self.crop_type[cell] = crop
+        self.growth_stage[cell] = 0
+        self.days_watered[cell] = 0
+        self.planted_at[cell] = day
+        return True
+
+    def water(self, grid_x, grid_y):
+        cell = self.locate(grid_x, grid_y, create=True)
+        self.watered[cell] = True
+
+    def harvest(self, grid_x, grid_y):
+        """Remove a mature crop and return its type, or Crop.NONE"""
+        if not self.is_mature(grid_x, grid_y):
+            return Crop.NONE
+        cell = self.locate(grid_x, grid_y)
+        crop = int(self.crop_type[cell])
+        self.crop_type[cell] = Crop.NONE
+        self.growth_stage[cell] = 0
+        self.days_watered[cell] = 0
+        self.planted_at[cell] = 0
+        return crop
+
+    def grow(self, watered_days=None):
+        """
+        Advance every crop in a single vectorized step
+        watered_days: Shape (len(keys), CHUNK_SIZE, CHUNK_SIZE), the number of
+        days each cell was watered (default: one day wherever watered is set);
+        crops grow one stage per watered day, up to their crop's final stage
+        Returns the keys of the chunks where a growth stage changed
+        """
+        count = len(self.keys)
+        if watered_days is None:
+            watered_days = self.watered[:count]
+        planted = self.crop_type[:count] != Crop.NONE
+        watered_days = np.where(planted, watered_days, 0).astype(np.intp)
+        self.watered[:count] = False
+        if not watered_days.any():
+            return []
+        crop_type = self.crop_type[:count]
+        growth_stage = self.growth_stage[:count]
+        
+        # Saturate instead of wrapping after very long skips
+        limit = np.iinfo(self.days_watered.dtype).max
+        self.days_watered[:count] = np.minimum(self.days_watered[:count] + watered_days, limit)
+        
+        final_stage = Crop.GROWTH_DAYS[crop_type]
+        grown = np.minimum(growth_stage + watered_days, final_stage)
+        growing = grown != growth_stage
+        growth_stage[:] = grown
+        return [self.keys[slot] for slot in np.flatnonzero(growing.any(axis=(1, 2)))]
@@ -0,0 +1,56 @@
+import pygame
+
+class DirtyRegions:
+    def __init__(self):
+        """
+        Tracks which parts of the screen changed since the last display update
+        Starts out needing a full redraw
+        """
+        self.rects = []
+        self.full_redraw = True
+
+    def add(self, rect):
+        if rect is not None and rect.width > 0 and rect.height > 0:
+            self.rects.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        """Redraw and push the whole screen on the next present()"""
+        self.full_redraw = True
+
+    def present(self, screen, draw):
+        """
+        Redraw the dirty regions and push them to the display
+        draw: Called once as draw(rects) with the rects to repaint; the screen
+              is clipped to their bounding box, so large layers should only
+              blit into the rects themselves
+        Returns the list of rects that were pushed
+        """
+        if self.full_redraw:
+            rects = [screen.get_rect()]
+            draw(rects)
+            pygame.display.flip()
+        else:
+            rects = merge_overlapping(rect.clip(screen.get_rect()) for rect in self.rects)
+            if rects:
+                screen.set_clip(rects[0].unionall(rects[1:]))
+                draw(rects)
+                screen.set_clip(None)
+                pygame.display.update(rects)
+
+        self.rects = []
+        self.full_redraw = False
+        return rects
+
+def merge_overlapping(rects):
+    """Union overlapping rects so each pixel is redrawn once"""
+    merged = []
+    for rect in rects:
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        # Keep absorbing overlapping rects until none are left
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect = rect.union(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
@@ -0,0 +1,35 @@
+import pygame
+from game.atlas import load_icon_atlas
+
+class Pickup:
+    size = 20
+
+    def __init__(self, x, y, stack):
+        """
+        An item stack lying on the ground
+        x, y: Center in world pixels
+        stack: The ItemStack the player receives when picking it up
+        """
+        self.x = x
+        self.y = y
+        self.stack = stack
+
+    def get_bounds(self):
+        return (self.x - self.size / 2, self.y - self.size / 2, self.size, self.size)
+
+    def release(self):
+        """Called when the pickup is removed from the world; it holds nothing to free"""
+
+    def interact(self, player):
+        """Move the stack into the player's inventory"""
+        return player.pick_up(self)
+
+    def draw(self, screen, camera_x=0, camera_y=0):
+        center = (int(self.x - camera_x), int(self.y - camera_y))
+        icons = load_icon_atlas()
+        icon_name = f"item/{self.stack.item_type.id}"
+        if icons is not None and icon_name in icons:
+            icon = icons.get(icon_name)
+            screen.blit(icon, icon.get_rect(center=center))
+        else:
+            pygame.draw.circle(screen, (255, 215, 0), center, self.size // 2)
@@ -0,0 +1,212 @@
+import heapq
+import numpy as np
+from game.items import CATEGORIES, Items, ItemStack
+
+class Inventory:
+    def __init__(self, size=24):
+        """
+        Fixed number of slots, each empty (None) or holding one ItemStack
+        Keeps an index of item -> slots and item -> total quantity so
+        finding and counting items doesn't scan the slots
+        """
+        self.slots = [None] * size
+        self.index = {}    # item index -> set of slot numbers holding it
+        self.partial = {}  # item index -> set of slot numbers with room left
+        self.totals = {}   # item index -> total quantity
+        
+        # Empty slots, as a set plus a min-heap that may hold stale entries
+        self.free = set(range(size))
+        self.free_heap = list(range(size))
+        
+        # Bumped on every change, so the UI can tell when to redraw
+        self.version = 0
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __iter__(self):
+        """Iterate over the stacks in slot order, skipping empty slots"""
+        return (stack for stack in self.slots if stack is not None)
+
+    def first_free(self):
+        """Lowest empty slot, or None if the inventory is full"""
+        while self.free_heap and self.free_heap[0] not in self.free:
+            heapq.heappop(self.free_heap)
+        return self.free_heap[0] if self.free_heap else None
+
+    def changed(self, slot, delta):
+        """Update the index after a slot's quantity changed by delta"""
+        stack = self.slots[slot]
+        item_id = stack.item_index
+        self.totals[item_id] += delta
+        if stack.quantity < Items.registry.max_stack[item_id]:
+            self.partial[item_id].add(slot)
+        else:
+            self.partial[item_id].discard(slot)
+        self.version += 1
+
+    def put(self, slot, stack):
+        """Place a stack in an empty slot"""
+        item_id = stack.item_index
+        self.slots[slot] = stack
+        self.free.discard(slot)
+        if item_id not in self.index:
+            self.index[item_id] = set()
+            self.partial[item_id] = set()
+            self.totals[item_id] = 0
+        self.index[item_id].add(slot)
+        self.changed(slot, stack.quantity)
+
+    def clear(self, slot):
+        """Empty a slot and return the stack it held"""
+        stack = self.slots[slot]
+        if stack is None:
+            return None
+        item_id = stack.item_index
+        self.slots[slot] = None
+        self.index[item_id].discard(slot)
+        self.partial[item_id].discard(slot)
+        self.totals[item_id] -= stack.quantity
+        if not self.index[item_id]:
+            del self.index[item_id], self.partial[item_id], self.totals[item_id]
+        self.free.add(slot)
+        heapq.heappush(self.free_heap, slot)
+        self.version += 1
+        return stack
+
+    def count(self, item_type):
+        return self.totals.get(item_type.index, 0)
+
+    def find(self, item_type):
+        """Lowest slot holding an item, or None"""
+        slots = self.index.get(item_type.index)
+        return min(slots) if slots else None
+
+    def find_first(self, category):
+        """Lowest slot holding an item of a category (one of items.CATEGORIES), or None"""
+        if not self.index:
+            return None
+        item_ids = np.fromiter(self.index, dtype=np.intp, count=len(self.index))
+        matching = item_ids[Items.registry.category[item_ids] == CATEGORIES.index(category)]
+        return min((min(self.index[item_id]) for item_id in matching.tolist()), default=None)
+
+    def add(self, item_type, quantity):
+        """
+        Add items, topping up existing stacks first, then filling empty slots
+        Returns how many didn't fit
+        """
+        max_stack = int(Items.registry.max_stack[item_type.index])
+        for slot in sorted(self.partial.get(item_type.index, ())):
+            if quantity <= 0:
+                break
+            before = quantity
+            quantity = self.slots[slot].add(quantity)
+            self.changed(slot, before - quantity)
+        
+        while quantity > 0:
+            slot = self.first_free()
+            if slot is None:
+                break
+            amount = min(quantity, max_stack)
+            self.put(slot, ItemStack(item_type, amount))
+            quantity -= amount
+        return quantity
+
+    def add_stack(self, stack):
+        """Add a stack's items, leaving whatever didn't fit in it; returns True if it all fit"""
+        stack.quantity = self.add(stack.item_type, stack.quantity)
+        return stack.quantity == 0
+
+    def remove(self, item_type, quantity):
+        """Remove up to quantity items, emptying the highest slots first; returns how many were removed"""
+        removed = 0
+        for slot in sorted(self.index.get(item_type.index, ()), reverse=True):
+            if removed >= quantity:
+                break
+            stack = self.slots[slot]
+            taken = min(stack.quantity, quantity - removed)
+            if taken == stack.quantity:
+                self.clear(slot)
+            else:
+                stack.remove(taken)
+                self.changed(slot, -taken)
+            removed += taken
+        return removed
+
+    def take(self, slot, quantity=None):
+        """Remove and return a stack of up to quantity items from a slot (all of them by default)"""
+        stack = self.slots[slot]
+        if stack is None:
+            return None
+        if quantity is None or quantity >= stack.quantity:
+            return self.clear(slot)
+        stack.remove(quantity)
+        self.changed(slot, -quantity)
+        return ItemStack(stack.item_type, quantity)
+
+    def move(self, source, target):
+        """Move a slot's stack onto another slot, merging matching items or swapping otherwise"""
+        if source == target or self.slots[source] is None:
+            return
+        moving = self.clear(source)
+        existing = self.slots[target]
+        if existing is not None and existing.item_index == moving.item_index:
+            before = moving.quantity
+            moving.quantity = existing.add(moving.quantity)
+            self.changed(target, before - moving.quantity)
+            if moving.quantity > 0:
+                self.put(source, moving)
+            return
+        if existing is not None:
+            self.put(source, self.clear(target))
+        self.put(target, moving)
+
+    def merge(self):
+        """Combine partial stacks of the same item into as few slots as possible"""
+        for item_id in list(self.index):
+            if len(self.partial[item_id]) < 2:
+                continue
+            slots = sorted(self.index[item_id])
+            item_type = Items.registry[item_id]
+            max_stack = int(Items.registry.max_stack[item_id])
+            total = self.totals[item_id]
+            for slot in slots:
+                self.clear(slot)
+            
+            # Refill the lowest of the slots the item already used
+            for slot in slots:
+                if total <= 0:
+                    break
+                amount = min(total, max_stack)
+                self.put(slot, ItemStack(item_type, amount))
+                total -= amount
+
+    def sort(self, key=None):
+        """
+        Merge stacks, then pack them into the first slots in order
+        key: Sort key for stacks (defaults to item order, largest stacks first)
+        """
+        self.merge()
+        stacks = [self.clear(slot) for slot, stack in enumerate(self.slots) if stack is not None]
+        stacks.sort(key=key or (lambda stack: (stack.item_index, -stack.quantity)))
+        for slot, stack in enumerate(stacks):
+            self.put(slot, stack)
+
+    def transfer_to(self, other, item_type=None):
+        """
+        Move every stack (or every stack of one item type) into another inventory
+        Whatever doesn't fit stays behind; returns the number of items moved
+        """
+        if item_type is None:
+            slots = [slot for slot, stack in enumerate(self.slots) if stack is not None]
+        else:
+            slots = sorted(self.index.get(item_type.index, ()))
+        
+        moved = 0
+        for slot in slots:
+            stack = self.clear(slot)
+            before = stack.quantity
+            if not other.add_stack(stack):
+                self.put(slot, stack)
+            moved += before - stack.quantity
+        return moved
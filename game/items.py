@@ -1,48 +1,138 @@
 import pygame
+import json
 import os
-from dataclasses import dataclass
+import numpy as np
+
+# Found next to the code rather than in the working directory
+ITEMS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "assets", "data", "items.json")
+
+# Item categories, stored by index in the registry's category column
+CATEGORIES = ['none', 'seed', 'produce']
 
-@dataclass
 class ItemType:
-    id: str
-    name: str
-    icon_path: str = None
-    max_stack: int = 99
-    
-    def __post_init__(self):
-        if self.icon_path and os.path.exists(self.icon_path):
-            self._icon = pygame.image.load(self.icon_path)
-        else:
-            self._icon = None
+    __slots__ = ('index', 'id', 'name', 'category', 'max_stack', 'icon_path', '_icon', '_icon_loaded')
+
+    def __init__(self, index, id, name, category='none', max_stack=99, icon_path=None):
+        """
+        One interned item definition; there is exactly one ItemType per item,
+        so item types can be compared by identity
+        index: Compact integer id assigned by the registry (0 means no item)
+        id: Stable string id, used in save files and icon names
+        """
+        self.index = index
+        self.id = id
+        self.name = name
+        self.category = category
+        self.max_stack = max_stack
+        self.icon_path = icon_path
+        
+        # Icons are loaded on first use rather than when the item is defined
+        self._icon = None
+        self._icon_loaded = False
     
     @property
     def icon(self):
+        if not self._icon_loaded:
+            self._icon_loaded = True
+            if self.icon_path and os.path.exists(self.icon_path):
+                self._icon = pygame.image.load(self.icon_path)
         return self._icon
 
-class Items:
-    # Seeds
-    CARROT_SEEDS = ItemType("carrot_seeds", "Carrot Seeds", max_stack=99)
-    TOMATO_SEEDS = ItemType("tomato_seeds", "Tomato Seeds", max_stack=99)
-    POTATO_SEEDS = ItemType("potato_seeds", "Potato Seeds", max_stack=99)
-    
-    # Produce
-    CARROT = ItemType("carrot", "Carrot", max_stack=99)
-    TOMATO = ItemType("tomato", "Tomato", max_stack=99)
-    POTATO = ItemType("potato", "Potato", max_stack=99)
-    
+    def __repr__(self):
+        return f"ItemType({self.index}, {self.id!r})"
+
+class ItemRegistry:
+    def __init__(self, definitions):
+        """
+        Every item type, indexed by compact integer id in definition order
+        definitions: List of dicts with id, name and optionally category,
+                     max_stack and icon_path
+        Properties are also kept as columnar arrays (index 0 is "no item") so
+        stacks and inventories can look them up by index
+        """
+        self.types = [None]
+        self.by_id = {}
+        for index, definition in enumerate(definitions, start=1):
+            item_type = ItemType(index, **definition)
+            if item_type.id in self.by_id:
+                raise ValueError(f"Duplicate item id {item_type.id!r}")
+            if item_type.category not in CATEGORIES:
+                raise ValueError(f"Unknown category {item_type.category!r} for item {item_type.id!r}")
+            self.types.append(item_type)
+            self.by_id[item_type.id] = item_type
+        
+        self.max_stack = np.array([0] + [t.max_stack for t in self.types[1:]], dtype=np.int32)
+        self.category = np.array([0] + [CATEGORIES.index(t.category) for t in self.types[1:]],
+                                 dtype=np.uint8)
+
+    @classmethod
+    def load(cls, path=ITEMS_PATH):
+        with open(path) as f:
+            return cls(json.load(f)['items'])
+
+    def __len__(self):
+        return len(self.types) - 1
+
+    def __iter__(self):
+        return iter(self.types[1:])
+
+    def __getitem__(self, index):
+        return self.types[index]
+
+    def get(self, item_id):
+        """Look up an item type by its string id, or return None"""
+        return self.by_id.get(item_id)
+
+class ItemsMeta(type):
+    def __getattr__(cls, name):
+        """
+        Load the registry the first time Items is used rather than at import,
+        and resolve item attributes such as Items.CARROT_SEEDS from it
+        """
+        if name == 'registry':
+            cls.registry = ItemRegistry.load()
+            return cls.registry
+        item_type = cls.registry.get(name.lower()) if name.isupper() else None
+        if item_type is None:
+            raise AttributeError(f"type object 'Items' has no attribute {name!r}")
+        setattr(cls, name, item_type)
+        return item_type
+
+class Items(metaclass=ItemsMeta):
     @classmethod
     def get_all_items(cls):
-        return [value for name, value in vars(cls).items() 
-                if isinstance(value, ItemType)]
+        return list(cls.registry)
+
+    @classmethod
+    def get(cls, item_id):
+        """Look up an item type by its id, or return None"""
+        return cls.registry.get(item_id)
 
-@dataclass
 class ItemStack:
-    item_type: ItemType
-    quantity: int = 1
+    __slots__ = ('item_index', 'quantity')
+
+    def __init__(self, item_type, quantity=1):
+        self.item_index = item_type.index
+        self.quantity = quantity
+    
+    @property
+    def item_type(self):
+        return Items.registry.types[self.item_index]
+    
+    def __eq__(self, other):
+        if not isinstance(other, ItemStack):
+            return NotImplemented
+        return self.item_index == other.item_index and self.quantity == other.quantity
+    
+    def __repr__(self):
+        return f"ItemStack({self.item_type.id!r}, {self.quantity})"
     
     def add(self, amount):
-        self.quantity = min(self.quantity + amount, self.item_type.max_stack)
-        return self.quantity
+        """Add up to max_stack items, returning how many didn't fit"""
+        added = min(amount, int(Items.registry.max_stack[self.item_index]) - self.quantity)
+        self.quantity += added
+        return amount - added
     
     def remove(self, amount):
         if amount >= self.quantity:
@@ -50,4 +140,4 @@ class ItemStack:
             self.quantity = 0
             return removed
         self.quantity -= amount
-        return amount 
\ No newline at end of file
+        return amount 
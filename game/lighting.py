@@ -0,0 +1,192 @@
+import pygame
+import numpy as np
+from game.chunks import CHUNK_SIZE, chunk_key
+from game.clock import MINUTES_PER_DAY
+
+# Ambient light through the day as (minutes since midnight, RGB multiplier)
+DAYLIGHT_KEYFRAMES = [
+    (0, (40, 45, 90)),
+    (5 * 60, (40, 45, 90)),
+    (7 * 60, (255, 215, 190)),
+    (9 * 60, (255, 255, 255)),
+    (17 * 60, (255, 255, 255)),
+    (19 * 60, (255, 170, 120)),
+    (21 * 60, (40, 45, 90)),
+    (24 * 60, (40, 45, 90)),
+]
+
+# Minutes covered by each entry of the precomputed ramp
+RAMP_STEP = 10
+
+def build_ramp(keyframes=DAYLIGHT_KEYFRAMES, step=RAMP_STEP):
+    """Interpolate the keyframes into a (MINUTES_PER_DAY // step, 3) uint8 color ramp"""
+    minutes = np.arange(0, MINUTES_PER_DAY, step)
+    times = [time for time, _ in keyframes]
+    colors = np.array([color for _, color in keyframes], dtype=np.float64)
+    ramp = np.stack([np.interp(minutes, times, colors[:, channel]) for channel in range(3)], axis=1)
+    return ramp.round().astype(np.uint8)
+
+DAYLIGHT_RAMP = build_ramp()
+
+class LightSource:
+    __slots__ = ('x', 'y', 'radius', 'color', 'intensity')
+
+    def __init__(self, x, y, radius, color, intensity):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.color = color
+        self.intensity = intensity
+
+    def chunk_keys(self):
+        """Keys of the chunks this light reaches"""
+        first_x, first_y = chunk_key(int(self.x - self.radius), int(self.y - self.radius))
+        last_x, last_y = chunk_key(int(self.x + self.radius), int(self.y + self.radius))
+        return [(chunk_x, chunk_y)
+                for chunk_y in range(first_y, last_y + 1)
+                for chunk_x in range(first_x, last_x + 1)]
+
+class Lighting:
+    def __init__(self, tile_size):
+        """
+        Day/night tint plus point lights, applied to the scene as one multiply blit
+        Light from sources is computed per tile with NumPy and cached per chunk;
+        the screen overlay is rebuilt only when the view moves to another tile,
+        the ambient color changes, or a light changes
+        """
+        self.tile_size = tile_size
+        self.sources = []
+        self.chunk_sources = {}  # (chunk_x, chunk_y) -> lights reaching that chunk
+        self._light_maps = {}    # (chunk_x, chunk_y) -> (CHUNK_SIZE, CHUNK_SIZE, 3) float32
+        self._overlay = None
+        self._overlay_key = None
+        self._flat = None
+        self._flat_color = None
+        self.version = 0
+
+    def add_light(self, grid_x, grid_y, radius=4.0, color=(255, 200, 130), intensity=1.0):
+        """
+        Add a point light centred on a tile
+        radius: Distance in tiles at which the light fades out completely
+        """
+        source = LightSource(grid_x + 0.5, grid_y + 0.5, radius, color, intensity)
+        self.sources.append(source)
+        for key in source.chunk_keys():
+            self.chunk_sources.setdefault(key, []).append(source)
+            self._light_maps.pop(key, None)
+        self.version += 1
+        return source
+
+    def remove_light(self, source):
+        self.sources.remove(source)
+        for key in source.chunk_keys():
+            self.chunk_sources[key].remove(source)
+            if not self.chunk_sources[key]:
+                del self.chunk_sources[key]
+            self._light_maps.pop(key, None)
+        self.version += 1
+
+    def light_map(self, key):
+        """Light added to each tile of a chunk by nearby sources (0-255 per channel)"""
+        light = self._light_maps.get(key)
+        if light is None:
+            light = np.zeros((CHUNK_SIZE, CHUNK_SIZE, 3), dtype=np.float32)
+            ys, xs = np.mgrid[0:CHUNK_SIZE, 0:CHUNK_SIZE].astype(np.float32) + 0.5
+            xs += key[0] * CHUNK_SIZE
+            ys += key[1] * CHUNK_SIZE
+            for source in self.chunk_sources.get(key, ()):
+                distance = np.hypot(xs - source.x, ys - source.y)
+                falloff = np.clip(1.0 - distance / source.radius, 0.0, 1.0) * source.intensity
+                light += falloff[:, :, None] * np.asarray(source.color, dtype=np.float32)
+            self._light_maps[key] = light
+        return light
+
+    def ambient(self, time_of_day):
+        return DAYLIGHT_RAMP[int(time_of_day // RAMP_STEP) % len(DAYLIGHT_RAMP)]
+
+    def state(self, camera_x, camera_y, time_of_day):
+        """Everything the overlay depends on; None in full daylight, when nothing is drawn"""
+        ambient = self.ambient(time_of_day)
+        if ambient.min() == 255:
+            return None
+        return (tuple(ambient.tolist()), int(camera_x // self.tile_size), int(camera_y // self.tile_size),
+                self.version)
+
+    def lights_in_view(self, first_x, first_y, tiles_wide, tiles_high):
+        if not self.chunk_sources:
+            return False
+        return any((chunk_x, chunk_y) in self.chunk_sources
+                   for chunk_y in range(first_y // CHUNK_SIZE, (first_y + tiles_high - 1) // CHUNK_SIZE + 1)
+                   for chunk_x in range(first_x // CHUNK_SIZE, (first_x + tiles_wide - 1) // CHUNK_SIZE + 1))
+
+    def build_overlay(self, first_x, first_y, tiles_wide, tiles_high, ambient):
+        """Render the multiply overlay for a block of tiles"""
+        # Tile-resolution light levels, indexed [x, y] like surfarray
+        light = np.zeros((tiles_wide, tiles_high, 3), dtype=np.float32)
+        for chunk_y in range(first_y // CHUNK_SIZE, (first_y + tiles_high - 1) // CHUNK_SIZE + 1):
+            for chunk_x in range(first_x // CHUNK_SIZE, (first_x + tiles_wide - 1) // CHUNK_SIZE + 1):
+                if (chunk_x, chunk_y) not in self.chunk_sources:
+                    continue
+                chunk = self.light_map((chunk_x, chunk_y))
+                
+                # Overlap between this chunk and the tile block
+                left = max(first_x, chunk_x * CHUNK_SIZE)
+                top = max(first_y, chunk_y * CHUNK_SIZE)
+                right = min(first_x + tiles_wide, (chunk_x + 1) * CHUNK_SIZE)
+                bottom = min(first_y + tiles_high, (chunk_y + 1) * CHUNK_SIZE)
+                light[left - first_x:right - first_x, top - first_y:bottom - first_y] += chunk[
+                    top - chunk_y * CHUNK_SIZE:bottom - chunk_y * CHUNK_SIZE,
+                    left - chunk_x * CHUNK_SIZE:right - chunk_x * CHUNK_SIZE].transpose(1, 0, 2)
+        
+        # Lights brighten towards full white, more so the darker it is
+        ambient = ambient.astype(np.float32)
+        levels = np.clip(ambient + light * (1.0 - ambient / 255.0), 0, 255).astype(np.uint8)
+        
+        # Scale up smoothly so light fades across tiles instead of in blocks
+        small = pygame.surfarray.make_surface(levels)
+        return pygame.transform.smoothscale(small, (tiles_wide * self.tile_size, tiles_high * self.tile_size))
+
+    def draw(self, screen, camera_x, camera_y, time_of_day, rects=None):
+        """
+        Tint everything drawn so far with a BLEND_MULT blit
+        rects: Screen rects to tint (default: the whole screen)
+        """
+        if rects is None:
+            rects = [screen.get_rect()]
+        key = self.state(camera_x, camera_y, time_of_day)
+        if key is None:
+            return
+        
+        view_width, view_height = screen.get_size()
+        first_x = int(camera_x // self.tile_size)
+        first_y = int(camera_y // self.tile_size)
+        tiles_wide = view_width // self.tile_size + 2
+        tiles_high = view_height // self.tile_size + 2
+        
+        # With no lights in view the tint is one flat color (a multiply blit
+        # is much faster than a multiply fill)
+        if not self.lights_in_view(first_x, first_y, tiles_wide, tiles_high):
+            ambient = tuple(self.ambient(time_of_day))
+            if self._flat is None or self._flat.get_size() != (view_width, view_height):
+                self._flat = pygame.Surface((view_width, view_height))
+                self._flat_color = None
+            if self._flat_color != ambient:
+                self._flat.fill(ambient)
+                self._flat_color = ambient
+            screen.blits([(self._flat, rect, rect, pygame.BLEND_MULT) for rect in rects],
+                         doreturn=False)
+            return
+        
+        if key != self._overlay_key:
+            self._overlay = self.build_overlay(first_x, first_y, tiles_wide, tiles_high,
+                                               self.ambient(time_of_day))
+            self._overlay_key = key
+        
+        overlay_rect = self._overlay.get_rect(topleft=(first_x * self.tile_size - camera_x,
+                                                       first_y * self.tile_size - camera_y))
+        blits = []
+        for rect in rects:
+            part = overlay_rect.clip(rect)
+            blits.append((self._overlay, part, part.move(-overlay_rect.x, -overlay_rect.y),
+                          pygame.BLEND_MULT))
+        screen.blits(blits, doreturn=False)
@@ -0,0 +1,203 @@
+import numpy as np
+from game.chunks import CHUNK_SIZE, chunk_key
+
+# Moisture is 0.0 (dry) to 1.0 (just watered); soil shows as watered from WET_LEVEL up
+WET_LEVEL = 0.5
+
+# Fraction of moisture lost to evaporation each day
+EVAPORATION = 0.6
+
+# Fraction of the difference to each soil neighbor that flows across per day (<= 0.25)
+DIFFUSION = 0.1
+
+# (dy, dx) of the four neighbors moisture spreads to
+NEIGHBORS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# Levels below this are treated as bone dry
+DRY_LEVEL = 1e-4
+
+# Moisture rain adds to every soil tile
+RAIN_AMOUNT = 0.8
+
+# Days after which moisture from before has evaporated below float32 resolution
+MEMORY_DAYS = int(np.ceil(np.log(1e-8) / np.log(1.0 - EVAPORATION)))
+
+class MoistureField:
+    def __init__(self):
+        """
+        Soil moisture stored as parallel arrays aligned with the world's chunks
+        Each array has shape (chunks, CHUNK_SIZE, CHUNK_SIZE); a chunk only gets
+        a slot once it contains tilled soil, and only soil tiles hold moisture
+        """
+        self.slots = {}  # (chunk_x, chunk_y) -> index into the arrays
+        self.keys = []   # index -> (chunk_x, chunk_y)
+        self._neighbors = None
+        self._links = None
+        self.allocate(0)
+
+    def allocate(self, capacity):
+        """Resize the moisture arrays to hold capacity chunks"""
+        shape = (capacity, CHUNK_SIZE, CHUNK_SIZE)
+        arrays = {
+            'level': np.zeros(shape, dtype=np.float32),
+            'soil': np.zeros(shape, dtype=bool),
+        }
+        count = len(self.keys)
+        for name, array in arrays.items():
+            if count:
+                array[:count] = getattr(self, name)[:count]
+            setattr(self, name, array)
+
+    def restore(self, keys, arrays):
+        """Replace all moisture state with previously saved chunks"""
+        self.keys = [tuple(key) for key in np.asarray(keys).tolist()]
+        self.slots = {key: slot for slot, key in enumerate(self.keys)}
+        self._neighbors = None
+        self._links = None
+        for name, array in arrays.items():
+            setattr(self, name, array)
+
+    def locate(self, grid_x, grid_y, create=False):
+        """Return (slot, local_y, local_x) for a tile, or None if its chunk has no slot"""
+        key = chunk_key(grid_x, grid_y)
+        slot = self.slots.get(key)
+        if slot is None:
+            if not create:
+                return None
+            slot = len(self.keys)
+            if slot == len(self.level):
+                self.allocate(max(4, slot * 2))
+            self.slots[key] = slot
+            self.keys.append(key)
+            self._neighbors = None
+            self._links = None
+        return slot, grid_y % CHUNK_SIZE, grid_x % CHUNK_SIZE
+
+    def set_soil(self, grid_x, grid_y, is_soil):
+        """Mark whether a tile can hold moisture (soil that stops being soil dries instantly)"""
+        cell = self.locate(grid_x, grid_y, create=is_soil)
+        if cell is None:
+            return
+        if self.soil[cell] != is_soil:
+            self.soil[cell] = is_soil
+            self._links = None
+        if not is_soil:
+            self.level[cell] = 0.0
+
+    def water(self, grid_x, grid_y, amount=1.0):
+        cell = self.locate(grid_x, grid_y)
+        if cell is None or not self.soil[cell]:
+            return False
+        self.level[cell] = min(1.0, self.level[cell] + amount)
+        return True
+
+    def get(self, grid_x, grid_y):
+        cell = self.locate(grid_x, grid_y)
+        return 0.0 if cell is None else float(self.level[cell])
+
+    def wet_chunk(self, key):
+        """Bool array of the tiles in a chunk wet enough to show as watered, or None"""
+        slot = self.slots.get(key)
+        if slot is None:
+            return None
+        return self.level[slot] >= WET_LEVEL
+
+    def wet_chunks(self, keys):
+        """Stack of wet masks, one per key (all False for chunks without moisture)"""
+        return self.gather(self.level[:len(self.keys)] >= WET_LEVEL, keys)
+
+    def soil_chunks(self, keys):
+        """Stack of soil masks, one per key (all False for chunks without moisture)"""
+        return self.gather(self.soil[:len(self.keys)], keys)
+
+    def gather(self, masks, keys):
+        """Pick the per-chunk masks for keys, padding chunks without a slot with False"""
+        count = len(self.keys)
+        slots = np.array([self.slots.get(key, count) for key in keys], dtype=np.intp)
+        masks = np.concatenate([masks, np.zeros((1, CHUNK_SIZE, CHUNK_SIZE), dtype=bool)])
+        return masks[slots]
+
+    def neighbor_slots(self):
+        """For each direction, the slot of every chunk's neighbor (len(keys) where missing)"""
+        if self._neighbors is None:
+            count = len(self.keys)
+            self._neighbors = [
+                np.array([self.slots.get((x + dx, y + dy), count) for x, y in self.keys], dtype=np.intp)
+                for dy, dx in NEIGHBORS
+            ]
+        return self._neighbors
+
+    def with_halo(self, array):
+        """
+        Pad each chunk with a one-tile border copied from its neighbor chunks
+        array: Shape (count, CHUNK_SIZE, CHUNK_SIZE); missing neighbors read as zero
+        """
+        count = len(self.keys)
+        extended = np.concatenate([array, np.zeros((1, CHUNK_SIZE, CHUNK_SIZE), dtype=array.dtype)])
+        up, down, left, right = self.neighbor_slots()
+        padded = np.zeros((count, CHUNK_SIZE + 2, CHUNK_SIZE + 2), dtype=array.dtype)
+        padded[:, 1:-1, 1:-1] = array
+        padded[:, 0, 1:-1] = extended[up][:, -1, :]
+        padded[:, -1, 1:-1] = extended[down][:, 0, :]
+        padded[:, 1:-1, 0] = extended[left][:, :, -1]
+        padded[:, 1:-1, -1] = extended[right][:, :, 0]
+        return padded
+
+    def links(self):
+        """For each direction, 1.0 where both a tile and that neighbor are soil"""
+        if self._links is None:
+            count = len(self.keys)
+            soil = self.soil[:count]
+            padded_soil = self.with_halo(soil)
+            self._links = [(soil & padded_soil[self.window(dy, dx)]).astype(np.float32)
+                           for dy, dx in NEIGHBORS]
+        return self._links
+
+    @staticmethod
+    def window(dy, dx):
+        """Slice of a haloed array lining each tile up with its (dy, dx) neighbor"""
+        return (slice(None), slice(1 + dy, CHUNK_SIZE + 1 + dy), slice(1 + dx, CHUNK_SIZE + 1 + dx))
+
+    def step(self):
+        """
+        Advance all soil moisture by one day in a single vectorized pass:
+        moisture spreads between neighboring soil tiles (a 5-point stencil
+        convolution, across chunk borders too), then evaporates
+        """
+        count = len(self.keys)
+        if not count:
+            return
+        level = self.level[:count]
+        if level.max() < DRY_LEVEL:
+            level[:] = 0.0
+            return
+        
+        padded_level = self.with_halo(level)
+        flow = np.zeros_like(level)
+        for (dy, dx), link in zip(NEIGHBORS, self.links()):
+            flow += link * (padded_level[self.window(dy, dx)] - level)
+        
+        level += DIFFUSION * flow
+        level *= 1.0 - EVAPORATION
+
+    def advance(self, rain):
+        """
+        Step moisture through several days, raining after each day where rain is True
+        Moisture shrinks by at least EVAPORATION a day, so only the last
+        MEMORY_DAYS days of a longer span can still show and the ones before
+        them are skipped, starting from dry soil
+        """
+        if len(rain) > MEMORY_DAYS:
+            self.level[:len(self.keys)] = 0.0
+            rain = rain[-MEMORY_DAYS:]
+        for raining in rain:
+            self.step()
+            if raining:
+                self.rain(RAIN_AMOUNT)
+
+    def rain(self, amount=RAIN_AMOUNT):
+        """Add moisture to every soil tile"""
+        count = len(self.keys)
+        level = self.level[:count]
+        level += amount * self.soil[:count]
+        np.minimum(level, 1.0, out=level)
@@ -0,0 +1,197 @@
+import heapq
+from collections import OrderedDict
+import numpy as np
+
+# 4-connected moves: (dx, dy)
+NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+def manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+class FlowField:
+    def __init__(self, target, radius, walkable, origin):
+        """
+        Distance and direction toward a target for every tile in a square region
+        target: Goal tile (grid_x, grid_y)
+        radius: Region half-size in tiles
+        walkable: Bool array (height, width) for the region
+        origin: Tile coordinate of the region's top left corner
+        """
+        self.target = target
+        self.radius = radius
+        self.origin = origin
+        self.walkable = walkable
+        self.distance, self.step_x, self.step_y = self.compute()
+
+    def compute(self):
+        height, width = self.walkable.shape
+        unreachable = np.iinfo(np.int32).max
+        distance = np.full((height, width), unreachable, dtype=np.int32)
+        
+        local_x = self.target[0] - self.origin[0]
+        local_y = self.target[1] - self.origin[1]
+        frontier = np.zeros((height, width), dtype=bool)
+        if 0 <= local_x < width and 0 <= local_y < height and self.walkable[local_y, local_x]:
+            frontier[local_y, local_x] = True
+        
+        # Breadth-first wavefront, one whole-array step per distance ring
+        level = 0
+        while frontier.any():
+            distance[frontier] = level
+            grown = np.zeros_like(frontier)
+            grown[1:, :] |= frontier[:-1, :]
+            grown[:-1, :] |= frontier[1:, :]
+            grown[:, 1:] |= frontier[:, :-1]
+            grown[:, :-1] |= frontier[:, 1:]
+            frontier = grown & self.walkable & (distance == unreachable)
+            level += 1
+        
+        # Each tile points at its lowest-distance neighbor
+        padded = np.pad(distance, 1, constant_values=unreachable)
+        candidates = np.stack([padded[1:-1, 2:], padded[1:-1, :-2],
+                               padded[2:, 1:-1], padded[:-2, 1:-1]])
+        best = candidates.argmin(axis=0)
+        moves = np.array(NEIGHBORS, dtype=np.int8)
+        step_x = moves[best, 0]
+        step_y = moves[best, 1]
+        
+        # The target and unreachable tiles don't move
+        still = (distance == 0) | (distance == unreachable)
+        step_x[still] = 0
+        step_y[still] = 0
+        return distance, step_x, step_y
+
+    def contains(self, grid_x, grid_y):
+        height, width = self.walkable.shape
+        return (0 <= grid_x - self.origin[0] < width and
+                0 <= grid_y - self.origin[1] < height)
+
+    def directions(self, grid_x, grid_y):
+        """
+        Vectorized lookup of the step (dx, dy) toward the target
+        grid_x, grid_y: Arrays of tile coordinates (tiles outside the region get (0, 0))
+        """
+        height, width = self.walkable.shape
+        local_x = np.asarray(grid_x) - self.origin[0]
+        local_y = np.asarray(grid_y) - self.origin[1]
+        inside = (local_x >= 0) & (local_x < width) & (local_y >= 0) & (local_y < height)
+        local_x = np.where(inside, local_x, 0)
+        local_y = np.where(inside, local_y, 0)
+        return (np.where(inside, self.step_x[local_y, local_x], 0),
+                np.where(inside, self.step_y[local_y, local_x], 0))
+
+    def direction(self, grid_x, grid_y):
+        step_x, step_y = self.directions(grid_x, grid_y)
+        return int(step_x), int(step_y)
+
+class Pathfinder:
+    def __init__(self, collision, max_paths=256, max_flow_fields=32):
+        """
+        Cached A* paths and flow fields over a world's walkability mask
+        collision: The world's WalkabilityMask
+        max_paths, max_flow_fields: Number of paths / flow fields kept before
+                                    the least recently used is dropped
+        """
+        self.collision = collision
+        self.max_paths = max_paths
+        self.max_flow_fields = max_flow_fields
+        self.paths = OrderedDict()        # (start, goal) -> list of tiles, or None if unreachable
+        self.path_tiles = {}              # tile -> set of (start, goal) whose path uses it
+        self.flow_fields = OrderedDict()  # (target, radius) -> FlowField
+
+    def find_path(self, start, goal, max_nodes=20000):
+        """
+        Shortest 4-connected path of tiles from start to goal (both included)
+        Returns None if the goal can't be reached within max_nodes expansions
+        """
+        key = (tuple(start), tuple(goal))
+        if key in self.paths:
+            self.paths.move_to_end(key)
+            return self.paths[key]
+        
+        path = self.search(key[0], key[1], max_nodes)
+        self.paths[key] = path
+        if path is not None:
+            for tile in path:
+                self.path_tiles.setdefault(tile, set()).add(key)
+        if len(self.paths) > self.max_paths:
+            self.forget_path(next(iter(self.paths)))
+        return path
+
+    def search(self, start, goal, max_nodes):
+        is_walkable = self.collision.is_walkable
+        if not (is_walkable(*start) and is_walkable(*goal)):
+            return None
+        
+        open_heap = [(manhattan(start, goal), 0, start)]
+        came_from = {start: None}
+        cost = {start: 0}
+        expanded = 0
+        while open_heap and expanded < max_nodes:
+            _, g, node = heapq.heappop(open_heap)
+            if node == goal:
+                # Walk back to the start
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = came_from[node]
+                return path[::-1]
+            if g > cost[node]:
+                continue  # Stale heap entry
+            expanded += 1
+            
+            for dx, dy in NEIGHBORS:
+                neighbor = (node[0] + dx, node[1] + dy)
+                new_cost = g + 1
+                if new_cost < cost.get(neighbor, new_cost + 1) and is_walkable(*neighbor):
+                    cost[neighbor] = new_cost
+                    came_from[neighbor] = node
+                    heapq.heappush(open_heap, (new_cost + manhattan(neighbor, goal), new_cost, neighbor))
+        return None
+
+    def forget_path(self, key):
+        path = self.paths.pop(key, None)
+        for tile in path or ():
+            users = self.path_tiles.get(tile)
+            if users is not None:
+                users.discard(key)
+                if not users:
+                    del self.path_tiles[tile]
+
+    def flow_field(self, target, radius=32):
+        """Flow field toward target covering every tile within radius of it"""
+        key = (tuple(target), radius)
+        field = self.flow_fields.get(key)
+        if field is not None:
+            self.flow_fields.move_to_end(key)
+            return field
+        
+        origin = (target[0] - radius, target[1] - radius)
+        size = radius * 2 + 1
+        ys, xs = np.mgrid[origin[1]:origin[1] + size, origin[0]:origin[0] + size]
+        field = FlowField(key[0], radius, self.collision.gather(xs, ys), origin)
+        self.flow_fields[key] = field
+        if len(self.flow_fields) > self.max_flow_fields:
+            self.flow_fields.popitem(last=False)
+        return field
+
+    def on_tile_changed(self, grid_x, grid_y, walkable):
+        """
+        Drop only the cached results a walkability change can affect
+        walkable: Whether the tile is walkable now
+        """
+        tile = (grid_x, grid_y)
+        if walkable:
+            # A new opening can only help paths it could shorten, and any failed search
+            for key, path in list(self.paths.items()):
+                start, goal = key
+                if path is None or manhattan(start, tile) + manhattan(tile, goal) < len(path) - 1:
+                    self.forget_path(key)
+        else:
+            # A new obstacle only breaks the paths that go through it
+            for key in list(self.path_tiles.get(tile, ())):
+                self.forget_path(key)
+        
+        stale = [key for key, field in self.flow_fields.items() if field.contains(grid_x, grid_y)]
+        for key in stale:
+            del self.flow_fields[key]
@@ -1,16 +1,28 @@
 import pygame
-from game.items import Items, ItemStack
+from game.items import Items
 from game.ui import Tool
 from game.sprites import CharacterSprite
+from game.clock import lerp
+from game.entities import Pickup
+from game.inventory import Inventory
 
 class Player:
     def __init__(self, x, y, world):
         self.x = x
         self.y = y
+        
+        # Position at the start of the last tick, for render interpolation
+        self.prev_x = x
+        self.prev_y = y
         self.world = world
         self.speed = 200  # pixels per second
+        self.pickup_radius = 24  # pixels
+        
+        # Hitbox around the player's feet, in pixels
+        self.width = 20
+        self.height = 16
         self.selected_tool = Tool.HOE
-        self.inventory = []
+        self.inventory = Inventory()
         self.facing = 'down'  # can be 'up', 'down', 'left', 'right'
         
         # Initialize sprite
@@ -18,31 +30,42 @@ class Player:
         self.last_movement = pygame.time.get_ticks()
         self.is_moving = False
         self.is_using_tool = False
-        self.tool_start_time = 0
+        self.tool_time_left = 0
         self.tool_duration = 600  # milliseconds for tool animation
         
         # Add some starting items
-        self.inventory.append(ItemStack(Items.CARROT_SEEDS, 5))
-        self.inventory.append(ItemStack(Items.TOMATO_SEEDS, 5))
-        self.inventory.append(ItemStack(Items.POTATO_SEEDS, 5))
+        self.inventory.add(Items.CARROT_SEEDS, 5)
+        self.inventory.add(Items.TOMATO_SEEDS, 5)
+        self.inventory.add(Items.POTATO_SEEDS, 5)
+        
+        self.world.entities.insert(self, self.get_bounds())
+
+    def release(self):
+        """Free the sprite's animator slot once the player is removed from the world"""
+        self.sprite.release()
+
+    def get_bounds(self):
+        """Hitbox as (x, y, width, height) in world pixels"""
+        return (self.x - self.width / 2, self.y - self.height / 2, self.width, self.height)
 
     def update(self, dt, keys):
-        current_time = pygame.time.get_ticks()
+        self.prev_x = self.x
+        self.prev_y = self.y
         
         # Only allow movement if not using a tool
         if not self.is_using_tool:
             # Handle movement
             dx = dy = 0
-            if keys[pygame.K_w]:
+            if keys[pygame.K_w] or keys[pygame.K_UP]:
                 dy = -1
                 self.facing = 'up'
-            if keys[pygame.K_s]:
+            if keys[pygame.K_s] or keys[pygame.K_DOWN]:
                 dy = 1
                 self.facing = 'down'
-            if keys[pygame.K_a]:
+            if keys[pygame.K_a] or keys[pygame.K_LEFT]:
                 dx = -1
                 self.facing = 'left'
-            if keys[pygame.K_d]:
+            if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
                 dx = 1
                 self.facing = 'right'
 
@@ -51,18 +74,20 @@ class Player:
                 dx *= 0.7071
                 dy *= 0.7071
 
-            # Calculate new position
-            new_x = self.x + dx * self.speed * dt / 1000
-            new_y = self.y + dy * self.speed * dt / 1000
-
-            # Get grid coordinates for new position
-            grid_x = int(new_x / self.world.tile_size)
-            grid_y = int(new_y / self.world.tile_size)
-
-            # Check if new position is walkable
-            if self.world.is_walkable(grid_x, grid_y):
-                self.x = new_x
-                self.y = new_y
+            # Move the hitbox, sliding along anything unwalkable
+            if dx != 0 or dy != 0:
+                left, top, width, height = self.get_bounds()
+                left, top = self.world.collision.move_box(
+                    left, top, width, height,
+                    dx * self.speed * dt / 1000, dy * self.speed * dt / 1000)
+                self.x = left + width / 2
+                self.y = top + height / 2
+                self.world.entities.move(self, self.get_bounds())
+            
+            # Collect anything lying close by
+            for entity in self.world.entities.query_radius(self.x, self.y, self.pickup_radius):
+                if isinstance(entity, Pickup):
+                    self.pick_up(entity)
                 
             # Update sprite state based on movement
             self.is_moving = dx != 0 or dy != 0
@@ -73,10 +98,22 @@ class Player:
         
         # Update tool animation
         if self.is_using_tool:
-            if current_time - self.tool_start_time >= self.tool_duration:
+            self.tool_time_left -= dt
+            if self.tool_time_left <= 0:
                 self.is_using_tool = False
                 self.sprite.set_state('idle', self.facing)
 
+    def pick_up(self, pickup):
+        """
+        Move a pickup's stack into the inventory, removing it from the world
+        once all of it fits; returns False if nothing could be picked up
+        """
+        before = pickup.stack.quantity
+        if self.inventory.add_stack(pickup.stack):
+            self.world.remove_entity(pickup)
+            return True
+        return pickup.stack.quantity < before
+
     def get_target_tile(self):
         # Get the tile in front of the player based on facing direction
         grid_x = int(self.x / self.world.tile_size)
@@ -102,6 +139,11 @@ class Player:
         
         if tile is None:
             return False
+        
+        # Things standing on the tile take priority over the tile itself
+        for entity in self.world.entities_in_tile(grid_x, grid_y):
+            if entity is not self and hasattr(entity, 'interact') and entity.interact(self):
+                return True
             
         tool_used = False
         if self.selected_tool == Tool.HOE:
@@ -114,44 +156,46 @@ class Player:
                 
         elif self.selected_tool == Tool.SEED:
             # Find seeds in inventory
-            for item in self.inventory:
-                if "_SEEDS" in item.item_type.id:
-                    if item.quantity > 0 and self.world.plant_seed(grid_x, grid_y, item.item_type):
-                        item.remove(1)
-                        tool_used = True
-                    break
+            slot = self.inventory.find_first('seed')
+            if slot is not None:
+                item_type = self.inventory.slots[slot].item_type
+                if self.world.plant_seed(grid_x, grid_y, item_type):
+                    self.inventory.take(slot, 1)
+                    tool_used = True
                     
         elif self.selected_tool == Tool.HARVEST:
             harvested = self.world.harvest_plant(grid_x, grid_y)
             if harvested:
-                # Convert seed type to produce type
-                produce_id = harvested.item_type.id.replace("_SEEDS", "")
-                produce_type = getattr(Items, produce_id)
-                
-                # Find existing stack or create new one
-                for item in self.inventory:
-                    if item.item_type == produce_type:
-                        item.add(1)
-                        break
-                else:
-                    self.inventory.append(ItemStack(produce_type, 1))
+                # Anything that doesn't fit is left on the ground
+                if not self.inventory.add_stack(harvested):
+                    tile_size = self.world.tile_size
+                    self.world.drop_item((grid_x + 0.5) * tile_size, (grid_y + 0.5) * tile_size, harvested)
                 tool_used = True
         
         if tool_used:
             # Start tool animation
             self.is_using_tool = True
-            self.tool_start_time = pygame.time.get_ticks()
+            self.tool_time_left = self.tool_duration
             self.sprite.set_state(self.selected_tool, self.facing)
             
         return tool_used
 
-    def draw(self, screen, camera_x=0, camera_y=0):
-        # Get current sprite frame
-        current_frame = self.sprite.update(pygame.time.get_ticks())
+    def get_draw_rect(self, camera_x=0, camera_y=0, alpha=1.0):
+        """Screen rect covered by the player sprite"""
+        width, height = self.sprite.get_size()
+        
+        # Interpolate between the last two ticks
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
         
         # Calculate screen position
-        screen_x = int(self.x - camera_x - current_frame.get_width() // 2)
-        screen_y = int(self.y - camera_y - current_frame.get_height() * 0.75)
+        screen_x = int(x - camera_x - width // 2)
+        screen_y = int(y - camera_y - height * 0.75)
+        return pygame.Rect(screen_x, screen_y, width, height)
+
+    def draw(self, screen, camera_x=0, camera_y=0, alpha=1.0):
+        # Get current sprite frame
+        current_frame = self.sprite.current_frame()
         
         # Draw sprite
-        screen.blit(current_frame, (screen_x, screen_y)) 
\ No newline at end of file
+        return screen.blit(current_frame, self.get_draw_rect(camera_x, camera_y, alpha))
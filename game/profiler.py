@@ -0,0 +1,162 @@
+import cProfile
+import csv
+import io
+import itertools
+import json
+import os
+import pstats
+import time
+from collections import deque
+from contextlib import contextmanager
+
+PROFILE_DIR = "profiles"
+
+class FrameProfiler:
+    def __init__(self, history=3600):
+        """
+        Per-frame timings of named subsystems
+        history: Number of recent frames kept for the overlay and for export
+        Sections that run several times in one frame (e.g. once per simulation
+        tick) add up into that frame's total for the section
+        """
+        self.history = deque(maxlen=history)
+        self.clock_start = time.perf_counter()
+        self.frame_start = None
+        self.interval = None
+        self.frame_count = 0
+        self.current = {}   # Section name -> ms so far this frame
+        self.events = []    # (name, start, duration) in seconds since clock_start
+        self.capture = None
+        self.capture_frames = 0
+
+    @contextmanager
+    def section(self, name):
+        """Time the body of a with block as part of a named section"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.current[name] = self.current.get(name, 0.0) + (end - start) * 1000
+            self.events.append((name, start - self.clock_start, end - start))
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        
+        # Time since the previous frame began, including waiting for vsync
+        interval = None if self.frame_start is None else (now - self.frame_start) * 1000
+        self.frame_start = now
+        self.current = {}
+        self.events = []
+        self.interval = interval
+
+    def end_frame(self):
+        if self.frame_start is None:
+            return
+        end = time.perf_counter()
+        self.frame_count += 1
+        self.history.append({
+            'start': self.frame_start - self.clock_start,
+            'frame_ms': (end - self.frame_start) * 1000,
+            'interval_ms': self.interval,
+            'sections': self.current,
+            'events': self.events,
+        })
+        
+        if self.capture is not None:
+            self.capture_frames -= 1
+            if self.capture_frames <= 0:
+                self.finish_capture()
+
+    def section_names(self):
+        """Names of every section seen in the kept frames, in first-seen order"""
+        names = {}
+        for frame in self.history:
+            names.update(dict.fromkeys(frame['sections']))
+        return list(names)
+
+    def recent(self, count=None):
+        """The last count kept frames (all of them by default), oldest first"""
+        if count is None:
+            return list(self.history)
+        return list(itertools.islice(reversed(self.history), count))[::-1]
+
+    def samples(self, name, count=None):
+        """Recent per-frame times of a section in ms (0 for frames it didn't run in)"""
+        frames = self.recent(count)
+        if name == 'frame':
+            return [frame['frame_ms'] for frame in frames]
+        return [frame['sections'].get(name, 0.0) for frame in frames]
+
+    def fps(self, count=60):
+        """Frames per second over the last count frames"""
+        intervals = [frame['interval_ms'] for frame in self.recent(count) if frame['interval_ms']]
+        if not intervals:
+            return 0.0
+        return 1000 * len(intervals) / sum(intervals)
+
+    def start_capture(self, frames=120):
+        """Run cProfile over the next frames; the result is written to PROFILE_DIR"""
+        if self.capture is not None:
+            return False
+        self.capture = cProfile.Profile()
+        self.capture_frames = frames
+        self.capture.enable()
+        return True
+
+    def finish_capture(self):
+        self.capture.disable()
+        path = self.output_path("capture", "prof")
+        self.capture.dump_stats(path)
+        
+        summary = io.StringIO()
+        pstats.Stats(self.capture, stream=summary).sort_stats("cumulative").print_stats(20)
+        print(f"Wrote cProfile capture to {path}")
+        print(summary.getvalue())
+        self.capture = None
+        return path
+
+    def output_path(self, kind, extension):
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        return os.path.join(PROFILE_DIR, f"{kind}-{stamp}.{extension}")
+
+    def export_json(self, path):
+        frames = [{key: value for key, value in frame.items() if key != 'events'}
+                  for frame in self.history]
+        with open(path, "w") as f:
+            json.dump({'frames': frames}, f)
+
+    def export_csv(self, path):
+        names = self.section_names()
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame', 'start_ms', 'frame_ms', 'interval_ms'] + names)
+            for index, frame in enumerate(self.history):
+                writer.writerow([index, round(frame['start'] * 1000, 3), round(frame['frame_ms'], 3),
+                                 '' if frame['interval_ms'] is None else round(frame['interval_ms'], 3)] +
+                                [round(frame['sections'].get(name, 0.0), 3) for name in names])
+
+    def export_chrome_trace(self, path):
+        """Write the kept frames as a trace viewable in chrome://tracing or Perfetto"""
+        trace = []
+        for index, frame in enumerate(self.history):
+            trace.append({'name': f"frame {index}", 'ph': 'X', 'pid': 1, 'tid': 1,
+                          'ts': frame['start'] * 1e6, 'dur': frame['frame_ms'] * 1000})
+            for name, start, duration in frame['events']:
+                trace.append({'name': name, 'ph': 'X', 'pid': 1, 'tid': 1,
+                              'ts': start * 1e6, 'dur': duration * 1e6})
+        with open(path, "w") as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+
+    def export(self):
+        """Write the kept frames as JSON, CSV and a Chrome trace; returns the paths"""
+        paths = [self.output_path("frames", "json"), self.output_path("frames", "csv"),
+                 self.output_path("trace", "json")]
+        self.export_json(paths[0])
+        self.export_csv(paths[1])
+        self.export_chrome_trace(paths[2])
+        return paths
+
+# Shared by the main loop and every instrumented subsystem
+profiler = FrameProfiler()
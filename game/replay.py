@@ -0,0 +1,116 @@
+import struct
+import pygame
+
+# File layout:
+#   header   magic, format version, number of recorded keys
+#   world    columns and rows of the recorded world in tiles
+#   keys     the recorded key codes, one uint32 each, in bit order
+#   frames   one per frame: frame time (ms), held-key bitmask, event count,
+#            then that many (event type, key) pairs
+REPLAY_MAGIC = b"PDREPLAY"
+REPLAY_VERSION = 2
+HEADER = struct.Struct("<8sHH")
+WORLD_SIZE = struct.Struct("<II")
+KEY_CODE = struct.Struct("<I")
+FRAME = struct.Struct("<dIB")
+EVENT = struct.Struct("<BI")
+
+# Held keys the game reads through pygame.key.get_pressed()
+RECORDED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+                 pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT)
+
+# Event types that are recorded, stored by index
+RECORDED_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+
+class ReplayError(Exception):
+    pass
+
+class RecordedKeys:
+    """Stand-in for pygame.key.get_pressed() built from a recorded bitmask"""
+    def __init__(self, mask, key_bits):
+        self.mask = mask
+        self.key_bits = key_bits
+
+    def __getitem__(self, key):
+        bit = self.key_bits.get(key)
+        return bit is not None and bool(self.mask >> bit & 1)
+
+class InputRecorder:
+    def __init__(self, path, world_size, keys=RECORDED_KEYS):
+        """
+        Record every frame's input to path
+        Together with a fresh GameScreen this is enough to replay a session
+        exactly, because the simulation only depends on input and frame times
+        world_size: (columns, rows) of the game's world in tiles
+        Use as a context manager, or call close(), so the file is complete
+        """
+        self.keys = keys
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, len(keys)))
+        self.file.write(WORLD_SIZE.pack(*world_size))
+        for key in keys:
+            self.file.write(KEY_CODE.pack(key))
+        self.frames = 0
+
+    def record(self, frame_ms, keys, events):
+        """
+        Log one frame
+        frame_ms: Frame time the game simulated
+        keys: Keyboard state the game read (pygame.key.get_pressed() or similar)
+        events: Events handled this frame; only key presses and releases are kept
+        """
+        mask = 0
+        for bit, key in enumerate(self.keys):
+            if keys[key]:
+                mask |= 1 << bit
+        kept = [(RECORDED_EVENTS.index(event.type), event.key)
+                for event in events if event.type in RECORDED_EVENTS]
+        self.file.write(FRAME.pack(frame_ms, mask, len(kept)))
+        for kind, key in kept:
+            self.file.write(EVENT.pack(kind, key))
+        self.frames += 1
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class Recording:
+    def __init__(self, path):
+        """
+        A recorded session; iterate over it for (frame_ms, keys, events) per frame
+        world_size: (columns, rows) of the recorded world in tiles
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self.read_header(f)
+
+    def read_header(self, f):
+        header = f.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise ReplayError(f"{self.path} is not a recording")
+        magic, version, key_count = HEADER.unpack(header)
+        if magic != REPLAY_MAGIC:
+            raise ReplayError(f"{self.path} is not a recording")
+        if version != REPLAY_VERSION:
+            raise ReplayError(f"Unsupported recording version {version} in {self.path}")
+        self.world_size = tuple(WORLD_SIZE.unpack(f.read(WORLD_SIZE.size)))
+        self.key_bits = {KEY_CODE.unpack(f.read(KEY_CODE.size))[0]: bit for bit in range(key_count)}
+
+    def __iter__(self):
+        with open(self.path, "rb") as f:
+            self.read_header(f)
+            while True:
+                frame = f.read(FRAME.size)
+                if len(frame) < FRAME.size:
+                    return  # End of file (a partly written last frame is dropped)
+                frame_ms, mask, event_count = FRAME.unpack(frame)
+                events = []
+                for _ in range(event_count):
+                    kind, key = EVENT.unpack(f.read(EVENT.size))
+                    events.append(pygame.event.Event(RECORDED_EVENTS[kind], key=key))
+                yield frame_ms, RecordedKeys(mask, self.key_bits), events
@@ -0,0 +1,201 @@
+import json
+import os
+import struct
+import time
+import numpy as np
+from game.chunks import CHUNK_SIZE
+from game.items import Items, ItemStack
+from game.inventory import Inventory
+from game.world import World
+from game.clock import GAME_MINUTES_PER_MS
+
+# File layout:
+#   preamble   magic, format version, header length
+#   header     UTF-8 JSON with player, inventory, clock and world state, plus
+#              a table describing every data block
+#   blocks     raw little-endian NumPy arrays, each aligned to BLOCK_ALIGNMENT
+#              so they can be memory-mapped straight from the file
+SAVE_MAGIC = b"PDSAVE\x00\x00"
+SAVE_VERSION = 1
+BLOCK_ALIGNMENT = 64
+PREAMBLE = struct.Struct("<8sII")
+
+CROP_ARRAYS = ('crop_type', 'growth_stage', 'days_watered', 'planted_at', 'watered')
+MOISTURE_ARRAYS = ('level', 'soil')
+
+class SaveError(Exception):
+    pass
+
+def align(offset):
+    return (offset + BLOCK_ALIGNMENT - 1) // BLOCK_ALIGNMENT * BLOCK_ALIGNMENT
+
+def collect_blocks(world):
+    """Gather the world's array data as a dict of block name to array"""
+    # Only chunks that differ from freshly generated ones need to be stored
+    tile_keys = sorted(world.tiles.modified)
+    tile_chunks = np.zeros((len(tile_keys), CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)
+    for i, key in enumerate(tile_keys):
+        tile_chunks[i] = world.tiles.read_chunk(key)
+
+    crop_count = len(world.crops.keys)
+    blocks = {
+        'tile_keys': np.array(tile_keys, dtype=np.int32).reshape(-1, 2),
+        'tile_chunks': tile_chunks,
+        'crop_keys': np.array(world.crops.keys, dtype=np.int32).reshape(-1, 2),
+    }
+    for name in CROP_ARRAYS:
+        blocks[name] = getattr(world.crops, name)[:crop_count]
+    
+    moisture_count = len(world.moisture.keys)
+    blocks['moisture_keys'] = np.array(world.moisture.keys, dtype=np.int32).reshape(-1, 2)
+    for name in MOISTURE_ARRAYS:
+        blocks['moisture_' + name] = getattr(world.moisture, name)[:moisture_count]
+    return blocks
+
+def save_game(path, world, player, status_panel):
+    """Write the world, player and clock state to path"""
+    blocks = collect_blocks(world)
+
+    # Block offsets are relative to the start of the data section
+    block_table = []
+    offset = 0
+    for name, array in blocks.items():
+        array = np.ascontiguousarray(array)
+        blocks[name] = array
+        block_table.append({
+            'name': name,
+            'dtype': array.dtype.newbyteorder('<').str,
+            'shape': list(array.shape),
+            'offset': offset,
+        })
+        offset = align(offset + array.nbytes)
+
+    header = {
+        'player': {
+            'x': player.x,
+            'y': player.y,
+            'facing': player.facing,
+            'selected_tool': player.selected_tool,
+        },
+        'inventory': [[stack.item_type.id, stack.quantity, slot]
+                      for slot, stack in enumerate(player.inventory.slots) if stack is not None],
+        'status': {
+            'money': status_panel.money,
+        },
+        'world': {
+            'width': world.width,
+            'height': world.height,
+            'tile_size': world.tile_size,
+            'day': world.day,
+            'minutes': world.clock.minutes,
+            'weather_seed': world.weather_seed,
+        },
+        'blocks': block_table,
+        'saved_at': time.time(),
+    }
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    data_start = align(PREAMBLE.size + len(header_bytes))
+
+    # Write to a temporary file first so a failed save never corrupts the old one
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(PREAMBLE.pack(SAVE_MAGIC, SAVE_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for entry in block_table:
+            f.seek(data_start + entry['offset'])
+            f.write(blocks[entry['name']].astype(entry['dtype'], copy=False).tobytes())
+    os.replace(temp_path, path)
+
+class SaveFile:
+    def __init__(self, path):
+        """
+        Open a save file, reading only its header
+        Data blocks are memory-mapped when first requested
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            preamble = f.read(PREAMBLE.size)
+            if len(preamble) != PREAMBLE.size:
+                raise SaveError(f"{path} is not a save file")
+            magic, version, header_length = PREAMBLE.unpack(preamble)
+            if magic != SAVE_MAGIC:
+                raise SaveError(f"{path} is not a save file")
+            if version != SAVE_VERSION:
+                raise SaveError(f"Unsupported save version {version} in {path}")
+            self.header = json.loads(f.read(header_length).decode('utf-8'))
+        
+        self.data_start = align(PREAMBLE.size + header_length)
+        self.block_table = {entry['name']: entry for entry in self.header['blocks']}
+        self._tile_index = None
+
+    def block(self, name):
+        """Memory-map a data block (copy-on-write, so callers may modify it)"""
+        entry = self.block_table[name]
+        shape = tuple(entry['shape'])
+        dtype = np.dtype(entry['dtype'])
+        if 0 in shape:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode='c',
+                         offset=self.data_start + entry['offset'], shape=shape)
+
+    def tile_source(self, chunk_x, chunk_y):
+        """ChunkStore source returning a stored chunk's tiles, or None"""
+        if self._tile_index is None:
+            keys = self.block('tile_keys')
+            self._tile_index = {tuple(key): i for i, key in enumerate(keys.tolist())}
+            self._tile_chunks = self.block('tile_chunks')
+        index = self._tile_index.get((chunk_x, chunk_y))
+        if index is None:
+            return None
+        return self._tile_chunks[index]
+
+def load_game(path, player, status_panel, catch_up=False):
+    """
+    Load a save file
+    Restores player and status_panel in place and returns the loaded World;
+    tile chunks are only read from the file as they come into view
+    catch_up: Fast-forward the world by the real time passed since saving
+    """
+    save = SaveFile(path)
+    header = save.header
+
+    world_state = header['world']
+    world = World(world_state['width'], world_state['height'], world_state['tile_size'],
+                  weather_seed=world_state['weather_seed'])
+    world.day = world_state['day']
+    world.clock.reset(world_state['minutes'])
+    
+    # Stored chunks count as modified even before they are read, so saving
+    # again keeps the ones that never came into view
+    world.tiles.sources.append(save.tile_source)
+    world.tiles.modified.update(tuple(key) for key in save.block('tile_keys').tolist())
+    world.crops.restore(save.block('crop_keys'),
+                        {name: save.block(name) for name in CROP_ARRAYS})
+    world.moisture.restore(save.block('moisture_keys'),
+                           {name: save.block('moisture_' + name) for name in MOISTURE_ARRAYS})
+
+    player_state = header['player']
+    player.world = world
+    player.x = player_state['x']
+    player.y = player_state['y']
+    player.facing = player_state['facing']
+    player.selected_tool = player_state['selected_tool']
+    world.entities.insert(player, player.get_bounds())
+
+    player.inventory = Inventory(len(player.inventory))
+    for item_id, quantity, slot in header['inventory']:
+        item_type = Items.get(item_id)
+        if item_type is None:
+            raise SaveError(f"Unknown item {item_id!r} in {path}")
+        player.inventory.put(slot, ItemStack(item_type, quantity))
+
+    status_state = header['status']
+    status_panel.money = status_state['money']
+    
+    if catch_up:
+        offline_ms = max(0.0, time.time() - header['saved_at']) * 1000
+        world.fast_forward(offline_ms * GAME_MINUTES_PER_MS)
+    return world
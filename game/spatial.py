@@ -0,0 +1,102 @@
+import math
+
+class SpatialHash:
+    def __init__(self, cell_size):
+        """
+        Uniform grid of buckets for finding entities near a point or in a rect
+        cell_size: Bucket size in pixels (usually the tile size)
+        Entities can be any hashable object; each is stored with an axis-aligned
+        bounding box (x, y, width, height) in world pixels.
+        """
+        self.cell_size = cell_size
+        self.cells = {}    # (cell_x, cell_y) -> set of entities
+        self.bounds = {}   # entity -> (x, y, width, height)
+        self._ranges = {}  # entity -> (first_x, first_y, last_x, last_y) cells covered
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def __contains__(self, entity):
+        return entity in self.bounds
+
+    def cell_range(self, x, y, width, height):
+        size = self.cell_size
+        return (math.floor(x / size), math.floor(y / size),
+                math.floor((x + max(width, 0)) / size), math.floor((y + max(height, 0)) / size))
+
+    def _add_to_cells(self, entity, cells):
+        first_x, first_y, last_x, last_y = cells
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if bucket is None:
+                    bucket = self.cells[(cell_x, cell_y)] = set()
+                bucket.add(entity)
+
+    def _remove_from_cells(self, entity, cells):
+        first_x, first_y, last_x, last_y = cells
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                bucket = self.cells[(cell_x, cell_y)]
+                bucket.discard(entity)
+                if not bucket:
+                    del self.cells[(cell_x, cell_y)]
+
+    def insert(self, entity, bounds):
+        if entity in self.bounds:
+            self.move(entity, bounds)
+            return
+        cells = self.cell_range(*bounds)
+        self.bounds[entity] = tuple(bounds)
+        self._ranges[entity] = cells
+        self._add_to_cells(entity, cells)
+
+    def move(self, entity, bounds):
+        """Update an entity's bounds, only touching buckets if it changed cells"""
+        cells = self.cell_range(*bounds)
+        old_cells = self._ranges[entity]
+        self.bounds[entity] = tuple(bounds)
+        if cells != old_cells:
+            self._remove_from_cells(entity, old_cells)
+            self._add_to_cells(entity, cells)
+            self._ranges[entity] = cells
+
+    def remove(self, entity):
+        if entity not in self.bounds:
+            return
+        self._remove_from_cells(entity, self._ranges.pop(entity))
+        del self.bounds[entity]
+
+    def query_rect(self, x, y, width, height):
+        """Return the set of entities whose bounds overlap a rect"""
+        first_x, first_y, last_x, last_y = self.cell_range(x, y, width, height)
+        found = set()
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if bucket:
+                    found.update(bucket)
+        
+        # Buckets are coarse; keep only real overlaps
+        right = x + width
+        bottom = y + height
+        return {entity for entity in found
+                if rects_overlap(self.bounds[entity], x, y, right, bottom)}
+
+    def query_radius(self, x, y, radius):
+        """Return the set of entities whose bounds come within radius of a point"""
+        candidates = self.query_rect(x - radius, y - radius, radius * 2, radius * 2)
+        radius_squared = radius * radius
+        found = set()
+        for entity in candidates:
+            ex, ey, ew, eh = self.bounds[entity]
+            # Distance from the point to the nearest point of the box
+            dx = max(ex - x, 0, x - (ex + ew))
+            dy = max(ey - y, 0, y - (ey + eh))
+            if dx * dx + dy * dy <= radius_squared:
+                found.add(entity)
+        return found
+
+def rects_overlap(bounds, left, top, right, bottom):
+    x, y, width, height = bounds
+    return x <= right and left <= x + width and y <= bottom and top <= y + height
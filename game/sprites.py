@@ -1,157 +1,168 @@
 import pygame
+import hashlib
 import os
-from typing import Dict, List, Tuple
+from typing import Dict, Tuple
+from game.atlas import Atlas
+from game.animation import animator, clips
 
-class Animation:
-    def __init__(self, frames: List[pygame.Surface], frame_duration: int = 100):
-        """
-        Initialize an animation
-        frames: List of surfaces for each frame
-        frame_duration: Duration of each frame in milliseconds
-        """
-        self.frames = frames
-        self.frame_duration = frame_duration
-        self.current_frame = 0
-        self.last_update = 0
-        self.is_playing = True
+# Base sprite size before scaling
+SPRITE_SIZE = (32, 48)
+
+# Rows of the sprite sheet: each state has one row per direction
+STATES = ['idle', 'walk', 'hoe', 'water', 'seed', 'harvest']
+DIRECTIONS = ['down', 'left', 'right', 'up']
+
+# Animation frame counts for each state
+FRAME_COUNTS = {
+    'idle': 4,
+    'walk': 4,
+    'hoe': 3,
+    'water': 3,
+    'seed': 3,
+    'harvest': 3
+}
+
+# Animation speeds (milliseconds per frame)
+FRAME_DURATIONS = {
+    'idle': 400,
+    'walk': 150,
+    'hoe': 200,
+    'water': 200,
+    'seed': 200,
+    'harvest': 200
+}
+
+SPRITE_SHEET_PATH = os.path.join("assets", "sprites", "character.png")
+CACHE_DIR = os.path.join("assets", "cache")
+
+def frame_name(state: str, direction: str, frame: int) -> str:
+    return f"{state}/{direction}/{frame}"
+
+def build_character_atlas(sprite_sheet: pygame.Surface, scale: float) -> Atlas:
+    """Cut every frame out of the sprite sheet, scale it and pack the result"""
+    frames = {}
+    for state_index, state in enumerate(STATES):
+        for row, direction in enumerate(DIRECTIONS):
+            for frame in range(FRAME_COUNTS[state]):
+                # Calculate position in sprite sheet
+                x = frame * SPRITE_SIZE[0]
+                y = (state_index * len(DIRECTIONS) + row) * SPRITE_SIZE[1]
+                
+                # Extract frame from sprite sheet
+                frame_surface = pygame.Surface(SPRITE_SIZE, pygame.SRCALPHA)
+                frame_surface.blit(sprite_sheet, (0, 0), 
+                                 (x, y, SPRITE_SIZE[0], SPRITE_SIZE[1]))
+                
+                # Scale if needed
+                if scale != 1.0:
+                    new_size = (int(SPRITE_SIZE[0] * scale), 
+                              int(SPRITE_SIZE[1] * scale))
+                    frame_surface = pygame.transform.scale(frame_surface, new_size)
+                
+                frames[frame_name(state, direction, frame)] = frame_surface
+    return Atlas.pack(frames)
+
+def load_character_atlas(sheet_path: str = SPRITE_SHEET_PATH, scale: float = 1.0) -> Atlas:
+    """
+    Load the sliced and scaled character frames as one packed atlas
+    The atlas is built once and cached under assets/cache, keyed by the
+    sheet's content hash and the scale, so later runs only load one image
+    """
+    if not os.path.exists(sheet_path):
+        raise FileNotFoundError(f"Could not find sprite sheet at {sheet_path}")
         
-    def update(self, current_time: int) -> pygame.Surface:
-        """Update animation and return current frame"""
-        if not self.is_playing:
-            return self.frames[self.current_frame]
-            
-        if current_time - self.last_update > self.frame_duration:
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            self.last_update = current_time
-            
-        return self.frames[self.current_frame]
+    with open(sheet_path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:16]
+    cache_name = f"{os.path.splitext(os.path.basename(sheet_path))[0]}_{digest}_{scale:g}x"
+    image_path = os.path.join(CACHE_DIR, cache_name + ".png")
+    manifest_path = os.path.join(CACHE_DIR, cache_name + ".json")
     
-    def reset(self):
-        """Reset animation to first frame"""
-        self.current_frame = 0
-        self.is_playing = True
-        
-    def pause(self):
-        """Pause the animation"""
-        self.is_playing = False
+    if os.path.exists(image_path) and os.path.exists(manifest_path):
+        return Atlas.load(image_path, manifest_path)
+    
+    atlas = build_character_atlas(pygame.image.load(sheet_path), scale)
+    atlas.save(image_path, manifest_path, source=sheet_path, source_sha1=digest, scale=scale)
+    return Atlas.load(image_path, manifest_path)
+
+class CharacterFrames:
+    def __init__(self, atlas: Atlas):
+        """
+        Read-only frames for every state and direction of one sheet at one scale
+        Shared by all CharacterSprite instances through get_character_frames
+        """
+        self.atlas = atlas
         
-    def resume(self):
-        """Resume the animation"""
-        self.is_playing = True
+        # Clip id for each state and direction, and the frames of each clip id
+        self.clip_ids: Dict[str, Dict[str, int]] = {state: {} for state in STATES}
+        self.clip_frames: Dict[int, Tuple[pygame.Surface, ...]] = {}
+        for state in STATES:
+            for direction in DIRECTIONS:
+                clip_id = clips.register(f"character/{state}/{direction}",
+                                         FRAME_COUNTS[state], FRAME_DURATIONS[state])
+                self.clip_ids[state][direction] = clip_id
+                self.clip_frames[clip_id] = tuple(
+                    atlas.get(frame_name(state, direction, frame))
+                    for frame in range(FRAME_COUNTS[state]))
+        self.size = self.clip_frames[self.clip_ids['idle']['down']][0].get_size()
+
+# Process-wide frame stores keyed by (sheet path, scale)
+_frame_stores: Dict[Tuple[str, float], CharacterFrames] = {}
+
+def get_character_frames(sheet_path: str = SPRITE_SHEET_PATH, scale: float = 1.0) -> CharacterFrames:
+    """Return the shared frames for a sheet and scale, loading them on first use"""
+    key = (sheet_path, scale)
+    frames = _frame_stores.get(key)
+    if frames is None:
+        frames = CharacterFrames(load_character_atlas(sheet_path, scale))
+        _frame_stores[key] = frames
+    return frames
 
 class CharacterSprite:
-    def __init__(self, scale: float = 1.0):
+    __slots__ = ('frames', 'state', 'facing', 'slot')
+
+    def __init__(self, scale: float = 1.0, sheet_path: str = SPRITE_SHEET_PATH):
         """
-        Initialize character sprite with all animations
+        Initialize a character sprite
         scale: Scale factor for the sprite (1.0 = original size)
+        Frames are shared with every other sprite using the same sheet and
+        scale; playback lives in a slot of the shared animator, which is
+        advanced once per frame for all sprites; call release() when the
+        sprite is no longer used to hand the slot back
         """
-        self.scale = scale
-        self.facing = 'down'
+        self.frames = get_character_frames(sheet_path, scale)
         self.state = 'idle'
-        self.animations: Dict[str, Dict[str, Animation]] = {
-            'idle': {},
-            'walk': {},
-            'hoe': {},
-            'water': {},
-            'seed': {},
-            'harvest': {}
-        }
-        
-        # Load all character animations
-        self.load_animations()
-        
-    def load_animations(self):
-        """Load all character animations from the assets folder"""
-        sprite_size = (32, 48)  # Base sprite size before scaling
-        
-        # Define animation frame counts for each state
-        frame_counts = {
-            'idle': 4,
-            'walk': 4,
-            'hoe': 3,
-            'water': 3,
-            'seed': 3,
-            'harvest': 3
-        }
-        
-        # Define animation speeds (milliseconds per frame)
-        frame_durations = {
-            'idle': 400,
-            'walk': 150,
-            'hoe': 200,
-            'water': 200,
-            'seed': 200,
-            'harvest': 200
-        }
-        
-        # Load sprite sheet
-        sprite_sheet_path = os.path.join("assets", "sprites", "character.png")
-        if not os.path.exists(sprite_sheet_path):
-            raise FileNotFoundError(f"Could not find sprite sheet at {sprite_sheet_path}")
-            
-        sprite_sheet = pygame.image.load(sprite_sheet_path).convert_alpha()
-        
-        # Define directions and their row in the sprite sheet
-        directions = {
-            'down': 0,
-            'left': 1,
-            'right': 2,
-            'up': 3
-        }
-        
-        # For each state and direction, create animation
-        for state in self.animations.keys():
-            state_offset = list(self.animations.keys()).index(state) * 4  # 4 directions per state
-            
-            for direction, row in directions.items():
-                frames = []
-                for frame in range(frame_counts[state]):
-                    # Calculate position in sprite sheet
-                    x = frame * sprite_size[0]
-                    y = (row + state_offset) * sprite_size[1]
-                    
-                    # Extract frame from sprite sheet
-                    frame_surface = pygame.Surface(sprite_size, pygame.SRCALPHA)
-                    frame_surface.blit(sprite_sheet, (0, 0), 
-                                     (x, y, sprite_size[0], sprite_size[1]))
-                    
-                    # Scale if needed
-                    if self.scale != 1.0:
-                        new_size = (int(sprite_size[0] * self.scale), 
-                                  int(sprite_size[1] * self.scale))
-                        frame_surface = pygame.transform.scale(frame_surface, new_size)
-                    
-                    frames.append(frame_surface)
-                
-                # Create animation for this state and direction
-                self.animations[state][direction] = Animation(
-                    frames, frame_durations[state]
-                )
+        self.facing = 'down'
+        self.slot = animator.add(self.frames.clip_ids[self.state][self.facing])
     
-    def update(self, current_time: int) -> pygame.Surface:
-        """Update current animation and return current frame"""
-        return self.animations[self.state][self.facing].update(current_time)
+    def release(self):
+        """Free the sprite's animator slot; the sprite can't be drawn afterwards"""
+        if self.slot is not None:
+            animator.remove(self.slot)
+            self.slot = None
+    
+    def current_frame(self) -> pygame.Surface:
+        """Frame to draw as of the animator's last update"""
+        clip_id = self.frames.clip_ids[self.state][self.facing]
+        return self.frames.clip_frames[clip_id][animator.frame(self.slot)]
     
     def set_state(self, state: str, facing: str = None):
         """
         Change animation state and optionally facing direction
-        Resets the animation if state changes
+        Restarts the animation if either changes
         """
-        if state not in self.animations:
+        if state not in self.frames.clip_ids:
             raise ValueError(f"Invalid state: {state}")
             
-        if facing and facing not in self.animations[state]:
+        if facing and facing not in self.frames.clip_ids[state]:
             raise ValueError(f"Invalid facing direction: {facing}")
             
-        if state != self.state:
-            self.state = state
-            self.animations[state][self.facing].reset()
-            
-        if facing and facing != self.facing:
+        if state == self.state and (not facing or facing == self.facing):
+            return
+        self.state = state
+        if facing:
             self.facing = facing
-            self.animations[self.state][facing].reset()
+        animator.play(self.slot, self.frames.clip_ids[self.state][self.facing])
     
     def get_size(self) -> Tuple[int, int]:
         """Get current sprite size"""
-        current_frame = self.animations[self.state][self.facing].frames[0]
-        return current_frame.get_size() 
\ No newline at end of file
+        return self.frames.size
@@ -0,0 +1,37 @@
+import time
+from contextlib import contextmanager
+
+class StartupTimeline:
+    def __init__(self):
+        """Records how long each startup phase took, relative to creation"""
+        self.start = time.perf_counter()
+        self.events = []  # (name, start offset, duration) in seconds
+
+    @contextmanager
+    def phase(self, name):
+        """Time the body of a with block as one named phase"""
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.events.append((name, phase_start - self.start, end - phase_start))
+
+    def mark(self, name):
+        """Record an instant, like the first frame being shown"""
+        self.events.append((name, time.perf_counter() - self.start, 0.0))
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def report(self):
+        lines = ["Startup timeline:"]
+        for name, offset, duration in sorted(self.events, key=lambda event: event[1]):
+            if duration:
+                lines.append(f"  {offset * 1000:8.1f} ms  {name:<28} {duration * 1000:8.1f} ms")
+            else:
+                lines.append(f"  {offset * 1000:8.1f} ms  {name}")
+        return "\n".join(lines)
+
+# Created when first imported, which main.py does before anything else
+timeline = StartupTimeline()
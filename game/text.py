@@ -0,0 +1,75 @@
+import pygame
+from collections import OrderedDict
+
+_fonts = {}
+
+def get_font(size, name=None):
+    """Return a shared pygame Font, creating it on first use"""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+class TextCache:
+    def __init__(self, max_entries=256):
+        """
+        Least-recently-used cache of rendered text surfaces
+        max_entries: Number of surfaces kept before the oldest is dropped
+        """
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+
+    def render(self, font, text, color, antialias=True):
+        """Drop-in replacement for font.render that reuses earlier results"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = font.render(text, antialias, color)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_entries:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+class GlyphAtlas:
+    def __init__(self, font, color, characters="0123456789:$-. "):
+        """
+        Pre-rendered glyphs for strings that change every frame, like the clock
+        Text is drawn glyph by glyph, so it never has to be rasterised again;
+        text with characters outside the atlas is rendered through text_cache
+        """
+        self.font = font
+        self.color = color
+        self.characters = set(characters)
+        self.glyphs = {char: font.render(char, True, color) for char in characters}
+        self.height = font.get_height()
+
+    def supports(self, text):
+        return self.characters.issuperset(text)
+
+    def size(self, text):
+        if not self.supports(text):
+            return self.font.size(text)
+        return sum(self.glyphs[char].get_width() for char in text), self.height
+
+    def draw(self, screen, text, position):
+        """Blit text at position (top left) and return the covered rect"""
+        if not self.supports(text):
+            return screen.blit(text_cache.render(self.font, text, self.color), position)
+        x, y = position
+        blits = []
+        for char in text:
+            glyph = self.glyphs[char]
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        screen.blits(blits, doreturn=False)
+        return pygame.Rect(position, (x - position[0], self.height))
+
+# Shared by every screen and UI element
+text_cache = TextCache()
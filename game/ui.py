@@ -1,4 +1,7 @@
+import bisect
 import pygame
+from game.text import get_font, text_cache, GlyphAtlas
+from game.atlas import load_icon_atlas
 
 class Tool:
     HOE = "hoe"
@@ -30,7 +33,10 @@ class ToolBar:
         self.y = screen_height - self.slot_size - 10
         
         # Create font for hotkey numbers
-        self.font = pygame.font.Font(None, 20)
+        self.font = get_font(20)
+        
+        # Tool icons come from the shared icon atlas when it has been built
+        self.icons = load_icon_atlas()
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -43,7 +49,11 @@ class ToolBar:
     def get_selected_tool(self):
         return self.slots[self.selected_slot]
 
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.total_width, self.slot_size)
+
     def draw(self, screen):
+        icon_blits = []
         for i, tool in enumerate(self.slots):
             # Calculate position
             x = self.x + (self.slot_size + self.padding) * i
@@ -52,20 +62,79 @@ class ToolBar:
             # Draw slot background
             pygame.draw.rect(screen, (64, 64, 64), rect)
             
-            # Draw tool icon (using color for now, will be replaced with sprites)
-            inner_rect = pygame.Rect(x + 5, self.y + 5, self.slot_size - 10, self.slot_size - 10)
-            pygame.draw.rect(screen, Tool.get_color(tool), inner_rect)
+            # Draw tool icon, falling back to a colored square without the atlas
+            icon_name = f"tool/{tool}"
+            if self.icons is not None and icon_name in self.icons:
+                icon = self.icons.get(icon_name)
+                icon_blits.append((icon, icon.get_rect(center=rect.center)))
+            else:
+                inner_rect = pygame.Rect(x + 5, self.y + 5, self.slot_size - 10, self.slot_size - 10)
+                pygame.draw.rect(screen, Tool.get_color(tool), inner_rect)
             
             # Draw selection highlight
             if i == self.selected_slot:
                 pygame.draw.rect(screen, (255, 255, 255), rect, 3)
             else:
                 pygame.draw.rect(screen, (128, 128, 128), rect, 1)
-            
-            # Draw hotkey number
-            number_text = self.font.render(str(i + 1), True, (255, 255, 255))
+        
+        # All icons and hotkey numbers go out in one batch
+        for i in range(len(self.slots)):
+            x = self.x + (self.slot_size + self.padding) * i
+            number_text = text_cache.render(self.font, str(i + 1), (255, 255, 255))
             number_rect = number_text.get_rect(bottomright=(x + self.slot_size - 2, self.y + self.slot_size - 2))
-            screen.blit(number_text, number_rect)
+            icon_blits.append((number_text, number_rect))
+        screen.blits(icon_blits, doreturn=False)
+
+class InventoryPanel:
+    def __init__(self, screen_width, screen_height, columns=8, rows=3):
+        self.slot_size = 40
+        self.padding = 4
+        self.columns = columns
+        self.rows = rows
+        self.visible = False
+        
+        # Center the panel on screen
+        self.width = columns * (self.slot_size + self.padding) + self.padding
+        self.height = rows * (self.slot_size + self.padding) + self.padding
+        self.x = (screen_width - self.width) // 2
+        self.y = (screen_height - self.height) // 2
+        
+        self.font = get_font(18)
+        self.icons = load_icon_atlas()
+
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def slot_rect(self, index):
+        column = index % self.columns
+        row = index // self.columns
+        return pygame.Rect(self.x + self.padding + column * (self.slot_size + self.padding),
+                           self.y + self.padding + row * (self.slot_size + self.padding),
+                           self.slot_size, self.slot_size)
+
+    def draw(self, screen, stacks):
+        if not self.visible:
+            return
+        
+        # Draw panel background and empty slots
+        pygame.draw.rect(screen, (40, 40, 40), self.get_rect())
+        pygame.draw.rect(screen, (255, 255, 255), self.get_rect(), 1)
+        for index in range(self.columns * self.rows):
+            pygame.draw.rect(screen, (64, 64, 64), self.slot_rect(index))
+        
+        # Draw every icon and quantity in one batch
+        blits = []
+        for index, stack in enumerate(stacks[:self.columns * self.rows]):
+            if stack is None or stack.quantity <= 0:
+                continue
+            rect = self.slot_rect(index)
+            icon_name = f"item/{stack.item_type.id}"
+            if self.icons is not None and icon_name in self.icons:
+                icon = self.icons.get(icon_name)
+                blits.append((icon, icon.get_rect(center=rect.center)))
+            quantity_text = text_cache.render(self.font, str(stack.quantity), (255, 255, 255))
+            blits.append((quantity_text, quantity_text.get_rect(bottomright=rect.bottomright)))
+        screen.blits(blits, doreturn=False)
 
 class StatusPanel:
     def __init__(self, screen_width):
@@ -73,19 +142,31 @@ class StatusPanel:
         self.height = 60
         self.x = 10
         self.y = 10
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(24)
+        
+        # Money and clock change constantly, so they are drawn from glyphs
+        self.money_glyphs = GlyphAtlas(self.font, (255, 255, 0))
+        self.time_glyphs = GlyphAtlas(self.font, (255, 255, 255))
         
-        # Game state
+        # Game state; day and time are read from the world's GameClock
         self.money = 100
-        self.day = 1
-        self.time = 0  # 0-24 hours
+        self.clock = None
         
-    def update(self, dt):
-        # Update time (1 real second = 1 game minute)
-        self.time += dt / 1000 * 60
-        if self.time >= 24 * 60:  # New day
-            self.time = 0
-            self.day += 1
+    @property
+    def day(self):
+        return self.clock.day if self.clock else 1
+    
+    @property
+    def time(self):
+        """Minutes since midnight"""
+        return self.clock.time_of_day if self.clock else 0
+
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def display_state(self):
+        """Everything the panel shows; the panel only needs redrawing when this changes"""
+        return self.money, int(self.time // 60), int(self.time % 60), self.day
 
     def draw(self, screen):
         # Draw panel background
@@ -94,16 +175,117 @@ class StatusPanel:
         pygame.draw.rect(screen, (255, 255, 255), panel_rect, 1)
         
         # Draw money
-        money_text = self.font.render(f"${self.money}", True, (255, 255, 0))
-        screen.blit(money_text, (self.x + 10, self.y + 10))
+        self.money_glyphs.draw(screen, f"${self.money}", (self.x + 10, self.y + 10))
         
         # Draw time
         hours = int(self.time // 60)
         minutes = int(self.time % 60)
-        time_text = self.font.render(f"{hours:02d}:{minutes:02d}", True, (255, 255, 255))
-        screen.blit(time_text, (self.x + 10, self.y + 35))
+        self.time_glyphs.draw(screen, f"{hours:02d}:{minutes:02d}", (self.x + 10, self.y + 35))
         
         # Draw day
-        day_text = self.font.render(f"Day {self.day}", True, (255, 255, 255))
+        day_text = text_cache.render(self.font, f"Day {self.day}", (255, 255, 255))
         day_rect = day_text.get_rect(topright=(self.x + self.width - 10, self.y + 10))
-        screen.blit(day_text, day_rect) 
\ No newline at end of file
+        screen.blit(day_text, day_rect)
+
+class ProfilerOverlay:
+    # Sections shown, in order, with the label drawn for each
+    SECTIONS = [
+        ('events', "Events"),
+        ('update', "Update"),
+        ('player', "  Player"),
+        ('camera', "  Camera"),
+        ('clock', "  Game clock"),
+        ('draw', "Draw"),
+        ('world', "  World"),
+        ('entities', "  Entities"),
+        ('player draw', "  Player"),
+        ('lighting', "  Lighting"),
+        ('ui', "  UI"),
+        ('frame', "Frame"),
+    ]
+    
+    # Histogram bin edges in ms; the last bin catches everything slower
+    BIN_EDGES = [0, 0.05, 0.1, 0.2, 0.5, 1, 2, 4, 8, 16, 33]
+    
+    # Frames summarised by the numbers and histograms
+    WINDOW = 120
+    
+    # The timings are redrawn every this many frames, so they stay readable
+    REFRESH_FRAMES = 10
+
+    def __init__(self, screen_width):
+        self.row_height = 16
+        self.info_rows = 4
+        self.width = 400
+        self.height = (len(self.SECTIONS) + 1 + self.info_rows) * self.row_height + 12
+        self.x = screen_width - self.width - 10
+        self.y = 80
+        self.font = get_font(18)
+        self.glyphs = GlyphAtlas(self.font, (255, 255, 255))
+        self.bar_width = 6
+        
+        # Timings rendered at the last refresh
+        self.timings = None
+        self.timings_frame = None
+
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def draw(self, screen, profiler, info_lines=()):
+        """Draw FPS, per-section avg / p95 / max in ms and a histogram of recent frame times"""
+        if self.timings is None or profiler.frame_count - self.timings_frame >= self.REFRESH_FRAMES:
+            self.timings = self.render_timings(profiler)
+            self.timings_frame = profiler.frame_count
+        screen.blit(self.timings, (self.x, self.y))
+        
+        # Anything else the screen wants to show changes every frame
+        y = self.y + (len(self.SECTIONS) + 1) * self.row_height + 8
+        for line in info_lines[:self.info_rows]:
+            screen.blit(text_cache.render(self.font, line, (200, 200, 200)), (self.x + 6, y))
+            y += self.row_height
+
+    def render_timings(self, profiler):
+        surface = pygame.Surface((self.width, self.height))
+        surface.fill((0, 0, 0))
+        pygame.draw.rect(surface, (255, 255, 255), surface.get_rect(), 1)
+        
+        x = 6
+        y = 4
+        columns = (x + 110, x + 160, x + 210)
+        histogram_x = x + 262
+        
+        # Header
+        surface.blit(text_cache.render(self.font, "FPS", (255, 255, 0)), (x, y))
+        self.glyphs.draw(surface, f"{profiler.fps():.1f}", (x + 40, y))
+        for column, label in zip(columns, ("avg", "p95", "max")):
+            surface.blit(text_cache.render(self.font, label, (180, 180, 180)), (column, y))
+        y += self.row_height
+        
+        for name, label in self.SECTIONS:
+            samples = profiler.samples(name, self.WINDOW)
+            surface.blit(text_cache.render(self.font, label, (255, 255, 255)), (x, y))
+            if samples:
+                ordered = sorted(samples)
+                values = (sum(samples) / len(samples), ordered[int(len(ordered) * 0.95)], ordered[-1])
+                for column, value in zip(columns, values):
+                    self.glyphs.draw(surface, f"{value:.2f}", (column, y))
+                self.draw_histogram(surface, samples, histogram_x, y)
+            y += self.row_height
+        return surface
+
+    def draw_histogram(self, surface, samples, x, y):
+        """One bar per bin, height proportional to how many samples fell in it"""
+        counts = [0] * len(self.BIN_EDGES)
+        for sample in samples:
+            counts[bisect.bisect_right(self.BIN_EDGES, sample) - 1] += 1
+        
+        tallest = max(counts)
+        bar_space = self.row_height - 2
+        for index, count in enumerate(counts):
+            if not count:
+                continue
+            height = max(1, count * bar_space // tallest)
+            # Slow bins are drawn red so spikes stand out
+            color = (90, 200, 90) if self.BIN_EDGES[index] < 8 else (220, 80, 60)
+            surface.fill(color, (x + index * (self.bar_width + 1), y + bar_space - height,
+                                 self.bar_width, height))
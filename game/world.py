@@ -1,5 +1,15 @@
 import pygame
 import numpy as np
+from game.chunks import CHUNK_SIZE, ChunkStore, chunk_key
+from game.crops import Crop, CropField
+from game.items import ItemStack
+from game.spatial import SpatialHash
+from game.entities import Pickup
+from game.collision import WalkabilityMask
+from game.pathfinding import Pathfinder
+from game.clock import GameClock, MINUTES_PER_DAY
+from game.moisture import MoistureField
+from game.lighting import Lighting
 
 class Tile:
     GRASS = 0
@@ -8,52 +18,287 @@ class Tile:
     WATERED_SOIL = 3
     PATH = 4
 
+    # Color shown in the 1px gap between tiles
+    GRID_COLOR = (100, 100, 100)
+
+    COLORS = {
+        GRASS: (34, 139, 34),          # Green
+        SOIL: (139, 69, 19),           # Brown
+        TILLED_SOIL: (105, 53, 15),    # Dark Brown
+        WATERED_SOIL: (76, 38, 11),    # Darker Brown
+        PATH: (210, 180, 140)          # Light Brown
+    }
+
+    # Tiles the player and NPCs can walk on (anything unlisted blocks movement)
+    WALKABLE = {GRASS, SOIL, TILLED_SOIL, WATERED_SOIL, PATH}
+
     @staticmethod
     def get_color(tile_type):
-        colors = {
-            Tile.GRASS: (34, 139, 34),      # Green
-            Tile.SOIL: (139, 69, 19),       # Brown
-            Tile.TILLED_SOIL: (105, 53, 15), # Dark Brown
-            Tile.WATERED_SOIL: (76, 38, 11), # Darker Brown
-            Tile.PATH: (210, 180, 140)       # Light Brown
-        }
-        return colors.get(tile_type, (0, 0, 0))
+        return Tile.COLORS.get(tile_type, (0, 0, 0))
+
+    @staticmethod
+    def color_table():
+        """Return an (N, 3) uint8 array mapping tile type to RGB color"""
+        table = np.zeros((256, 3), dtype=np.uint8)
+        for tile_type, color in Tile.COLORS.items():
+            table[tile_type] = color
+        return table
+
+    @staticmethod
+    def walkable_table():
+        """Return a bool array mapping tile type to walkable"""
+        table = np.zeros(256, dtype=bool)
+        table[list(Tile.WALKABLE)] = True
+        return table
+
+# Chance of rain on any day
+RAIN_CHANCE = 0.2
+
+def mix64(values):
+    """SplitMix64 finalizer: scramble a uint64 array into well-spread pseudo-random bits"""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
 
 class World:
-    def __init__(self, width, height, tile_size):
+    Tile = Tile
+    
+    # Half the side of the starting garden plot, in tiles
+    GARDEN_SIZE = 5
+
+    def __init__(self, width, height, tile_size, cache_dir=None, weather_seed=0):
         self.width = width
         self.height = height
         self.tile_size = tile_size
         self.grid_width = width // tile_size
         self.grid_height = height // tile_size
         
-        # Initialize the world grid with grass
-        self.grid = np.full((self.grid_height, self.grid_width), Tile.GRASS, dtype=int)
+        # Tiles are stored in chunks that are generated when first needed
+        self.tiles = ChunkStore(self.grid_width, self.grid_height,
+                                self.generate_chunk, cache_dir=cache_dir)
+        self.tiles.load_hooks.append(self.on_chunk_loaded)
+        self.tiles.evict_hooks.append(self.on_chunk_evicted)
+        
+        # Crops planted on the grid
+        self.crops = CropField()
+        self.day = 1
+        
+        # Soil moisture; whether soil shows as watered is derived from it
+        self.moisture = MoistureField()
+        self.weather_seed = weather_seed
+        
+        # Game time; systems schedule their timed work on it
+        self.clock = GameClock()
+        self.clock.every_day(self.advance_day, batch=self.advance_day)
+        
+        # Everything that moves or can be picked up, bucketed by tile
+        self.entities = SpatialHash(tile_size)
+        
+        # Packed walkability bits, updated as chunks load and tiles change
+        self.collision = WalkabilityMask(self.tiles, tile_size, Tile.walkable_table())
         
-        # Create a center garden plot
+        # Cached paths and flow fields for NPCs
+        self.pathfinder = Pathfinder(self.collision)
+        
+        # Day/night tint and light sources such as lamps
+        self.lighting = Lighting(tile_size)
+
+        # Pre-rendered chunk surfaces, keyed by (chunk_x, chunk_y)
+        self.chunk_size = CHUNK_SIZE
+        self._chunk_cache = {}
+        self._color_table = Tile.color_table()
+        
+        # Set whenever a chunk's appearance changes, cleared by the screen
+        self.render_changed = True
+
+    def generate_chunk(self, chunk_x, chunk_y):
+        """Build the starting tiles for one chunk"""
+        x0 = chunk_x * CHUNK_SIZE
+        y0 = chunk_y * CHUNK_SIZE
+        ys, xs = np.ogrid[y0:y0 + CHUNK_SIZE, x0:x0 + CHUNK_SIZE]
+        
+        # Start with grass everywhere
+        tiles = np.full((CHUNK_SIZE, CHUNK_SIZE), Tile.GRASS, dtype=np.uint8)
+        
+        # Create a center garden plot with soil
         center_x = self.grid_width // 2
         center_y = self.grid_height // 2
-        garden_size = 5
-        
-        # Create a garden plot with soil
-        for y in range(center_y - garden_size, center_y + garden_size):
-            for x in range(center_x - garden_size, center_x + garden_size):
-                if 0 <= y < self.grid_height and 0 <= x < self.grid_width:
-                    self.grid[y, x] = Tile.SOIL
+        garden_size = self.GARDEN_SIZE
+        garden = ((center_y - garden_size <= ys) & (ys < center_y + garden_size) &
+                  (center_x - garden_size <= xs) & (xs < center_x + garden_size))
+        tiles[garden] = Tile.SOIL
         
         # Add a path leading to the garden
-        for y in range(center_y + garden_size, self.grid_height):
-            if 0 <= y < self.grid_height:
-                self.grid[y, center_x] = Tile.PATH
+        path = (ys >= center_y + garden_size) & (xs == center_x)
+        tiles[path] = Tile.PATH
+        return tiles
+
+    def on_chunk_evicted(self, key, tiles):
+        self._chunk_cache.pop(key, None)
+
+    def on_chunk_loaded(self, key, tiles):
+        # Moisture kept changing while the chunk was on disk
+        if self.apply_moisture(key, tiles):
+            self.tiles.mark_dirty(key)
+
+    def apply_moisture(self, key, tiles):
+        """
+        Show each soil tile in a chunk as watered or tilled from its moisture
+        Returns True if any tile changed
+        """
+        soil = (tiles == Tile.TILLED_SOIL) | (tiles == Tile.WATERED_SOIL)
+        wet = self.moisture.wet_chunk(key)
+        if wet is None:
+            shown = np.full(tiles.shape, Tile.TILLED_SOIL, dtype=tiles.dtype)
+        else:
+            shown = np.where(wet, Tile.WATERED_SOIL, Tile.TILLED_SOIL).astype(tiles.dtype)
+        changed = soil & (tiles != shown)
+        if not changed.any():
+            return False
+        tiles[changed] = shown[changed]
+        return True
+
+    def is_raining(self, day):
+        """Whether it rains on a day; fixed per day and weather seed"""
+        return bool(self.rain_days(day, 1)[0])
+
+    def rain_days(self, first_day, days):
+        """Bool array of whether it rains on each of a span of days, in one vectorized pass"""
+        seed = mix64(np.array([self.weather_seed % 2 ** 64], dtype=np.uint64))
+        day = np.arange(first_day, first_day + days, dtype=np.uint64)
+        bits = mix64(day * np.uint64(0x9E3779B97F4A7C15) + seed)
+        return (bits >> np.uint64(11)) * (1.0 / 2 ** 53) < RAIN_CHANCE
+
+    def update_residency(self, camera_x, camera_y, view_width, view_height):
+        """Load the chunks around the camera and evict the ones far away from it"""
+        center_x = (camera_x + view_width / 2) / self.tile_size
+        center_y = (camera_y + view_height / 2) / self.tile_size
+        view_chunks = max(view_width, view_height) // (self.tile_size * CHUNK_SIZE) + 1
+        self.tiles.update_residency(center_x, center_y,
+                                    load_radius=view_chunks, keep_radius=view_chunks + 2)
+
+    def close(self):
+        """Release the world's on-disk chunk cache"""
+        self.tiles.close()
 
     def get_tile(self, grid_x, grid_y):
-        if 0 <= grid_y < self.grid_height and 0 <= grid_x < self.grid_width:
-            return self.grid[grid_y, grid_x]
-        return None
+        return self.tiles.get(grid_x, grid_y)
 
     def set_tile(self, grid_x, grid_y, tile_type):
-        if 0 <= grid_y < self.grid_height and 0 <= grid_x < self.grid_width:
-            self.grid[grid_y, grid_x] = tile_type
+        was_walkable = self.collision.is_walkable(grid_x, grid_y)
+        if self.tiles.set(grid_x, grid_y, tile_type):
+            self.collision.update_tile(grid_x, grid_y, tile_type)
+            self.moisture.set_soil(grid_x, grid_y, tile_type in (Tile.TILLED_SOIL, Tile.WATERED_SOIL))
+            self.invalidate_tile(grid_x, grid_y)
+            
+            walkable = self.collision.is_walkable(grid_x, grid_y)
+            if walkable != was_walkable:
+                self.pathfinder.on_tile_changed(grid_x, grid_y, walkable)
+
+    def invalidate_tile(self, grid_x, grid_y):
+        """Drop the cached render of the chunk containing a tile"""
+        self.invalidate_chunk(chunk_key(grid_x, grid_y))
+
+    def invalidate_chunk(self, key):
+        self._chunk_cache.pop(key, None)
+        self.render_changed = True
+
+    def invalidate_all(self):
+        """Drop every cached chunk render"""
+        self._chunk_cache.clear()
+        self.render_changed = True
+
+    def plant_seed(self, grid_x, grid_y, item_type):
+        tile = self.get_tile(grid_x, grid_y)
+        if tile not in (Tile.TILLED_SOIL, Tile.WATERED_SOIL):
+            return False
+        
+        if not self.crops.plant(grid_x, grid_y, Crop.from_seed(item_type), self.day):
+            return False
+        if tile == Tile.WATERED_SOIL:
+            self.crops.water(grid_x, grid_y)
+        self.invalidate_tile(grid_x, grid_y)
+        return True
+
+    def water_tile(self, grid_x, grid_y):
+        if self.get_tile(grid_x, grid_y) != Tile.TILLED_SOIL:
+            return False
+        
+        self.set_tile(grid_x, grid_y, Tile.WATERED_SOIL)
+        self.moisture.water(grid_x, grid_y)
+        self.crops.water(grid_x, grid_y)
+        return True
+
+    def harvest_plant(self, grid_x, grid_y):
+        """Harvest a mature crop and return its produce as an ItemStack, or None"""
+        if self.get_tile(grid_x, grid_y) is None:
+            return None
+        
+        crop = self.crops.harvest(grid_x, grid_y)
+        if crop == Crop.NONE:
+            return None
+        self.invalidate_tile(grid_x, grid_y)
+        return ItemStack(Crop.produce(crop), 1)
+
+    def entities_in_tile(self, grid_x, grid_y):
+        """Return the entities overlapping a tile"""
+        return self.entities.query_rect(grid_x * self.tile_size, grid_y * self.tile_size,
+                                        self.tile_size - 1, self.tile_size - 1)
+
+    def drop_item(self, x, y, stack):
+        """Leave an item stack on the ground at a world pixel position"""
+        pickup = Pickup(x, y, stack)
+        self.entities.insert(pickup, pickup.get_bounds())
+        self.render_changed = True
+        return pickup
+
+    def remove_entity(self, entity):
+        """Take an entity out of the world and let it free what it holds (e.g. sprite slots)"""
+        self.entities.remove(entity)
+        entity.release()
+        self.render_changed = True
+
+    def advance_day(self, days=1):
+        """
+        Start a new day (or several): crops on wet soil grow, moisture spreads
+        and evaporates, and it may rain
+        A span of days is one vectorized pass over all crops: a dry night
+        leaves no soil wet and rain soaks all of it, so after the first day
+        crops are watered exactly on the days after it rained
+        """
+        rain = self.rain_days(self.day + 1, days)
+        self.day += days
+        
+        keys = self.crops.keys
+        watered_days = self.moisture.wet_chunks(keys).astype(np.intp)
+        rained = int(np.count_nonzero(rain[:-1]))
+        if rained:
+            watered_days += rained * self.moisture.soil_chunks(keys)
+        for key in self.crops.grow(watered_days):
+            self.invalidate_chunk(key)
+        
+        self.moisture.advance(rain)
+        
+        # Chunks on disk are updated when they are loaded again
+        for key in self.moisture.keys:
+            tiles = self.tiles.chunks.get(key)
+            if tiles is not None and self.apply_moisture(key, tiles):
+                self.tiles.mark_dirty(key)
+                self.invalidate_chunk(key)
+
+    def fast_forward(self, minutes):
+        """
+        Skip ahead in game time without replaying frames
+        Day rollovers (and any other batched events) run once for the whole span
+        """
+        return self.clock.advance(minutes, batched=True)
+
+    def sleep(self, wake_at=6 * 60):
+        """Fast-forward to the next morning at wake_at minutes past midnight"""
+        minutes = (wake_at - self.clock.time_of_day) % MINUTES_PER_DAY or MINUTES_PER_DAY
+        return self.fast_forward(minutes)
 
     def screen_to_grid(self, screen_x, screen_y):
         grid_x = screen_x // self.tile_size
@@ -65,21 +310,80 @@ class World:
         screen_y = grid_y * self.tile_size
         return screen_x, screen_y
 
-    def draw(self, screen, camera_x=0, camera_y=0):
-        # Draw each tile
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                screen_x = x * self.tile_size - camera_x
-                screen_y = y * self.tile_size - camera_y
-                
-                # Only draw tiles that are visible on screen
-                if (-self.tile_size <= screen_x <= self.width and 
-                    -self.tile_size <= screen_y <= self.height):
-                    tile_type = self.grid[y, x]
-                    color = Tile.get_color(tile_type)
-                    rect = pygame.Rect(screen_x, screen_y, self.tile_size - 1, self.tile_size - 1)
-                    pygame.draw.rect(screen, color, rect)
+    def render_chunk(self, chunk_x, chunk_y):
+        """Render one chunk of tiles into a new surface"""
+        tiles = self.tiles.get_chunk(chunk_x, chunk_y)
+        
+        # Edge chunks only show the part inside the world
+        width = min(self.chunk_size, self.grid_width - chunk_x * self.chunk_size)
+        height = min(self.chunk_size, self.grid_height - chunk_y * self.chunk_size)
+        tiles = tiles[:height, :width]
+        
+        # Expand each tile's color to a tile_size x tile_size block of pixels
+        pixels = self._color_table[tiles]
+        pixels = pixels.repeat(self.tile_size, axis=0).repeat(self.tile_size, axis=1)
+        
+        # Leave a 1px grid line on the right and bottom edge of every tile
+        pixels[self.tile_size - 1::self.tile_size, :] = Tile.GRID_COLOR
+        pixels[:, self.tile_size - 1::self.tile_size] = Tile.GRID_COLOR
+        
+        # surfarray works in (x, y) order
+        surface = pygame.Surface((pixels.shape[1], pixels.shape[0]))
+        pygame.surfarray.blit_array(surface, pixels.transpose(1, 0, 2))
+        
+        # Draw crops on top of their tiles
+        crops = self.crops.get_chunk(chunk_x, chunk_y)
+        if crops is not None:
+            crop_types, growth_stages = crops
+            for y, x in zip(*np.nonzero(crop_types)):
+                self.draw_crop(surface, x, y, crop_types[y, x], growth_stages[y, x])
+        return surface
+
+    def draw_crop(self, surface, local_x, local_y, crop, stage):
+        final_stage = Crop.GROWTH_DAYS[crop]
+        
+        # Crops show as sprouts until they are ready to harvest
+        color = Crop.COLORS[crop] if stage >= final_stage else Crop.SPROUT_COLOR
+        radius = 3 + (self.tile_size // 2 - 5) * stage // max(1, final_stage)
+        center = (local_x * self.tile_size + self.tile_size // 2,
+                  local_y * self.tile_size + self.tile_size // 2)
+        pygame.draw.circle(surface, color, center, radius)
+
+    def get_chunk_surface(self, chunk_x, chunk_y):
+        surface = self._chunk_cache.get((chunk_x, chunk_y))
+        if surface is None:
+            surface = self.render_chunk(chunk_x, chunk_y)
+            self._chunk_cache[(chunk_x, chunk_y)] = surface
+        return surface
+
+    def draw(self, screen, camera_x=0, camera_y=0, rects=None):
+        """
+        Draw the chunks in view
+        rects: Screen rects to draw into (default: the whole screen)
+        """
+        if rects is None:
+            rects = [screen.get_rect()]
+        chunk_pixels = self.chunk_size * self.tile_size
+        last_chunk_x = (self.grid_width - 1) // self.chunk_size
+        last_chunk_y = (self.grid_height - 1) // self.chunk_size
+        
+        blits = []
+        for rect in rects:
+            # Work out which chunks intersect this part of the view
+            first_x = max(0, (camera_x + rect.left) // chunk_pixels)
+            first_y = max(0, (camera_y + rect.top) // chunk_pixels)
+            last_x = min(last_chunk_x, (camera_x + rect.right - 1) // chunk_pixels)
+            last_y = min(last_chunk_y, (camera_y + rect.bottom - 1) // chunk_pixels)
+            
+            # Blit only the part of each chunk inside the rect
+            for chunk_y in range(first_y, last_y + 1):
+                for chunk_x in range(first_x, last_x + 1):
+                    surface = self.get_chunk_surface(chunk_x, chunk_y)
+                    chunk_rect = surface.get_rect(topleft=(chunk_x * chunk_pixels - camera_x,
+                                                           chunk_y * chunk_pixels - camera_y))
+                    part = chunk_rect.clip(rect)
+                    blits.append((surface, part, part.move(-chunk_rect.x, -chunk_rect.y)))
+        screen.blits(blits, doreturn=False)
 
     def is_walkable(self, grid_x, grid_y):
-        tile = self.get_tile(grid_x, grid_y)
-        return tile is not None  # For now, all tiles are walkable 
\ No newline at end of file
+        return self.collision.is_walkable(grid_x, grid_y)
@@ -1,81 +1,180 @@
-import pygame
 import sys
-from screens.title_screen import TitleScreen
-from screens.game_screen import GameScreen
+from game.startup import timeline
 
-# Initialize Pygame
-pygame.init()
+with timeline.phase("import pygame"):
+    import pygame
 
 # Constants
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 TILE_SIZE = 32
 
+# World size in tiles unless --world-size is given: one window
+WORLD_SIZE = (WINDOW_WIDTH // TILE_SIZE, WINDOW_HEIGHT // TILE_SIZE)
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 GREEN = (34, 139, 34)
 
-# Set up the display
-screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-pygame.display.set_caption("Plant Daddy")
-clock = pygame.time.Clock()
+def init_display():
+    """Initialize Pygame and open the game window"""
+    with timeline.phase("pygame.init"):
+        pygame.init()
+    
+    # Set up the display
+    with timeline.phase("open display"):
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        pygame.display.set_caption("Plant Daddy")
+    return screen
 
 class GameState:
-    def __init__(self, screen):
+    def __init__(self, screen, startup_report=False, record_path=None, world_size=WORLD_SIZE):
         self.screen = screen
+        self.world_size = world_size
         self.state = "title"
-        self.title_screen = TitleScreen(screen)
+        self.clock = pygame.time.Clock()
+        self.startup_report = startup_report
+        self.first_frame_shown = False
+        
+        # Only the title screen is needed up front; the game itself (and
+        # numpy, the world and sprites) is imported when the player starts
+        with timeline.phase("build title screen"):
+            from screens.title_screen import TitleScreen
+            self.title_screen = TitleScreen(screen)
         self.game_screen = None  # Initialize when needed
+        
+        # Input is recorded from the start of the game screen, so a
+        # recording can be replayed against a fresh GameScreen (see bench.py)
+        self.record_path = record_path
+        self.recorder = None
+
+    def create_game_screen(self):
+        with timeline.phase("import game modules"):
+            from screens.game_screen import GameScreen
+        with timeline.phase("build game screen"):
+            return GameScreen(self.screen, self.world_size)
 
     def run(self):
-        while True:
-            if self.state == "title":
-                self.run_title_screen()
-            elif self.state == "game":
-                if self.game_screen is None:
-                    self.game_screen = GameScreen(screen)
-                self.run_game()
+        # The recording is closed however the game ends, so it stays replayable
+        try:
+            while True:
+                if self.state == "title":
+                    self.run_title_screen()
+                elif self.state == "game":
+                    if self.game_screen is None:
+                        self.game_screen = self.create_game_screen()
+                        if self.record_path:
+                            self.start_recording()
+                    self.run_game()
+        finally:
+            self.stop_recording()
+
+    def start_recording(self):
+        from game.replay import InputRecorder
+        world = self.game_screen.world
+        self.recorder = InputRecorder(self.record_path, (world.grid_width, world.grid_height))
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            print(f"Recorded {self.recorder.frames} frames to {self.record_path}")
+            self.recorder = None
+
+    def quit(self):
+        pygame.quit()
+        sys.exit()
 
     def run_title_screen(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                self.quit()
             
             # Handle title screen events
             new_state = self.title_screen.handle_event(event)
             if new_state != self.state:
                 self.state = new_state
+                if self.game_screen is not None:
+                    self.game_screen.dirty.invalidate()
 
         # Draw title screen
-        self.title_screen.draw()
-        pygame.display.flip()
-        clock.tick(60)
+        self.title_screen.present()
+        if not self.first_frame_shown:
+            self.first_frame_shown = True
+            timeline.mark("first title frame")
+            if self.startup_report:
+                print(timeline.report())
+        self.clock.tick(60)
 
     def run_game(self):
+        from game.profiler import profiler
+        profiler.begin_frame()
+        
         # Handle game events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            
-            # Handle game screen events
-            new_state = self.game_screen.handle_event(event)
-            if new_state != self.state:
-                self.state = new_state
-                return
+        handled = []
+        with profiler.section("events"):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.quit()
+                
+                # Handle game screen events
+                handled.append(event)
+                new_state = self.game_screen.handle_event(event)
+                if new_state != self.state:
+                    self.state = new_state
+                    self.title_screen.dirty.invalidate()
+                    
+                    # Still record the frame so the events that led here replay
+                    if self.recorder is not None:
+                        self.recorder.record(0, pygame.key.get_pressed(), handled)
+                    break
+        if self.state != "game":
+            profiler.end_frame()
+            return
 
         # Update game state
-        self.game_screen.update()
+        keys = pygame.key.get_pressed()
+        self.game_screen.update(keys)
+        if self.recorder is not None:
+            self.recorder.record(self.game_screen.frame_ms, keys, handled)
         
         # Draw game screen
         self.game_screen.draw()
-        clock.tick(60)
+        profiler.end_frame()
+        self.clock.tick(60)
+
+def option_value(name):
+    """Return the argument following name on the command line, or None if name is absent"""
+    if name not in sys.argv[1:]:
+        return None
+    index = sys.argv.index(name)
+    if index + 1 >= len(sys.argv):
+        sys.exit(f"{name} needs a value")
+    return sys.argv[index + 1]
+
+def parse_world_size(value):
+    """Parse a COLUMNSxROWS world size in tiles, e.g. 10000x10000"""
+    try:
+        columns, rows = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        sys.exit(f"Invalid world size {value!r}, expected COLUMNSxROWS")
+    if columns < 1 or rows < 1:
+        sys.exit(f"Invalid world size {value!r}, expected COLUMNSxROWS")
+    return columns, rows
 
 def main():
-    game_state = GameState(screen)
+    # --startup-report prints how long each startup phase took
+    startup_report = "--startup-report" in sys.argv[1:]
+    
+    # --record PATH logs the game's input to PATH for replaying with bench.py
+    record_path = option_value("--record")
+    
+    # --world-size COLUMNSxROWS sets the map size in tiles (default: one window)
+    world_size = option_value("--world-size")
+    world_size = WORLD_SIZE if world_size is None else parse_world_size(world_size)
+    screen = init_display()
+    game_state = GameState(screen, startup_report, record_path, world_size)
     game_state.run()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
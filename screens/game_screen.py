@@ -1,11 +1,23 @@
+import os
+import time
 import pygame
 from game.world import World
 from game.player import Player
-from game.ui import ToolBar, StatusPanel
+from game.ui import ToolBar, StatusPanel, InventoryPanel, ProfilerOverlay
+from game.save import save_game, load_game, SaveError
+from game.clock import FixedStepClock, GAME_MINUTES_PER_MS, lerp
+from game.dirty import DirtyRegions
+from game.animation import animator
+from game.profiler import profiler
+
+SAVE_PATH = os.path.join("saves", "quicksave.pdsave")
 
 class GameScreen:
-    def __init__(self, screen):
-        """Initialize the game screen with all necessary components"""
+    def __init__(self, screen, world_size):
+        """
+        Initialize the game screen with all necessary components
+        world_size: (columns, rows) of the world in tiles
+        """
         if not isinstance(screen, pygame.Surface):
             raise TypeError("screen must be a pygame.Surface")
             
@@ -15,26 +27,46 @@ class GameScreen:
         
         # Initialize world and player
         self.tile_size = 32
-        self.world = World(self.width, self.height, self.tile_size)
+        self.world = World(world_size[0] * self.tile_size, world_size[1] * self.tile_size,
+                           self.tile_size)
         
-        # Place player at the bottom center of the screen in pixel coordinates
+        # Place player on the path just below the garden, in pixel coordinates
         start_x = (self.world.grid_width // 2) * self.tile_size
-        start_y = (self.world.grid_height - 2) * self.tile_size  # 2 tiles from bottom
+        start_y = min(self.world.grid_height - 2,
+                      self.world.grid_height // 2 + World.GARDEN_SIZE + 2) * self.tile_size
         self.player = Player(start_x, start_y, self.world)
         
-        # Camera position (in pixels)
+        # Camera position (in pixels), now and at the start of the last tick
         self.camera_x = 0
         self.camera_y = 0
+        self.prev_camera_x = 0
+        self.prev_camera_y = 0
         
         # UI elements
         self.toolbar = ToolBar(self.width, self.height)
         self.status_panel = StatusPanel(self.width)
+        self.status_panel.clock = self.world.clock
+        self.inventory_panel = InventoryPanel(self.width, self.height)
         
-        # Game clock for time tracking
+        # Game clock for time tracking; the simulation runs in fixed ticks
         self.last_update = pygame.time.get_ticks()
+        self.frame_ms = 0
+        self.elapsed_ms = 0.0
+        self.clock = FixedStepClock()
         
-        # Debug mode
+        # Debug mode shows per-subsystem frame timings
         self.debug = False
+        self.profiler_overlay = ProfilerOverlay(self.width)
+        self.debug_rect = self.profiler_overlay.get_rect()
+        
+        # Only the parts of the screen that changed are pushed to the display
+        self.dirty = DirtyRegions()
+        self.last_drawn = None
+        
+        # Where F5 saves to and F9 loads from; loading catches the world up
+        # on the real time passed since the save was written
+        self.save_path = SAVE_PATH
+        self.catch_up = True
 
     def update_camera(self):
         """Update camera position to follow the player with smooth movement"""
@@ -62,6 +94,34 @@ class GameScreen:
             self.camera_x = max(0, min(self.player.x - self.width // 2, max_camera_x))
             self.camera_y = max(0, min(self.player.y - self.height // 2, max_camera_y))
 
+    def save_game(self, path=SAVE_PATH):
+        start = time.perf_counter()
+        save_game(path, self.world, self.player, self.status_panel)
+        print(f"Saved game to {path} in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def load_game(self, path=SAVE_PATH):
+        if not os.path.exists(path):
+            print(f"No save file at {path}")
+            return False
+        
+        start = time.perf_counter()
+        old_world = self.world
+        try:
+            self.world = load_game(path, self.player, self.status_panel, self.catch_up)
+        except SaveError as e:
+            print(f"Load error: {e}")
+            return False
+        old_world.close()
+        self.status_panel.clock = self.world.clock
+        
+        self.toolbar.selected_slot = self.toolbar.slots.index(self.player.selected_tool)
+        self.camera_x = self.prev_camera_x = self.player.x - self.width // 2
+        self.camera_y = self.prev_camera_y = self.player.y - self.height // 2
+        self.player.prev_x, self.player.prev_y = self.player.x, self.player.y
+        self.dirty.invalidate()
+        print(f"Loaded game from {path} in {(time.perf_counter() - start) * 1000:.1f} ms")
+        return True
+
     def handle_event(self, event):
         """Handle all game events including debug commands"""
         try:
@@ -70,6 +130,22 @@ class GameScreen:
                     return "title"
                 elif event.key == pygame.K_F3:  # Toggle debug mode
                     self.debug = not self.debug
+                    self.dirty.add(self.debug_rect)
+                elif event.key == pygame.K_F4:  # Profile the next 120 frames
+                    if profiler.start_capture():
+                        print("Capturing cProfile for 120 frames")
+                elif event.key == pygame.K_F6:  # Export recent frame timings
+                    for path in profiler.export():
+                        print(f"Wrote {path}")
+                elif event.key == pygame.K_e:  # Toggle inventory
+                    self.inventory_panel.visible = not self.inventory_panel.visible
+                    self.dirty.add(self.inventory_panel.get_rect())
+                elif event.key == pygame.K_F5:  # Quicksave
+                    self.save_game(self.save_path)
+                elif event.key == pygame.K_F9:  # Quickload
+                    self.load_game(self.save_path)
+                elif event.key == pygame.K_z:  # Sleep until morning
+                    self.world.sleep()
             
             # Handle toolbar events
             if self.toolbar.handle_event(event):
@@ -84,57 +160,147 @@ class GameScreen:
             
         return "game"
 
-    def update(self):
-        """Update game state including player, camera, and UI"""
+    def update(self, keys=None, frame_ms=None):
+        """
+        Update game state including player, camera, and UI
+        Runs as many fixed simulation ticks as the elapsed frame time covers
+        keys: Keyboard state to use instead of pygame.key.get_pressed()
+        frame_ms: Frame time to simulate instead of the measured real time
+        """
         try:
             current_time = pygame.time.get_ticks()
-            dt = current_time - self.last_update
+            if frame_ms is None:
+                frame_ms = current_time - self.last_update
             self.last_update = current_time
             
+            # Everything below runs off this game-side time rather than the
+            # real clock, so a given sequence of frame times always plays out the same
+            self.frame_ms = frame_ms
+            self.elapsed_ms += frame_ms
+            
             # Get keyboard state
-            keys = pygame.key.get_pressed()
+            if keys is None:
+                keys = pygame.key.get_pressed()
             
-            # Update components
-            self.player.update(dt, keys)
-            self.update_camera()
-            self.status_panel.update(dt)
+            with profiler.section("update"):
+                for _ in range(self.clock.advance(frame_ms)):
+                    self.tick(keys, self.clock.step_ms)
+                self.world.update_residency(self.camera_x, self.camera_y, self.width, self.height)
             
         except Exception as e:
             print(f"Update error: {e}")
 
+    def tick(self, keys, dt):
+        """Advance the simulation by one fixed step of dt milliseconds"""
+        self.prev_camera_x = self.camera_x
+        self.prev_camera_y = self.camera_y
+        
+        # Update components
+        with profiler.section("player"):
+            self.player.update(dt, keys)
+        with profiler.section("camera"):
+            self.update_camera()
+        
+        # Run whatever game-time events fall due this tick (day rollover, ...)
+        with profiler.section("clock"):
+            self.world.clock.advance(dt * GAME_MINUTES_PER_MS)
+
+    def collect_dirty_rects(self, camera_x, camera_y, alpha):
+        """Work out which parts of the screen changed since the last frame"""
+        player_rect = self.player.get_draw_rect(camera_x, camera_y, alpha)
+        drawn = {
+            'camera': (camera_x, camera_y),
+            'player': player_rect,
+            'toolbar': self.toolbar.selected_slot,
+            'status': self.status_panel.display_state(),
+            'inventory': self.inventory_panel.visible and self.player.inventory.version,
+            'lighting': self.world.lighting.state(camera_x, camera_y, self.world.clock.time_of_day),
+        }
+        last = self.last_drawn
+        self.last_drawn = drawn
+        
+        # A scrolling camera, new lighting or a changed world affects every pixel
+        if (last is None or last['camera'] != drawn['camera'] or
+                last['lighting'] != drawn['lighting'] or self.world.render_changed):
+            self.dirty.invalidate()
+            return
+        
+        # The sprite animates even when standing still
+        self.dirty.add(last['player'])
+        self.dirty.add(player_rect)
+        if last['toolbar'] != drawn['toolbar']:
+            self.dirty.add(self.toolbar.get_rect())
+        if last['status'] != drawn['status']:
+            self.dirty.add(self.status_panel.get_rect())
+        if self.debug:
+            self.dirty.add(self.debug_rect)
+        if last['inventory'] != drawn['inventory']:
+            self.dirty.add(self.inventory_panel.get_rect())
+
     def draw(self):
-        """Draw all game elements including debug information if enabled"""
+        """Draw the game, pushing only the changed parts of the screen to the display"""
         try:
-            # Clear screen
-            self.screen.fill((100, 100, 100))
-            
-            # Draw world
-            self.world.draw(self.screen, int(self.camera_x), int(self.camera_y))
-            
-            # Draw player
-            self.player.draw(self.screen, int(self.camera_x), int(self.camera_y))
+            # Interpolate between the last two simulation ticks
+            alpha = self.clock.alpha
+            camera_x = int(lerp(self.prev_camera_x, self.camera_x, alpha))
+            camera_y = int(lerp(self.prev_camera_y, self.camera_y, alpha))
             
-            # Draw UI elements
-            self.toolbar.draw(self.screen)
-            self.status_panel.draw(self.screen)
+            self.collect_dirty_rects(camera_x, camera_y, alpha)
+            self.world.render_changed = False
             
-            # Draw debug information
-            if self.debug:
-                debug_font = pygame.font.Font(None, 24)
-                debug_info = [
-                    f"FPS: {int(1000 / max(1, pygame.time.get_ticks() - self.last_update))}",
-                    f"Player Pos: ({int(self.player.x)}, {int(self.player.y)})",
-                    f"Camera Pos: ({int(self.camera_x)}, {int(self.camera_y)})",
-                    f"Selected Tool: {self.player.selected_tool}"
-                ]
-                
-                for i, text in enumerate(debug_info):
-                    surface = debug_font.render(text, True, (255, 255, 255))
-                    self.screen.blit(surface, (10, self.height - 100 + i * 20))
+            # Advance every animation at once
+            animator.update(self.elapsed_ms)
             
-            pygame.display.flip()
+            with profiler.section("draw"):
+                self.dirty.present(self.screen, lambda rects: self.draw_scene(camera_x, camera_y, alpha, rects))
             
         except Exception as e:
             print(f"Draw error: {e}")
-            # Attempt to recover by flipping the display
-            pygame.display.flip() 
\ No newline at end of file
+            # Attempt to recover by redrawing everything next frame
+            self.screen.set_clip(None)
+            self.dirty.invalidate()
+
+    def draw_scene(self, camera_x, camera_y, alpha, rects):
+        """
+        Draw all game elements including debug information if enabled
+        rects: Screen rects being repainted; the full-screen layers only touch these
+        """
+        # Clear screen
+        for rect in rects:
+            self.screen.fill((100, 100, 100), rect)
+        
+        # Draw world
+        with profiler.section("world"):
+            self.world.draw(self.screen, camera_x, camera_y, rects)
+        
+        # Draw the entities in view, then the player on top
+        with profiler.section("entities"):
+            visible = self.world.entities.query_rect(camera_x, camera_y, self.width, self.height)
+            for entity in sorted(visible, key=lambda entity: entity.y):
+                if entity is not self.player:
+                    entity.draw(self.screen, camera_x, camera_y)
+        
+        # Draw player
+        with profiler.section("player draw"):
+            self.player.draw(self.screen, camera_x, camera_y, alpha)
+        
+        # Tint the scene for the time of day (the UI stays untinted)
+        with profiler.section("lighting"):
+            self.world.lighting.draw(self.screen, camera_x, camera_y, self.world.clock.time_of_day,
+                                     rects)
+        
+        # Draw UI elements
+        with profiler.section("ui"):
+            self.toolbar.draw(self.screen)
+            self.status_panel.draw(self.screen)
+            self.inventory_panel.draw(self.screen, self.player.inventory.slots)
+        
+        # Draw debug information
+        if self.debug:
+            debug_info = [
+                f"Player Pos: ({int(self.player.x)}, {int(self.player.y)})",
+                f"Camera Pos: ({int(self.camera_x)}, {int(self.camera_y)})",
+                f"Selected Tool: {self.player.selected_tool}",
+                "F4: capture cProfile   F6: export timings",
+            ]
+            self.profiler_overlay.draw(self.screen, profiler, debug_info)
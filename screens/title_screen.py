@@ -1,6 +1,8 @@
 import pygame
 import sys
 import os
+from game.dirty import DirtyRegions
+from game.text import get_font, text_cache
 
 class Button:
     def __init__(self, x, y, width, height, text, color, hover_color):
@@ -9,14 +11,14 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.is_hovered = False
-        self.font = pygame.font.Font(None, 50)
+        self.font = get_font(50)
 
     def draw(self, screen):
         color = self.hover_color if self.is_hovered else self.color
         pygame.draw.rect(screen, color, self.rect, border_radius=12)
         pygame.draw.rect(screen, (0, 0, 0), self.rect, 2, border_radius=12)
         
-        text_surface = self.font.render(self.text, True, (0, 0, 0))
+        text_surface = text_cache.render(self.font, self.text, (0, 0, 0))
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -61,11 +63,22 @@ class TitleScreen:
         )
         
         # Title text
-        self.title_font = pygame.font.Font(None, 100)
+        self.title_font = get_font(100)
         self.title_text = self.title_font.render("Plant Daddy", True, (0, 0, 0))
         self.title_rect = self.title_text.get_rect(
             center=(self.width // 2, self.height * 0.3)
         )
+        
+        # The title screen is static apart from the button hover state
+        self.dirty = DirtyRegions()
+        self.button_hovered = self.start_button.is_hovered
+
+    def present(self):
+        """Redraw whatever changed and push it to the display"""
+        if self.start_button.is_hovered != self.button_hovered:
+            self.button_hovered = self.start_button.is_hovered
+            self.dirty.add(self.start_button.rect)
+        self.dirty.present(self.screen, lambda rects: self.draw())
 
     def draw(self):
         if self.background:
@@ -77,9 +90,9 @@ class TitleScreen:
         # Add semi-transparent overlay
         self.screen.blit(self.overlay, (0, 0))
         
-        # Draw title with shadow effect
+        # Draw title with shadow effect (the shadow is the same black text)
         shadow_offset = 3
-        shadow_text = self.title_font.render("Plant Daddy", True, (0, 0, 0))
+        shadow_text = self.title_text
         shadow_rect = self.title_rect.copy()
         shadow_rect.x += shadow_offset
         shadow_rect.y += shadow_offset
@@ -0,0 +1,85 @@
+import os
+import pytest
+from game.animation import Animator, ClipTable
+from game.items import Items, ItemStack
+from game.world import World
+
+@pytest.fixture
+def clips():
+    clips = ClipTable()
+    clips.register("walk", frame_count=4, frame_duration=100)
+    clips.register("swing", frame_count=3, frame_duration=50, loop=False)
+    return clips
+
+def test_register_returns_existing_id(clips):
+    assert clips.register("walk", 4, 100) == 0
+    assert clips.register("other", 2, 10) == 2
+
+def test_looping_and_held_clips(clips):
+    animator = Animator(clips)
+    walk = animator.add(0, start=0)
+    swing = animator.add(1, start=0)
+    animator.update(450)
+    assert animator.frame(walk) == 0   # 4 frames of 100 ms wrap around
+    assert animator.frame(swing) == 2  # holds its last frame
+    animator.update(250)
+    assert animator.frame(walk) == 2
+
+def test_pending_slots_start_at_next_update(clips):
+    animator = Animator(clips)
+    slot = animator.add(0)
+    animator.update(1000)
+    assert animator.frame(slot) == 0
+    animator.update(1100)
+    assert animator.frame(slot) == 1
+
+def test_speed_scales_playback(clips):
+    animator = Animator(clips)
+    slot = animator.add(0, start=0, speed=2.0)
+    animator.update(100)
+    assert animator.frame(slot) == 2
+
+def test_slots_are_reused_and_grow(clips):
+    animator = Animator(clips, capacity=2)
+    first = animator.add(0)
+    animator.add(0)
+    animator.remove(first)
+    assert animator.add(1) == first
+    animator.add(0)
+    assert len(animator.clip) == 4
+
+class Tracked:
+    def __init__(self):
+        self.released = 0
+
+    def get_bounds(self):
+        return (0, 0, 10, 10)
+
+    def release(self):
+        self.released += 1
+
+def test_removing_an_entity_releases_it():
+    world = World(10 * 32, 10 * 32, 32)
+    entity = Tracked()
+    world.entities.insert(entity, entity.get_bounds())
+    world.remove_entity(entity)
+    assert entity.released == 1
+    assert entity not in world.entities
+    
+    pickup = world.drop_item(16, 16, ItemStack(Items.CARROT, 1))
+    world.remove_entity(pickup)
+    assert len(world.entities) == 0
+
+@pytest.mark.skipif(not os.path.exists(os.path.join("assets", "sprites", "character.png")),
+                    reason="sprite sheet not built (python -m tools.build_assets)")
+def test_sprite_release_frees_its_slot():
+    from game.animation import animator
+    from game.sprites import CharacterSprite
+    sprite = CharacterSprite()
+    slot = sprite.slot
+    assert animator.active[slot]
+    sprite.release()
+    sprite.release()
+    assert sprite.slot is None
+    assert not animator.active[slot]
+    assert animator.free.count(slot) == 1
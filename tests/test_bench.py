@@ -0,0 +1,27 @@
+import pygame
+import pytest
+import bench
+
+@pytest.fixture
+def display():
+    pygame.init()
+    yield
+    pygame.display.quit()
+
+def test_run_benchmark_measures_frames_after_warmup(display):
+    results = bench.run_benchmark(frames=12, warmup=3)
+    assert results['frames'] == 12
+    assert len(results['samples']['update_ms']) == len(results['samples']['draw_ms']) == 12
+    assert results['replay'] is None
+    for name in ('update', 'draw', 'frame'):
+        stats = results[name]
+        assert 0.0 <= stats['p50_ms'] <= stats['p95_ms'] <= stats['max_ms']
+    assert {'update', 'draw', 'world'} <= set(results['sections'])
+
+def test_scripted_input_is_fixed():
+    frames = list(bench.scripted_input(200))
+    assert len(frames) == 200
+    assert all(frame_ms == bench.FRAME_MS for frame_ms, _, _ in frames)
+    pressed = [event.key for _, _, events in frames for event in events]
+    assert pressed == [event.key for _, _, events in bench.scripted_input(200) for event in events]
+    assert pygame.K_SPACE in pressed
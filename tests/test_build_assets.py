@@ -0,0 +1,37 @@
+import json
+import pytest
+from game.atlas import Atlas
+from tools import build_assets, icon_generator
+
+@pytest.fixture
+def atlas_paths(tmp_path, monkeypatch):
+    image_path = str(tmp_path / "icons.png")
+    manifest_path = str(tmp_path / "icons.json")
+    monkeypatch.setattr(build_assets, "ICON_ATLAS_PATH", image_path)
+    monkeypatch.setattr(build_assets, "ICON_MANIFEST_PATH", manifest_path)
+    return image_path, manifest_path
+
+def test_icon_atlas_holds_tools_and_items(atlas_paths):
+    assert build_assets.build_icon_atlas()
+    atlas = Atlas.load(*atlas_paths)
+    assert "tool/hoe" in atlas.rects
+    assert "item/carrot_seeds" in atlas.rects
+    assert atlas.surface.get_size() != (1, 1)
+
+def test_unchanged_icon_atlas_is_not_redrawn(atlas_paths, monkeypatch):
+    assert build_assets.build_icon_atlas()
+    
+    def fail(items):
+        raise AssertionError("icons were redrawn")
+    monkeypatch.setattr(icon_generator, "create_icons", fail)
+    assert not build_assets.build_icon_atlas()
+
+def test_changed_inputs_rebuild_icon_atlas(atlas_paths):
+    assert build_assets.build_icon_atlas()
+    with open(atlas_paths[1]) as f:
+        manifest = json.load(f)
+    manifest['inputs_sha1'] = "stale"
+    with open(atlas_paths[1], "w") as f:
+        json.dump(manifest, f)
+    assert build_assets.build_icon_atlas()
+    assert build_assets.build_icon_atlas(force=True)
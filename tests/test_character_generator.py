@@ -0,0 +1,57 @@
+import json
+import pygame
+import pytest
+from tools import character_generator
+from tools.character_generator import DIRECTIONS, STATES, create_sprite_sheet
+
+ANIMATIONS = len(STATES) * len(DIRECTIONS)
+
+@pytest.fixture(scope="module")
+def build():
+    return create_sprite_sheet(jobs=1)
+
+def same_pixels(a, b):
+    return pygame.image.tobytes(a, "RGBA") == pygame.image.tobytes(b, "RGBA")
+
+def test_first_build_draws_every_animation(build):
+    sheet, manifest, rebuilt = build
+    assert len(rebuilt) == len(manifest['animations']) == ANIMATIONS
+    assert manifest['animations']['walk/left']['frames'] == 4
+    assert manifest['animations']['hoe/up']['frames'] == 3
+
+def test_unchanged_build_copies_everything(build):
+    sheet, manifest, _ = build
+    again, again_manifest, rebuilt = create_sprite_sheet(sheet, manifest, jobs=1)
+    assert rebuilt == []
+    assert again_manifest == manifest
+    assert same_pixels(again, sheet)
+
+def test_only_changed_animations_are_redrawn(build):
+    sheet, manifest, _ = build
+    stale = json.loads(json.dumps(manifest))
+    stale['animations']['hoe/left']['hash'] = "0" * 40
+    damaged = sheet.copy()
+    x, y, width, height = manifest['animations']['hoe/left']['rect']
+    damaged.fill((255, 0, 255, 255), (x, y, width, height))
+    
+    rebuilt_sheet, _, rebuilt = create_sprite_sheet(damaged, stale, jobs=1)
+    assert rebuilt == ['hoe/left']
+    assert same_pixels(rebuilt_sheet, sheet)
+
+def test_parallel_build_matches_serial(build):
+    sheet, manifest, _ = build
+    stale = json.loads(json.dumps(manifest))
+    for name in ('idle/down', 'water/right', 'harvest/up'):
+        stale['animations'][name]['hash'] = ""
+    parallel, _, rebuilt = create_sprite_sheet(sheet, stale, jobs=2)
+    assert sorted(rebuilt) == ['harvest/up', 'idle/down', 'water/right']
+    assert same_pixels(parallel, sheet)
+
+def test_main_skips_an_up_to_date_sheet(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(character_generator, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(character_generator, "SHEET_PATH", str(tmp_path / "character.png"))
+    monkeypatch.setattr(character_generator, "MANIFEST_PATH", str(tmp_path / "character.json"))
+    character_generator.main(["--jobs", "1"])
+    assert f"{ANIMATIONS} of {ANIMATIONS} animations redrawn" in capsys.readouterr().out
+    character_generator.main(["--jobs", "1"])
+    assert "is up to date" in capsys.readouterr().out
@@ -0,0 +1,61 @@
+import os
+import numpy as np
+from game.chunks import CHUNK_SIZE, ChunkStore, chunk_key
+from game.world import World, Tile
+
+def checkerboard(chunk_x, chunk_y):
+    return np.full((CHUNK_SIZE, CHUNK_SIZE), (chunk_x + chunk_y) % 2, dtype=np.uint8)
+
+def test_chunks_are_generated_on_first_access():
+    store = ChunkStore(10000, 10000, checkerboard)
+    assert store.get(0, 0) == 0
+    assert store.get(CHUNK_SIZE, 0) == 1
+    assert store.get(-1, 0) is None
+    assert store.get(10000, 0) is None
+    assert set(store.chunks) == {(0, 0), (1, 0)}
+
+def test_set_marks_chunk_dirty_and_modified():
+    store = ChunkStore(64, 64, checkerboard)
+    assert store.set(3, 4, 7)
+    assert not store.set(3, 4, 7)
+    assert store.get(3, 4) == 7
+    assert store.dirty == {(0, 0)}
+    assert store.modified == {(0, 0)}
+
+def test_evicted_chunks_are_written_to_disk_and_read_back():
+    store = ChunkStore(256, 256, checkerboard)
+    store.set(5, 5, 9)
+    store.get(200, 200)
+    evicted = store.update_residency(200, 200, load_radius=1, keep_radius=1)
+    assert (0, 0) in evicted
+    assert (0, 0) not in store.chunks
+    assert store.get(5, 5) == 9
+
+def test_close_removes_temporary_cache():
+    store = ChunkStore(256, 256, checkerboard)
+    store.set(5, 5, 9)
+    store.evict((0, 0))
+    cache_dir = store.cache_dir
+    assert os.listdir(cache_dir)
+    store.close()
+    assert not os.path.exists(cache_dir)
+
+def test_close_keeps_given_cache_dir(tmp_path):
+    store = ChunkStore(256, 256, checkerboard, cache_dir=str(tmp_path))
+    store.set(5, 5, 9)
+    store.evict((0, 0))
+    store.close()
+    assert os.listdir(tmp_path)
+
+def test_get_region_spans_chunks():
+    store = ChunkStore(64, 64, checkerboard)
+    region = store.get_region(CHUNK_SIZE - 2, 0, 4, 2)
+    assert region.tolist() == [[0, 0, 1, 1], [0, 0, 1, 1]]
+
+def test_large_world_only_builds_visited_chunks():
+    world = World(10000 * 32, 10000 * 32, 32)
+    world.set_tile(9999, 9999, Tile.PATH)
+    assert world.get_tile(9999, 9999) == Tile.PATH
+    assert world.is_walkable(9999, 9999)
+    assert set(world.tiles.chunks) == {chunk_key(9999, 9999)}
+    world.close()
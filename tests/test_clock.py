@@ -0,0 +1,79 @@
+import pytest
+from game.clock import FixedStepClock, GameClock, MINUTES_PER_DAY, lerp
+
+def test_fixed_step_clock_hands_out_whole_ticks():
+    clock = FixedStepClock(step_ms=10)
+    assert clock.advance(25) == 2
+    assert clock.alpha == pytest.approx(0.5)
+    assert clock.advance(5) == 1
+    assert clock.alpha == pytest.approx(0.0)
+    assert clock.ticks == 3
+
+def test_tick_count_does_not_depend_on_frame_rate():
+    fast = FixedStepClock(step_ms=10)
+    slow = FixedStepClock(step_ms=10)
+    fast_ticks = sum(fast.advance(4) for _ in range(250))
+    slow_ticks = sum(slow.advance(25) for _ in range(40))
+    assert fast_ticks == slow_ticks == 100
+
+def test_long_stalls_are_capped():
+    clock = FixedStepClock(step_ms=10, max_steps=8)
+    assert clock.advance(1000) == 8
+    assert clock.accumulator == 0.0
+
+def test_lerp():
+    assert lerp(10, 20, 0.25) == 12.5
+
+def test_game_clock_day_and_time():
+    clock = GameClock(MINUTES_PER_DAY + 90)
+    assert clock.day == 2
+    assert clock.time_of_day == 90
+
+def test_events_run_in_time_order_and_see_their_due_time():
+    clock = GameClock()
+    seen = []
+    clock.schedule_at(30, lambda: seen.append(("b", clock.minutes)))
+    clock.schedule_at(10, lambda: seen.append(("a", clock.minutes)))
+    clock.schedule_at(30, lambda: seen.append(("c", clock.minutes)))
+    clock.schedule_at(100, lambda: seen.append(("d", clock.minutes)))
+    assert clock.advance(50) == 3
+    assert seen == [("a", 10), ("b", 30), ("c", 30)]
+    assert clock.minutes == 50
+    assert clock.next_due() == 100
+
+def test_cancelled_events_do_not_run():
+    clock = GameClock()
+    seen = []
+    event = clock.schedule_in(5, lambda: seen.append(1), interval=5)
+    clock.advance(12)
+    event.cancel()
+    clock.advance(100)
+    assert seen == [1, 1]
+    assert clock.next_due() is None
+
+def test_every_day_runs_at_time_of_day():
+    clock = GameClock(8 * 60)
+    days = []
+    clock.every_day(lambda: days.append(clock.day), at=6 * 60)
+    clock.advance(3 * MINUTES_PER_DAY)
+    assert days == [2, 3, 4]
+
+def test_batched_advance_runs_repeats_at_once():
+    clock = GameClock()
+    calls = []
+    batches = []
+    clock.schedule_at(10, lambda: calls.append(clock.minutes), interval=10,
+                      batch=lambda count: batches.append((count, clock.minutes)))
+    assert clock.advance(55, batched=True) == 1
+    assert batches == [(5, 50)]
+    assert calls == []
+    clock.advance(10)
+    assert calls == [60]
+
+def test_reset_skips_missed_occurrences():
+    clock = GameClock()
+    seen = []
+    clock.every_day(lambda: seen.append(clock.day))
+    clock.reset(5 * MINUTES_PER_DAY + 30)
+    assert seen == []
+    assert clock.next_due() == 6 * MINUTES_PER_DAY
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from game.chunks import CHUNK_SIZE, ChunkStore
+from game.collision import WalkabilityMask
+
+TILE = 32
+WALL = 1
+
+def open_field(chunk_x, chunk_y):
+    return np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)
+
+@pytest.fixture
+def mask():
+    tiles = ChunkStore(40, 40, open_field)
+    walkable = np.zeros(256, dtype=bool)
+    walkable[0] = True
+    mask = WalkabilityMask(tiles, TILE, walkable)
+    
+    # A vertical wall at x = 10 and a single block at (20, 20)
+    for y in range(40):
+        tiles.set(10, y, WALL)
+        mask.update_tile(10, y, WALL)
+    tiles.set(20, 20, WALL)
+    mask.update_tile(20, 20, WALL)
+    return mask
+
+def test_is_walkable(mask):
+    assert mask.is_walkable(0, 0)
+    assert not mask.is_walkable(10, 5)
+    assert not mask.is_walkable(-1, 0)
+    assert not mask.is_walkable(40, 0)
+    assert mask.area_walkable(0, 0, 9, 39)
+    assert not mask.area_walkable(0, 0, 10, 0)
+
+def test_box_stops_at_wall_without_tunnelling(mask):
+    x, y = mask.move_box(5 * TILE, 5 * TILE, 20, 16, 500, 0)
+    assert x + 20 == pytest.approx(10 * TILE, abs=1e-3)
+    assert x + 20 <= 10 * TILE
+    assert y == 5 * TILE
+
+def test_box_slides_along_wall(mask):
+    x, y = mask.move_box(9 * TILE, 5 * TILE, 20, 16, 40, 40)
+    assert x + 20 <= 10 * TILE
+    assert y == 5 * TILE + 40
+
+def test_box_cannot_leave_world(mask):
+    x, y = mask.move_box(TILE, TILE, 20, 16, -500, -500)
+    assert x >= 0 and y >= 0
+
+def test_move_bodies_matches_move_box(mask):
+    rng = np.random.default_rng(3)
+    positions = rng.uniform(0, 38 * TILE, size=(200, 2))
+    sizes = np.tile([20.0, 16.0], (200, 1))
+    deltas = rng.uniform(-30, 30, size=(200, 2))
+    
+    # Start every body somewhere walkable
+    keep = [mask.area_walkable(int(x // TILE), int(y // TILE),
+                               int((x + 20) // TILE), int((y + 16) // TILE))
+            for x, y in positions]
+    positions, sizes, deltas = positions[keep], sizes[keep], deltas[keep]
+    
+    moved = mask.move_bodies(positions, sizes, deltas)
+    for start, delta, end in zip(positions, deltas, moved):
+        expected = mask.move_box(start[0], start[1], 20, 16, delta[0], delta[1])
+        assert end == pytest.approx(expected, abs=1e-6)
+
+def test_gather_matches_is_walkable(mask):
+    xs, ys = np.meshgrid(np.arange(-2, 42), np.arange(-2, 42))
+    expected = np.vectorize(mask.is_walkable)(xs, ys)
+    assert (mask.gather(xs, ys) == expected).all()
@@ -0,0 +1,78 @@
+import numpy as np
+from game.chunks import CHUNK_SIZE
+from game.crops import Crop, CropField
+from game.items import Items
+
+def test_seeds_map_to_crops():
+    assert Crop.from_seed(Items.CARROT_SEEDS) == Crop.CARROT
+    assert Crop.from_seed(Items.POTATO_SEEDS) == Crop.POTATO
+    assert Crop.from_seed(Items.CARROT) == Crop.NONE
+    assert Crop.PRODUCE[Crop.TOMATO] == Items.TOMATO.index
+    assert Crop.produce(Crop.TOMATO) is Items.TOMATO
+
+def test_plant_only_allocates_touched_chunks():
+    field = CropField()
+    assert field.plant(3, 4, Crop.CARROT, day=1)
+    assert field.plant(10 * CHUNK_SIZE, 0, Crop.TOMATO, day=1)
+    assert not field.plant(3, 4, Crop.POTATO, day=1)
+    assert not field.plant(5, 5, Crop.NONE, day=1)
+    assert field.keys == [(0, 0), (10, 0)]
+    assert field.has_crop(3, 4)
+    assert not field.has_crop(4, 4)
+
+def test_only_watered_crops_grow():
+    field = CropField()
+    field.plant(1, 1, Crop.CARROT, day=1)
+    field.plant(2, 1, Crop.CARROT, day=1)
+    field.water(1, 1)
+    assert field.grow() == [(0, 0)]
+    assert field.growth_stage[field.locate(1, 1)] == 1
+    assert field.growth_stage[field.locate(2, 1)] == 0
+    
+    # Watering lasts one day
+    assert field.grow() == []
+
+def test_crops_mature_and_harvest():
+    field = CropField()
+    field.plant(1, 1, Crop.CARROT, day=1)
+    for _ in range(Crop.GROWTH_DAYS[Crop.CARROT]):
+        assert not field.is_mature(1, 1)
+        assert field.harvest(1, 1) == Crop.NONE
+        field.water(1, 1)
+        field.grow()
+    assert field.is_mature(1, 1)
+    assert field.harvest(1, 1) == Crop.CARROT
+    assert not field.has_crop(1, 1)
+
+def test_growth_stops_at_final_stage():
+    field = CropField()
+    field.plant(1, 1, Crop.CARROT, day=1)
+    for _ in range(10):
+        field.water(1, 1)
+        field.grow()
+    cell = field.locate(1, 1)
+    assert field.growth_stage[cell] == Crop.GROWTH_DAYS[Crop.CARROT]
+    assert field.days_watered[cell] == 10
+
+def test_grow_counts_several_watered_days():
+    field = CropField()
+    field.plant(1, 1, Crop.CARROT, day=1)
+    field.plant(2, 1, Crop.POTATO, day=1)
+    watered_days = np.zeros((1, CHUNK_SIZE, CHUNK_SIZE), dtype=np.intp)
+    watered_days[0, 1, 1] = 10
+    watered_days[0, 1, 2] = 2
+    watered_days[0, 5, 5] = 4
+    assert field.grow(watered_days) == [(0, 0)]
+    assert field.growth_stage[field.locate(1, 1)] == Crop.GROWTH_DAYS[Crop.CARROT]
+    assert field.days_watered[field.locate(1, 1)] == 10
+    assert field.growth_stage[field.locate(2, 1)] == 2
+    assert field.days_watered[field.locate(5, 5)] == 0
+
+def test_days_watered_saturates():
+    field = CropField()
+    field.plant(1, 1, Crop.CARROT, day=1)
+    watered_days = np.zeros((1, CHUNK_SIZE, CHUNK_SIZE), dtype=np.intp)
+    watered_days[0, 1, 1] = 40000
+    field.grow(watered_days)
+    field.grow(watered_days)
+    assert field.days_watered[field.locate(1, 1)] == np.iinfo(field.days_watered.dtype).max
@@ -0,0 +1,44 @@
+import pygame
+import pytest
+from game.dirty import DirtyRegions, merge_overlapping
+
+@pytest.fixture
+def screen():
+    pygame.display.init()
+    yield pygame.display.set_mode((200, 100))
+    pygame.display.quit()
+
+def test_merge_overlapping_unions_chains():
+    rects = [pygame.Rect(0, 0, 10, 10), pygame.Rect(50, 50, 5, 5),
+             pygame.Rect(8, 8, 10, 10), pygame.Rect(16, 16, 4, 4)]
+    merged = merge_overlapping(rects)
+    assert sorted(map(tuple, merged)) == [(0, 0, 20, 20), (50, 50, 5, 5)]
+
+def test_merge_overlapping_skips_empty_rects():
+    assert merge_overlapping([pygame.Rect(5, 5, 0, 10)]) == []
+
+def test_first_present_redraws_everything(screen):
+    dirty = DirtyRegions()
+    calls = []
+    rects = dirty.present(screen, lambda rects: calls.append(rects))
+    assert rects == [screen.get_rect()]
+    assert calls == [rects]
+
+def test_present_draws_once_for_many_rects(screen):
+    dirty = DirtyRegions()
+    dirty.present(screen, lambda rects: None)
+    dirty.add(pygame.Rect(10, 10, 20, 20))
+    dirty.add(pygame.Rect(150, 60, 10, 10))
+    dirty.add(pygame.Rect(190, 90, 30, 30))
+    calls = []
+    rects = dirty.present(screen, lambda rects: calls.append((screen.get_clip(), rects)))
+    assert sorted(map(tuple, rects)) == [(10, 10, 20, 20), (150, 60, 10, 10), (190, 90, 10, 10)]
+    assert calls == [(pygame.Rect(10, 10, 190, 90), rects)]
+    assert screen.get_clip() == screen.get_rect()
+
+def test_present_without_changes_draws_nothing(screen):
+    dirty = DirtyRegions()
+    dirty.present(screen, lambda rects: None)
+    calls = []
+    assert dirty.present(screen, lambda rects: calls.append(1)) == []
+    assert calls == []
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from game.clock import MINUTES_PER_DAY
+from game.items import Items
+from game.world import World, Tile
+
+def farm(weather_seed=3):
+    """A world with a few watered and unwatered crops and some bare soil"""
+    world = World(64 * 32, 64 * 32, 32, weather_seed=weather_seed)
+    for x in range(20, 30):
+        for y in range(20, 24):
+            world.set_tile(x, y, Tile.TILLED_SOIL)
+    for x in range(20, 30, 2):
+        world.plant_seed(x, 20, Items.CARROT_SEEDS)
+        world.plant_seed(x, 22, Items.POTATO_SEEDS)
+    for x in range(20, 25):
+        world.water_tile(x, 20)
+        world.water_tile(x, 22)
+    world.clock.reset(8 * 60)
+    return world
+
+def state(world):
+    count = len(world.crops.keys)
+    return {
+        'day': world.day,
+        'minutes': world.clock.minutes,
+        'crops': {name: getattr(world.crops, name)[:count].copy()
+                  for name in ('crop_type', 'growth_stage', 'days_watered', 'watered')},
+        'crop_keys': list(world.crops.keys),
+        'moisture_keys': list(world.moisture.keys),
+        'level': world.moisture.level[:len(world.moisture.keys)].copy(),
+        'tiles': world.tiles.get_region(0, 0, 64, 64),
+    }
+
+def assert_same(a, b):
+    assert a['day'] == b['day']
+    assert a['minutes'] == pytest.approx(b['minutes'])
+    assert a['crop_keys'] == b['crop_keys']
+    for name in a['crops']:
+        assert (a['crops'][name] == b['crops'][name]).all(), name
+    assert a['moisture_keys'] == b['moisture_keys']
+    np.testing.assert_allclose(a['level'], b['level'], rtol=1e-5, atol=1e-6)
+    assert (a['tiles'] == b['tiles']).all()
+
+@pytest.mark.parametrize("days", [1, 2, 7, 40])
+def test_fast_forward_matches_playing_every_hour(days):
+    played = farm()
+    for _ in range(days * 24):
+        played.clock.advance(60)
+    skipped = farm()
+    skipped.fast_forward(days * MINUTES_PER_DAY)
+    assert_same(state(played), state(skipped))
+
+def test_fast_forward_runs_day_rollover_once():
+    world = farm()
+    calls = []
+    advance_day = world.advance_day
+    world.clock.queue[0][2].batch = lambda count: (calls.append(count), advance_day(count))
+    assert world.fast_forward(30 * MINUTES_PER_DAY) == 1
+    assert calls == [30]
+    assert world.day == 31
+
+def test_sleep_wakes_next_morning():
+    world = farm()
+    world.sleep()
+    assert world.clock.time_of_day == 6 * 60
+    assert world.day == 2
+    world.clock.advance(60)
+    world.sleep()
+    assert world.day == 3
+
+def test_watered_crops_grow_while_skipping():
+    world = farm()
+    world.fast_forward(MINUTES_PER_DAY)
+    cell = world.crops.locate(20, 20)
+    assert world.crops.growth_stage[cell] == 1
+    assert world.crops.growth_stage[world.crops.locate(28, 20)] == 0
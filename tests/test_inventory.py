@@ -0,0 +1,105 @@
+from game.inventory import Inventory
+from game.items import Items, ItemStack
+
+SEEDS = Items.CARROT_SEEDS
+PRODUCE = Items.TOMATO
+MAX = SEEDS.max_stack
+
+def contents(inventory):
+    return [(stack.item_type.id, stack.quantity) if stack else None for stack in inventory.slots]
+
+def check_index(inventory):
+    """The item index must always agree with the slots"""
+    for item_type in Items.get_all_items():
+        slots = {slot for slot, stack in enumerate(inventory.slots)
+                 if stack is not None and stack.item_type is item_type}
+        assert inventory.index.get(item_type.index, set()) == slots
+        assert inventory.count(item_type) == sum(inventory.slots[slot].quantity for slot in slots)
+    assert inventory.free == {slot for slot, stack in enumerate(inventory.slots) if stack is None}
+
+def test_add_tops_up_stacks_before_using_new_slots():
+    inventory = Inventory(4)
+    assert inventory.add(SEEDS, 5) == 0
+    assert inventory.add(PRODUCE, 1) == 0
+    assert inventory.add(SEEDS, MAX) == 0
+    assert contents(inventory) == [("carrot_seeds", MAX), ("tomato", 1), ("carrot_seeds", 5), None]
+    check_index(inventory)
+
+def test_add_returns_overflow_when_full():
+    inventory = Inventory(2)
+    assert inventory.add(SEEDS, MAX * 3) == MAX
+    assert inventory.count(SEEDS) == MAX * 2
+    assert inventory.first_free() is None
+    check_index(inventory)
+
+def test_add_stack_leaves_the_remainder_in_the_stack():
+    inventory = Inventory(1)
+    inventory.add(SEEDS, MAX - 2)
+    stack = ItemStack(SEEDS, 5)
+    assert not inventory.add_stack(stack)
+    assert stack.quantity == 3
+    assert inventory.add_stack(ItemStack(SEEDS, 0))
+
+def test_remove_empties_highest_slots_first():
+    inventory = Inventory(3)
+    inventory.add(SEEDS, MAX + 10)
+    assert inventory.remove(SEEDS, 15) == 15
+    assert contents(inventory) == [("carrot_seeds", MAX - 5), None, None]
+    assert inventory.remove(SEEDS, 1000) == MAX - 5
+    assert inventory.count(SEEDS) == 0
+    check_index(inventory)
+
+def test_take_and_find():
+    inventory = Inventory(4)
+    inventory.add(PRODUCE, 1)
+    inventory.add(SEEDS, 4)
+    assert inventory.find(SEEDS) == 1
+    assert inventory.find_first('seed') == 1
+    assert inventory.take(1, 1) == ItemStack(SEEDS, 1)
+    assert inventory.count(SEEDS) == 3
+    assert inventory.take(1) == ItemStack(SEEDS, 3)
+    assert inventory.find(SEEDS) is None
+    assert inventory.first_free() == 1
+    check_index(inventory)
+
+def test_move_merges_or_swaps():
+    inventory = Inventory(4)
+    inventory.put(0, ItemStack(SEEDS, MAX - 1))
+    inventory.put(1, ItemStack(SEEDS, 3))
+    inventory.put(2, ItemStack(PRODUCE, 2))
+    inventory.move(1, 0)
+    assert contents(inventory)[:2] == [("carrot_seeds", MAX), ("carrot_seeds", 2)]
+    inventory.move(1, 2)
+    assert contents(inventory)[1:3] == [("tomato", 2), ("carrot_seeds", 2)]
+    inventory.move(2, 3)
+    assert contents(inventory)[2:] == [None, ("carrot_seeds", 2)]
+    check_index(inventory)
+
+def test_sort_merges_and_packs():
+    inventory = Inventory(6)
+    inventory.put(5, ItemStack(PRODUCE, 2))
+    inventory.put(1, ItemStack(SEEDS, 3))
+    inventory.put(3, ItemStack(SEEDS, MAX - 1))
+    inventory.put(4, ItemStack(PRODUCE, 1))
+    inventory.sort()
+    assert contents(inventory) == [("carrot_seeds", MAX), ("carrot_seeds", 2), ("tomato", 3),
+                                   None, None, None]
+    check_index(inventory)
+
+def test_transfer_keeps_what_does_not_fit():
+    source = Inventory(3)
+    source.add(SEEDS, 10)
+    source.add(PRODUCE, 5)
+    target = Inventory(1)
+    target.add(SEEDS, MAX - 4)
+    assert source.transfer_to(target) == 4
+    assert contents(source) == [("carrot_seeds", 6), ("tomato", 5), None]
+    assert source.transfer_to(Inventory(4), PRODUCE) == 5
+    check_index(source)
+    check_index(target)
+
+def test_version_changes_with_contents():
+    inventory = Inventory(2)
+    version = inventory.version
+    inventory.add(SEEDS, 1)
+    assert inventory.version != version
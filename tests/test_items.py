@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+import pytest
+from game.items import CATEGORIES, ItemRegistry, Items, ItemStack
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_registry_interns_item_types():
+    assert Items.get("carrot_seeds") is Items.CARROT_SEEDS
+    assert Items.registry[Items.CARROT_SEEDS.index] is Items.CARROT_SEEDS
+    assert Items.get("missing") is None
+    assert [item_type.index for item_type in Items.get_all_items()] == \
+           list(range(1, len(Items.registry) + 1))
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        Items.NOT_AN_ITEM
+
+def test_registry_validates_definitions():
+    with pytest.raises(ValueError):
+        ItemRegistry([{'id': 'a', 'name': 'A'}, {'id': 'a', 'name': 'B'}])
+    with pytest.raises(ValueError):
+        ItemRegistry([{'id': 'a', 'name': 'A', 'category': 'tool'}])
+
+def test_registry_keeps_property_columns():
+    registry = ItemRegistry([{'id': 'a', 'name': 'A', 'category': 'seed', 'max_stack': 5},
+                             {'id': 'b', 'name': 'B'}])
+    assert registry.max_stack.tolist() == [0, 5, 99]
+    assert registry.category.tolist() == [0, CATEGORIES.index('seed'), CATEGORIES.index('none')]
+
+def test_stacks_hold_only_an_index_and_quantity():
+    stack = ItemStack(Items.TOMATO, 3)
+    assert not hasattr(stack, '__dict__')
+    assert (stack.item_index, stack.quantity) == (Items.TOMATO.index, 3)
+    assert stack.item_type is Items.TOMATO
+
+def test_stack_add_respects_max_stack():
+    stack = ItemStack(Items.CARROT, Items.CARROT.max_stack - 2)
+    assert stack.add(5) == 3
+    assert stack.quantity == Items.CARROT.max_stack
+    assert stack.remove(1000) == Items.CARROT.max_stack
+    assert stack.item_index == Items.CARROT.index
+
+def test_stacks_compare_by_type_and_quantity():
+    assert ItemStack(Items.CARROT, 2) == ItemStack(Items.CARROT, 2)
+    assert ItemStack(Items.CARROT, 2) != ItemStack(Items.TOMATO, 2)
+
+def test_import_does_not_read_items_and_works_from_any_directory(tmp_path):
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1])\n"
+        "from game.items import Items\n"
+        "import game.crops, game.world\n"
+        "assert 'registry' not in vars(Items)\n"
+        "assert Items.CARROT_SEEDS.id == 'carrot_seeds'\n"
+    )
+    subprocess.run([sys.executable, "-c", script, ROOT], cwd=tmp_path, check=True)
@@ -0,0 +1,52 @@
+import pygame
+import pytest
+from game.lighting import Lighting, DAYLIGHT_RAMP, RAMP_STEP
+
+TILE = 32
+
+@pytest.fixture
+def screen():
+    return pygame.Surface((8 * TILE, 6 * TILE))
+
+def test_ramp_covers_the_day():
+    assert DAYLIGHT_RAMP.shape == (24 * 60 // RAMP_STEP, 3)
+    assert tuple(DAYLIGHT_RAMP[12 * 60 // RAMP_STEP]) == (255, 255, 255)
+    assert tuple(DAYLIGHT_RAMP[0]) == (40, 45, 90)
+
+def test_state_is_none_in_full_daylight():
+    lighting = Lighting(TILE)
+    assert lighting.state(0, 0, 12 * 60) is None
+    assert lighting.state(0, 0, 23 * 60) is not None
+
+def test_state_follows_ambient_color_not_ramp_step():
+    lighting = Lighting(TILE)
+    assert lighting.state(0, 0, 22 * 60) == lighting.state(0, 0, 23 * 60 + 50)
+    assert lighting.state(0, 0, 20 * 60) != lighting.state(0, 0, 20 * 60 + RAMP_STEP)
+    assert lighting.state(0, 0, 23 * 60) != lighting.state(TILE, 0, 23 * 60)
+
+def test_overlay_is_reused_through_the_night(screen):
+    lighting = Lighting(TILE)
+    lighting.add_light(2, 2)
+    lighting.draw(screen, 0, 0, 22 * 60)
+    overlay = lighting._overlay
+    lighting.draw(screen, 5, 0, 23 * 60 + 30)
+    assert lighting._overlay is overlay
+    lighting.draw(screen, 5, 0, 20 * 60)
+    assert lighting._overlay is not overlay
+
+def test_lights_brighten_the_night(screen):
+    lighting = Lighting(TILE)
+    lighting.add_light(2, 2, radius=3.0)
+    screen.fill((255, 255, 255))
+    lighting.draw(screen, 0, 0, 23 * 60)
+    lit = screen.get_at((2 * TILE + TILE // 2, 2 * TILE + TILE // 2))
+    dark = screen.get_at((7 * TILE + TILE // 2, 5 * TILE + TILE // 2))
+    assert tuple(dark)[:3] == (40, 45, 90)
+    assert lit.r > dark.r and lit.g > dark.g
+
+def test_draw_only_tints_given_rects(screen):
+    lighting = Lighting(TILE)
+    screen.fill((255, 255, 255))
+    lighting.draw(screen, 0, 0, 23 * 60, rects=[pygame.Rect(0, 0, TILE, TILE)])
+    assert tuple(screen.get_at((1, 1)))[:3] == (40, 45, 90)
+    assert tuple(screen.get_at((3 * TILE, 3 * TILE)))[:3] == (255, 255, 255)
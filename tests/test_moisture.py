@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from game.chunks import CHUNK_SIZE
+from game.items import Items
+from game.moisture import MoistureField, EVAPORATION, MEMORY_DAYS
+from game.world import World, Tile
+
+def field(width=40, height=20):
+    moisture = MoistureField()
+    for x in range(width):
+        for y in range(height):
+            moisture.set_soil(x, y, True)
+    return moisture
+
+def soaked_farm():
+    """Tilled soil with crops planted on it, half of them watered"""
+    world = World(64 * 32, 64 * 32, 32, weather_seed=4)
+    for x in range(10, 30):
+        for y in range(10, 14):
+            world.set_tile(x, y, Tile.TILLED_SOIL)
+    for x in range(10, 30, 2):
+        world.plant_seed(x, 10, Items.CARROT_SEEDS)
+        world.plant_seed(x, 12, Items.POTATO_SEEDS)
+    for x in range(10, 20):
+        world.water_tile(x, 10)
+        world.water_tile(x, 12)
+    return world
+
+@pytest.mark.parametrize("days", [5, 2 * MEMORY_DAYS])
+def test_dry_nights_and_rain_decide_wetness(days):
+    stepped, skipped = soaked_farm(), soaked_farm()
+    assert stepped.rain_days(2, days - 1).any()
+    for _ in range(days):
+        stepped.advance_day()
+    skipped.advance_day(days)
+    assert skipped.day == stepped.day
+    count = len(stepped.crops.keys)
+    assert stepped.crops.growth_stage[:count].max() > 0
+    for name in ('growth_stage', 'days_watered', 'watered'):
+        assert (getattr(skipped.crops, name)[:count]
+                == getattr(stepped.crops, name)[:count]).all(), name
+    count = len(stepped.moisture.keys)
+    np.testing.assert_allclose(skipped.moisture.level[:count],
+                               stepped.moisture.level[:count], atol=1e-6)
+
+def test_moisture_spreads_across_chunks_and_evaporates():
+    moisture = field()
+    moisture.water(CHUNK_SIZE - 1, 3)
+    moisture.step()
+    assert moisture.get(CHUNK_SIZE, 3) > 0.0
+    assert moisture.get(CHUNK_SIZE - 1, 3) < 1.0 - EVAPORATION
+    assert moisture.get(CHUNK_SIZE + 1, 3) == 0.0
+
+def test_moisture_stays_on_soil():
+    moisture = field()
+    moisture.set_soil(5, 5, False)
+    moisture.water(5, 5)
+    moisture.water(6, 5)
+    moisture.step()
+    assert moisture.get(5, 5) == 0.0
+    assert moisture.get(7, 5) > 0.0
+
+def test_long_advance_matches_stepping_every_day():
+    rng = np.random.default_rng(1)
+    rain = rng.random(3 * MEMORY_DAYS) < 0.3
+    rain[-3] = True
+    stepped, skipped = field(), field()
+    for moisture in (stepped, skipped):
+        moisture.water(3, 3)
+        moisture.water(30, 10)
+    for raining in rain:
+        stepped.step()
+        if raining:
+            stepped.rain()
+    skipped.advance(rain)
+    count = len(stepped.keys)
+    assert stepped.level[:count].max() > 0.0
+    np.testing.assert_allclose(skipped.level[:count], stepped.level[:count], atol=1e-7)
+
+def test_rain_is_fixed_per_day_and_seed():
+    world = World(64 * 32, 64 * 32, 32, weather_seed=5)
+    rain = world.rain_days(1, 2000)
+    assert 0.15 < rain.mean() < 0.25
+    assert [world.is_raining(day) for day in range(1, 50)] == rain[:49].tolist()
+    assert (world.rain_days(101, 50) == rain[100:150]).all()
+    other = World(64 * 32, 64 * 32, 32, weather_seed=6)
+    assert (other.rain_days(1, 2000) != rain).any()
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+from game.chunks import CHUNK_SIZE, ChunkStore
+from game.collision import WalkabilityMask
+from game.pathfinding import Pathfinder, manhattan
+
+WALL = 1
+
+def open_field(chunk_x, chunk_y):
+    return np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=np.uint8)
+
+class Grid:
+    """Tiles, walkability and a pathfinder kept in sync, like World.set_tile does"""
+    def __init__(self, size=40, **pathfinder_options):
+        self.tiles = ChunkStore(size, size, open_field)
+        walkable = np.zeros(256, dtype=bool)
+        walkable[0] = True
+        self.collision = WalkabilityMask(self.tiles, 32, walkable)
+        self.pathfinder = Pathfinder(self.collision, **pathfinder_options)
+
+    def set(self, x, y, tile):
+        self.tiles.set(x, y, tile)
+        self.collision.update_tile(x, y, tile)
+        self.pathfinder.on_tile_changed(x, y, tile == 0)
+
+@pytest.fixture
+def grid():
+    return Grid()
+
+def assert_valid_path(grid, path, start, goal):
+    assert path[0] == start and path[-1] == goal
+    for a, b in zip(path, path[1:]):
+        assert manhattan(a, b) == 1
+    assert all(grid.collision.is_walkable(*tile) for tile in path)
+
+def test_straight_path(grid):
+    path = grid.pathfinder.find_path((1, 1), (6, 1))
+    assert_valid_path(grid, path, (1, 1), (6, 1))
+    assert len(path) == 6
+
+def test_path_goes_around_walls(grid):
+    for y in range(0, 30):
+        grid.set(10, y, WALL)
+    path = grid.pathfinder.find_path((5, 5), (15, 5))
+    assert_valid_path(grid, path, (5, 5), (15, 5))
+    assert len(path) - 1 == 5 + 25 + 25 + 5
+
+def test_unreachable_goal(grid):
+    for x, y in ((4, 5), (6, 5), (5, 4), (5, 6)):
+        grid.set(x, y, WALL)
+    assert grid.pathfinder.find_path((0, 0), (5, 5)) is None
+    assert grid.pathfinder.find_path((0, 0), (4, 5)) is None
+
+def test_paths_are_cached(grid):
+    path = grid.pathfinder.find_path((1, 1), (6, 6))
+    assert grid.pathfinder.find_path((1, 1), (6, 6)) is path
+
+def test_blocking_a_tile_only_drops_paths_through_it(grid):
+    through = grid.pathfinder.find_path((1, 1), (6, 1))
+    elsewhere = grid.pathfinder.find_path((1, 20), (6, 20))
+    grid.set(3, 1, WALL)
+    assert ((1, 1), (6, 1)) not in grid.pathfinder.paths
+    assert grid.pathfinder.find_path((1, 20), (6, 20)) is elsewhere
+    assert_valid_path(grid, grid.pathfinder.find_path((1, 1), (6, 1)), (1, 1), (6, 1))
+    assert through is not None
+
+def test_opening_a_tile_retries_failed_paths(grid):
+    for x, y in ((4, 5), (6, 5), (5, 4), (5, 6)):
+        grid.set(x, y, WALL)
+    assert grid.pathfinder.find_path((0, 0), (5, 5)) is None
+    grid.set(4, 5, 0)
+    assert_valid_path(grid, grid.pathfinder.find_path((0, 0), (5, 5)), (0, 0), (5, 5))
+
+def test_path_cache_is_bounded():
+    grid = Grid(max_paths=4)
+    for x in range(10):
+        grid.pathfinder.find_path((0, 0), (x, 3))
+    assert len(grid.pathfinder.paths) == 4
+    assert all(key in grid.pathfinder.paths for key in [((0, 0), (x, 3)) for x in range(6, 10)])
+
+def test_flow_field_distances_match_a_star(grid):
+    for y in range(3, 20):
+        grid.set(12, y, WALL)
+    field = grid.pathfinder.flow_field((10, 10), radius=8)
+    for start in ((4, 4), (16, 10), (10, 17)):
+        path = grid.pathfinder.find_path(start, (10, 10))
+        local = (start[1] - field.origin[1], start[0] - field.origin[0])
+        assert field.distance[local] == len(path) - 1
+
+def test_following_a_flow_field_reaches_the_target(grid):
+    field = grid.pathfinder.flow_field((10, 10), radius=8)
+    position = (3, 15)
+    for _ in range(100):
+        step = field.direction(*position)
+        if step == (0, 0):
+            break
+        position = (position[0] + step[0], position[1] + step[1])
+    assert position == (10, 10)
+
+def test_changed_tiles_evict_flow_fields(grid):
+    field = grid.pathfinder.flow_field((10, 10), radius=4)
+    far = grid.pathfinder.flow_field((30, 30), radius=4)
+    grid.set(11, 10, WALL)
+    assert ((10, 10), 4) not in grid.pathfinder.flow_fields
+    assert grid.pathfinder.flow_field((30, 30), radius=4) is far
+    assert grid.pathfinder.flow_field((10, 10), radius=4) is not field
+
+def test_flow_field_cache_is_bounded():
+    grid = Grid(max_flow_fields=3)
+    for x in range(8):
+        grid.pathfinder.flow_field((x, 0), radius=2)
+    assert list(grid.pathfinder.flow_fields) == [((x, 0), 2) for x in range(5, 8)]
@@ -0,0 +1,95 @@
+import csv
+import json
+import pygame
+import pytest
+import game.profiler
+from game.profiler import FrameProfiler
+
+@pytest.fixture
+def frames():
+    profiler = FrameProfiler(history=10)
+    for index in range(3):
+        profiler.begin_frame()
+        with profiler.section("update"):
+            pass
+        if index == 1:
+            with profiler.section("update"):
+                pass
+            with profiler.section("draw"):
+                pass
+        profiler.end_frame()
+    return profiler
+
+def test_frames_keep_their_sections(frames):
+    assert frames.frame_count == 3
+    assert frames.section_names() == ["update", "draw"]
+    assert frames.samples("draw") == [0.0, frames.history[1]['sections']['draw'], 0.0]
+    assert len(frames.history[1]['events']) == 3
+    assert frames.history[0]['interval_ms'] is None
+    assert frames.fps() > 0.0
+
+def test_repeated_sections_add_up():
+    profiler = FrameProfiler()
+    profiler.begin_frame()
+    for _ in range(2):
+        with profiler.section("tick"):
+            pass
+    profiler.end_frame()
+    first, second = (duration * 1000 for _, _, duration in profiler.history[0]['events'])
+    assert profiler.samples("tick")[0] == pytest.approx(first + second)
+
+def test_history_is_bounded():
+    profiler = FrameProfiler(history=4)
+    for _ in range(10):
+        profiler.begin_frame()
+        profiler.end_frame()
+    assert len(profiler.recent()) == 4
+    assert len(profiler.recent(2)) == 2
+    assert profiler.frame_count == 10
+
+def test_export(frames, tmp_path, monkeypatch):
+    monkeypatch.setattr(game.profiler, "PROFILE_DIR", str(tmp_path))
+    frames_json, frames_csv, trace_json = frames.export()
+    with open(frames_json) as f:
+        assert len(json.load(f)['frames']) == 3
+    with open(frames_csv) as f:
+        rows = list(csv.reader(f))
+    assert rows[0][-2:] == ["update", "draw"]
+    assert len(rows) == 4
+    with open(trace_json) as f:
+        trace = json.load(f)['traceEvents']
+    assert [event['name'] for event in trace].count("update") == 4
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    yield pygame.display.set_mode((800, 600))
+    pygame.display.quit()
+
+def test_leaving_the_game_ends_the_frame(screen):
+    from game.profiler import profiler
+    from main import GameState
+    game_state = GameState(screen)
+    game_state.state = "game"
+    game_state.game_screen = game_state.create_game_screen()
+    frame_count = profiler.frame_count
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, unicode=""))
+    game_state.run_game()
+    assert game_state.state == "title"
+    assert profiler.frame_count == frame_count + 1
+    assert "events" in profiler.history[-1]['sections']
+
+def test_draw_sections_run_once_per_frame(screen):
+    from game.profiler import profiler
+    from screens.game_screen import GameScreen
+    game_screen = GameScreen(screen, (30, 25))
+    game_screen.draw()
+    game_screen.dirty.add(pygame.Rect(0, 0, 50, 50))
+    game_screen.dirty.add(pygame.Rect(400, 300, 50, 50))
+    profiler.begin_frame()
+    game_screen.draw()
+    profiler.end_frame()
+    names = [name for name, _, _ in profiler.history[-1]['events']]
+    assert names.count("world") == 1
+    assert names.count("lighting") == 1
@@ -0,0 +1,125 @@
+import os
+import pygame
+import pytest
+import bench
+from bench import ScriptedKeys, scripted_input
+from game.replay import InputRecorder, Recording, ReplayError, HEADER, REPLAY_MAGIC
+from main import GameState
+from screens.game_screen import GameScreen, SAVE_PATH
+
+FRAME_MS = 1000 / 60
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    yield pygame.display.set_mode((800, 600))
+    pygame.display.quit()
+
+def key_event(kind, key):
+    return pygame.event.Event(kind, key=key, mod=0, unicode="")
+
+def test_recording_round_trip(tmp_path):
+    path = tmp_path / "session.rec"
+    with InputRecorder(path, (40, 30)) as recorder:
+        recorder.record(16.5, ScriptedKeys([pygame.K_w, pygame.K_LEFT]),
+                        [key_event(pygame.KEYDOWN, pygame.K_1), pygame.event.Event(pygame.MOUSEMOTION)])
+        recorder.record(20.0, ScriptedKeys([]), [key_event(pygame.KEYUP, pygame.K_1)])
+    assert recorder.file.closed
+    
+    recording = Recording(path)
+    assert recording.world_size == (40, 30)
+    frames = list(recording)
+    assert [frame_ms for frame_ms, _, _ in frames] == [16.5, 20.0]
+    keys = frames[0][1]
+    assert keys[pygame.K_w] and keys[pygame.K_LEFT]
+    assert not keys[pygame.K_d] and not keys[pygame.K_SPACE]
+    assert [(event.type, event.key) for event in frames[0][2]] == [(pygame.KEYDOWN, pygame.K_1)]
+    assert [(event.type, event.key) for event in frames[1][2]] == [(pygame.KEYUP, pygame.K_1)]
+
+def test_bad_recordings_are_rejected(tmp_path):
+    path = tmp_path / "bad.rec"
+    path.write_bytes(b"not a recording at all")
+    with pytest.raises(ReplayError):
+        Recording(path)
+    for version in (1, 99):
+        path.write_bytes(HEADER.pack(REPLAY_MAGIC, version, 0))
+        with pytest.raises(ReplayError):
+            Recording(path)
+
+def test_arrow_keys_move_the_player(screen):
+    game_screen = GameScreen(screen, (30, 25))
+    x, y = game_screen.player.x, game_screen.player.y
+    for _ in range(10):
+        game_screen.update(ScriptedKeys([pygame.K_LEFT, pygame.K_UP]), frame_ms=FRAME_MS)
+    assert game_screen.player.x < x and game_screen.player.y < y
+
+def snapshot(game_screen):
+    world = game_screen.world
+    count = len(world.crops.keys)
+    return {
+        'player': (game_screen.player.x, game_screen.player.y, game_screen.player.facing),
+        'camera': (game_screen.camera_x, game_screen.camera_y),
+        'minutes': world.clock.minutes,
+        'tiles': world.tiles.get_region(0, 0, world.grid_width, world.grid_height).tolist(),
+        'crops': world.crops.growth_stage[:count].tolist(),
+        'inventory': [(stack.item_type.id, stack.quantity) if stack else None
+                      for stack in game_screen.player.inventory.slots],
+    }
+
+def play(screen, frames, world_size):
+    game_screen = GameScreen(screen, world_size)
+    for frame_ms, keys, events in frames:
+        for event in events:
+            game_screen.handle_event(event)
+        game_screen.update(keys, frame_ms=frame_ms)
+    state = snapshot(game_screen)
+    game_screen.world.close()
+    return state
+
+def test_replays_are_deterministic(screen, tmp_path):
+    path = tmp_path / "session.rec"
+    game_screen = GameScreen(screen, (30, 25))
+    with InputRecorder(path, (game_screen.world.grid_width, game_screen.world.grid_height)) as recorder:
+        for frame_ms, keys, events in scripted_input(400):
+            for event in events:
+                game_screen.handle_event(event)
+            game_screen.update(keys, frame_ms=frame_ms)
+            recorder.record(frame_ms, keys, events)
+    session = snapshot(game_screen)
+    game_screen.world.close()
+    
+    recording = Recording(path)
+    first = play(screen, recording, recording.world_size)
+    second = play(screen, recording, recording.world_size)
+    assert first == session
+    assert second == session
+
+def test_recording_is_closed_when_the_game_crashes(screen, tmp_path, monkeypatch):
+    path = tmp_path / "crash.rec"
+    game_state = GameState(screen, record_path=str(path))
+    game_state.state = "game"
+    updates = []
+    
+    def update(self, keys=None, frame_ms=None):
+        updates.append(frame_ms)
+        if len(updates) == 3:
+            raise RuntimeError("crash")
+    monkeypatch.setattr(GameScreen, "update", update)
+    monkeypatch.setattr(GameScreen, "draw", lambda self: None)
+    with pytest.raises(RuntimeError):
+        game_state.run()
+    assert game_state.recorder is None
+    assert len(list(Recording(path))) == 2
+
+def test_bench_replay_keeps_quicksaves_out_of_the_save_dir(screen, tmp_path):
+    path = tmp_path / "saves.rec"
+    with InputRecorder(path, (25, 19)) as recorder:
+        recorder.record(FRAME_MS, ScriptedKeys([]), [key_event(pygame.KEYDOWN, pygame.K_F5)])
+        for _ in range(3):
+            recorder.record(FRAME_MS, ScriptedKeys([]), [])
+        recorder.record(FRAME_MS, ScriptedKeys([]), [key_event(pygame.KEYDOWN, pygame.K_F9)])
+    before = os.stat(SAVE_PATH).st_mtime_ns if os.path.exists(SAVE_PATH) else None
+    results = bench.run_benchmark(frames=0, warmup=0, replay=str(path))
+    after = os.stat(SAVE_PATH).st_mtime_ns if os.path.exists(SAVE_PATH) else None
+    assert results['frames'] == 5
+    assert after == before
@@ -0,0 +1,142 @@
+import time
+import pygame
+import pytest
+from game.chunks import CHUNK_SIZE
+from game.clock import GAME_MINUTES_PER_MS, MINUTES_PER_DAY
+from game.inventory import Inventory
+from game.items import Items, ItemStack
+from game.save import (PREAMBLE, SAVE_MAGIC, SAVE_VERSION, SaveError, SaveFile,
+                       load_game, save_game)
+from game.world import World, Tile
+
+TILE_SIZE = 32
+
+class SavedPlayer:
+    """The parts of Player that saving and loading touch"""
+    def __init__(self, world):
+        self.world = world
+        self.x = 100.0
+        self.y = 200.0
+        self.facing = 'left'
+        self.selected_tool = 'hoe'
+        self.inventory = Inventory()
+        self.inventory.add(Items.CARROT_SEEDS, 5)
+        self.inventory.put(7, ItemStack(Items.TOMATO_SEEDS, 3))
+        world.entities.insert(self, self.get_bounds())
+
+    def get_bounds(self):
+        return (self.x - 10, self.y - 8, 20, 16)
+
+class SavedStatus:
+    def __init__(self):
+        self.money = 250
+
+def make_world():
+    world = World(200 * TILE_SIZE, 200 * TILE_SIZE, TILE_SIZE, weather_seed=7)
+    return world
+
+def tiles_at(world, points):
+    return [world.get_tile(x, y) for x, y in points]
+
+# Tiles in three different chunks, far enough apart that loading one does not load the others
+POINTS = [(1, 1), (5 * CHUNK_SIZE + 3, 2), (150, 170)]
+
+def populate(world):
+    for x, y in POINTS:
+        world.set_tile(x, y, Tile.TILLED_SOIL)
+    world.water_tile(*POINTS[0])
+    world.plant_seed(*POINTS[0], Items.CARROT_SEEDS)
+    world.clock.reset(3 * MINUTES_PER_DAY + 125)
+    world.day = 4
+
+def test_save_load_round_trip(tmp_path):
+    world = make_world()
+    populate(world)
+    player = SavedPlayer(world)
+    status = SavedStatus()
+    path = str(tmp_path / "a.pdsave")
+    save_game(path, world, player, status)
+
+    loaded_player = SavedPlayer(make_world())
+    loaded_status = SavedStatus()
+    loaded_status.money = 0
+    loaded = load_game(path, loaded_player, loaded_status)
+
+    assert tiles_at(loaded, POINTS) == tiles_at(world, POINTS)
+    assert loaded.clock.minutes == world.clock.minutes
+    assert loaded.day == world.day
+    assert loaded.weather_seed == 7
+    assert loaded.crops.has_crop(*POINTS[0])
+    assert loaded.moisture.get(*POINTS[0]) == pytest.approx(world.moisture.get(*POINTS[0]))
+    assert (loaded_player.x, loaded_player.y, loaded_player.facing) == (100.0, 200.0, 'left')
+    assert [(s.item_type.id, s.quantity) if s else None for s in loaded_player.inventory] == \
+           [(s.item_type.id, s.quantity) if s else None for s in player.inventory]
+    assert loaded_status.money == 250
+
+def test_resave_keeps_chunks_never_loaded(tmp_path):
+    world = make_world()
+    populate(world)
+    first = str(tmp_path / "first.pdsave")
+    second = str(tmp_path / "second.pdsave")
+    save_game(first, world, SavedPlayer(world), SavedStatus())
+
+    # Only the first chunk is read before saving again
+    player = SavedPlayer(make_world())
+    status = SavedStatus()
+    middle = load_game(first, player, status)
+    middle.get_tile(*POINTS[0])
+    save_game(second, middle, player, status)
+
+    final = load_game(second, SavedPlayer(make_world()), SavedStatus())
+    assert tiles_at(final, POINTS) == [Tile.WATERED_SOIL, Tile.TILLED_SOIL, Tile.TILLED_SOIL]
+
+def test_catch_up_fast_forwards_by_time_since_saving(tmp_path, monkeypatch):
+    world = make_world()
+    populate(world)
+    path = str(tmp_path / "old.pdsave")
+    saved_at = time.time()
+    monkeypatch.setattr(time, "time", lambda: saved_at)
+    save_game(path, world, SavedPlayer(world), SavedStatus())
+    
+    # Two real minutes later, which is five game days
+    monkeypatch.setattr(time, "time", lambda: saved_at + 2 * 60)
+    offline_minutes = 2 * 60 * 1000 * GAME_MINUTES_PER_MS
+    caught_up = load_game(path, SavedPlayer(make_world()), SavedStatus(), catch_up=True)
+    assert caught_up.clock.minutes == pytest.approx(world.clock.minutes + offline_minutes)
+    assert caught_up.day == world.day + 5
+    
+    # The watered carrot grew on the first night
+    cell = caught_up.crops.locate(*POINTS[0])
+    assert caught_up.crops.growth_stage[cell] >= 1
+    
+    kept = load_game(path, SavedPlayer(make_world()), SavedStatus())
+    assert kept.clock.minutes == world.clock.minutes
+
+@pytest.mark.parametrize("version", [SAVE_VERSION - 1, SAVE_VERSION + 1])
+def test_rejects_other_versions(tmp_path, version):
+    path = str(tmp_path / "other.pdsave")
+    with open(path, "wb") as f:
+        f.write(PREAMBLE.pack(SAVE_MAGIC, version, 2))
+        f.write(b"{}")
+    with pytest.raises(SaveError):
+        SaveFile(path)
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    yield pygame.display.set_mode((800, 600))
+    pygame.display.quit()
+
+def test_quickload_catches_up(screen, tmp_path, monkeypatch):
+    from screens.game_screen import GameScreen
+    game_screen = GameScreen(screen, (30, 25))
+    game_screen.save_path = str(tmp_path / "quicksave.pdsave")
+    saved_at = time.time()
+    monkeypatch.setattr(time, "time", lambda: saved_at)
+    game_screen.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F5, mod=0, unicode=""))
+    minutes = game_screen.world.clock.minutes
+    
+    monkeypatch.setattr(time, "time", lambda: saved_at + 60)
+    game_screen.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F9, mod=0, unicode=""))
+    assert game_screen.world.clock.minutes == pytest.approx(minutes + 60 * 1000 * GAME_MINUTES_PER_MS)
+    game_screen.world.close()
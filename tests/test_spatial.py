@@ -0,0 +1,43 @@
+from game.spatial import SpatialHash
+
+def test_query_rect_finds_overlapping_entities():
+    grid = SpatialHash(32)
+    grid.insert("a", (10, 10, 5, 5))
+    grid.insert("b", (100, 100, 40, 40))
+    assert grid.query_rect(0, 0, 20, 20) == {"a"}
+    assert grid.query_rect(130, 130, 5, 5) == {"b"}
+    assert grid.query_rect(50, 50, 10, 10) == set()
+
+def test_query_rect_filters_same_cell_misses():
+    grid = SpatialHash(32)
+    grid.insert("a", (0, 0, 4, 4))
+    assert grid.query_rect(20, 20, 4, 4) == set()
+
+def test_move_and_remove():
+    grid = SpatialHash(32)
+    grid.insert("a", (0, 0, 4, 4))
+    grid.move("a", (200, 200, 4, 4))
+    assert grid.query_rect(0, 0, 10, 10) == set()
+    assert grid.query_rect(190, 190, 20, 20) == {"a"}
+    grid.remove("a")
+    assert len(grid) == 0
+    assert grid.cells == {}
+
+def test_insert_existing_entity_moves_it():
+    grid = SpatialHash(32)
+    grid.insert("a", (0, 0, 4, 4))
+    grid.insert("a", (100, 0, 4, 4))
+    assert len(grid) == 1
+    assert grid.query_rect(0, 0, 10, 10) == set()
+
+def test_query_radius_uses_distance_to_box():
+    grid = SpatialHash(32)
+    grid.insert("near", (30, 0, 10, 10))
+    grid.insert("far", (60, 60, 10, 10))
+    assert grid.query_radius(0, 5, 30) == {"near"}
+    assert grid.query_radius(0, 5, 29) == set()
+
+def test_negative_coordinates():
+    grid = SpatialHash(32)
+    grid.insert("a", (-40, -40, 8, 8))
+    assert grid.query_rect(-50, -50, 20, 20) == {"a"}
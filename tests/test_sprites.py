@@ -0,0 +1,70 @@
+import os
+import pygame
+import pytest
+from game import sprites
+from game.sprites import (SPRITE_SIZE, STATES, DIRECTIONS, FRAME_COUNTS, CharacterSprite,
+                          frame_name, get_character_frames, load_character_atlas)
+
+@pytest.fixture
+def sheet(tmp_path, monkeypatch):
+    """A small synthetic sprite sheet, with the atlas cache in a temporary directory"""
+    monkeypatch.setattr(sprites, "CACHE_DIR", str(tmp_path / "cache"))
+    surface = pygame.Surface((max(FRAME_COUNTS.values()) * SPRITE_SIZE[0],
+                              len(STATES) * len(DIRECTIONS) * SPRITE_SIZE[1]), pygame.SRCALPHA)
+    surface.fill((200, 100, 50, 255))
+    path = str(tmp_path / "character.png")
+    pygame.image.save(surface, path)
+    return path
+
+def cached_files():
+    return sorted(os.listdir(sprites.CACHE_DIR))
+
+def test_atlas_cache_is_keyed_on_sheet_and_scale(sheet, monkeypatch):
+    atlas = load_character_atlas(sheet, 1.0)
+    assert atlas.get(frame_name('walk', 'left', 3)).get_size() == SPRITE_SIZE
+    assert len(cached_files()) == 2
+    
+    # A second load of the same sheet and scale reads the cached atlas
+    build = sprites.build_character_atlas
+    monkeypatch.setattr(sprites, "build_character_atlas", None)
+    cached = load_character_atlas(sheet, 1.0)
+    assert cached.manifest['scale'] == 1.0
+    assert cached.rects == atlas.rects
+    
+    # Another scale misses the cache and is built and stored separately
+    monkeypatch.setattr(sprites, "build_character_atlas", build)
+    scaled = load_character_atlas(sheet, 2.0)
+    assert scaled.get(frame_name('idle', 'down', 0)).get_size() == (SPRITE_SIZE[0] * 2, SPRITE_SIZE[1] * 2)
+    assert len(cached_files()) == 4
+
+def test_changed_sheet_misses_the_cache(sheet):
+    load_character_atlas(sheet, 1.0)
+    surface = pygame.image.load(sheet)
+    surface.fill((0, 0, 255, 255), pygame.Rect(0, 0, 4, 4))
+    pygame.image.save(surface, sheet)
+    atlas = load_character_atlas(sheet, 1.0)
+    assert len(cached_files()) == 4
+    assert tuple(atlas.get(frame_name('idle', 'down', 0)).get_at((1, 1))) == (0, 0, 255, 255)
+
+def test_missing_sheet_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_character_atlas(str(tmp_path / "missing.png"))
+
+def test_frames_are_shared_per_sheet_and_scale(sheet):
+    frames = get_character_frames(sheet, 1.0)
+    assert get_character_frames(sheet, 1.0) is frames
+    assert get_character_frames(sheet, 2.0) is not frames
+    assert frames.size == SPRITE_SIZE
+
+def test_sprites_share_frames_but_not_playback(sheet):
+    first = CharacterSprite(sheet_path=sheet)
+    second = CharacterSprite(sheet_path=sheet)
+    try:
+        assert first.frames is second.frames
+        assert first.current_frame() is second.current_frame()
+        first.set_state('walk', 'left')
+        assert second.state == 'idle'
+        assert first.slot != second.slot
+    finally:
+        first.release()
+        second.release()
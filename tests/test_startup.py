@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+import pytest
+from game.startup import StartupTimeline
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_phases_are_recorded_in_start_order():
+    timeline = StartupTimeline()
+    with timeline.phase("outer"):
+        with timeline.phase("inner"):
+            pass
+    timeline.mark("first frame")
+    names = [name for name, _, _ in timeline.events]
+    assert names == ["inner", "outer", "first frame"]
+    
+    # The report lists phases by when they started, so outer comes first
+    report = timeline.report().splitlines()
+    assert report[0] == "Startup timeline:"
+    assert [line.split()[2] for line in report[1:]] == ["outer", "inner", "first"]
+    
+    starts = {name: start for name, start, _ in timeline.events}
+    durations = {name: duration for name, _, duration in timeline.events}
+    assert starts["outer"] <= starts["inner"] <= starts["first frame"]
+    assert durations["outer"] >= durations["inner"]
+    assert durations["first frame"] == 0.0
+
+def test_failed_phase_is_still_recorded():
+    timeline = StartupTimeline()
+    with pytest.raises(RuntimeError):
+        with timeline.phase("broken"):
+            raise RuntimeError
+    assert [name for name, _, _ in timeline.events] == ["broken"]
+
+def test_importing_main_defers_pygame_setup_and_game_modules():
+    code = ("import sys, pygame, main; "
+            "print(pygame.get_init(), 'screens.game_screen' in sys.modules, 'game.world' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+                            env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1"), check=True)
+    assert result.stdout.split() == ["False", "False", "False"]
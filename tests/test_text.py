@@ -0,0 +1,40 @@
+import pygame
+import pytest
+from game.text import GlyphAtlas, TextCache, get_font, text_cache
+
+@pytest.fixture(scope="module")
+def font():
+    pygame.font.init()
+    return get_font(24)
+
+def test_text_cache_reuses_surfaces(font):
+    cache = TextCache()
+    first = cache.render(font, "hello", (255, 255, 255))
+    assert cache.render(font, "hello", (255, 255, 255)) is first
+    assert cache.render(font, "hello", (0, 0, 0)) is not first
+
+def test_text_cache_drops_least_recently_used(font):
+    cache = TextCache(max_entries=2)
+    a = cache.render(font, "a", (0, 0, 0))
+    cache.render(font, "b", (0, 0, 0))
+    cache.render(font, "a", (0, 0, 0))
+    cache.render(font, "c", (0, 0, 0))
+    assert cache.render(font, "a", (0, 0, 0)) is a
+    assert len(cache.surfaces) == 2
+
+def test_glyph_atlas_draws_supported_text(font):
+    atlas = GlyphAtlas(font, (255, 255, 255))
+    surface = pygame.Surface((200, 50))
+    rect = atlas.draw(surface, "12:30", (5, 5))
+    assert atlas.supports("12:30")
+    assert rect.topleft == (5, 5)
+    assert rect.size == atlas.size("12:30")
+
+def test_glyph_atlas_falls_back_for_other_characters(font):
+    atlas = GlyphAtlas(font, (255, 255, 255))
+    surface = pygame.Surface((200, 50))
+    assert not atlas.supports("nan")
+    rect = atlas.draw(surface, "nan", (5, 5))
+    assert rect.size == font.size("nan")
+    assert atlas.size("nan") == font.size("nan")
+    assert (font, "nan", (255, 255, 255), True) in text_cache.surfaces
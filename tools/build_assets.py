@@ -0,0 +1,70 @@
+"""
+Build every generated asset in one go:
+
+    python -m tools.build_assets [--force] [--jobs N]
+
+- the character sprite sheet (assets/sprites/character.png + .json)
+- the UI icon atlas (assets/ui/icons.png + icons.json) holding the tool
+  icons and one icon per item in Items.get_all_items()
+
+Run it from the repository root. Assets are only redrawn when the code or
+data they are drawn from changed.
+"""
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import pygame
+from game.atlas import Atlas, ICON_ATLAS_PATH, ICON_MANIFEST_PATH
+from game.items import Items
+from tools import character_generator, icon_generator
+
+def icon_inputs_hash(items):
+    """Hash everything the icon atlas is drawn from: the icon code, the item ids and the packer"""
+    digest = hashlib.sha1()
+    digest.update(json.dumps([item_type.id for item_type in items]).encode())
+    digest.update(inspect.getsource(icon_generator).encode())
+    digest.update(inspect.getsource(Atlas.pack).encode())
+    return digest.hexdigest()
+
+def build_icon_atlas(force=False):
+    """Pack all icons into one atlas; returns False if it was already up to date"""
+    items = list(Items.get_all_items())
+    digest = icon_inputs_hash(items)
+    
+    # Check before drawing anything, so an up-to-date atlas costs no rendering
+    if not force and os.path.exists(ICON_ATLAS_PATH) and os.path.exists(ICON_MANIFEST_PATH):
+        with open(ICON_MANIFEST_PATH) as f:
+            if json.load(f).get('inputs_sha1') == digest:
+                return False
+    
+    icons = icon_generator.create_icons(items)
+    Atlas.pack(icons).save(ICON_ATLAS_PATH, ICON_MANIFEST_PATH, inputs_sha1=digest)
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build all generated game assets")
+    parser.add_argument("--force", action="store_true", help="rebuild even if unchanged")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes for the sprite sheet (default: one per CPU)")
+    args = parser.parse_args(argv)
+    
+    pygame.init()
+    
+    # Character sprite sheet (incremental on its own)
+    sheet_args = ["--force"] if args.force else []
+    if args.jobs is not None:
+        sheet_args += ["--jobs", str(args.jobs)]
+    character_generator.main(sheet_args)
+    
+    # UI icon atlas
+    if build_icon_atlas(args.force):
+        print(f"Icon atlas saved to {ICON_ATLAS_PATH}")
+    else:
+        print(f"Icon atlas {ICON_ATLAS_PATH} is up to date")
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
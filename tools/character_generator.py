@@ -1,6 +1,11 @@
 import pygame
+import argparse
+import hashlib
+import inspect
+import json
 import os
 import math
+from concurrent.futures import ProcessPoolExecutor
 
 # Initialize Pygame
 pygame.init()
@@ -181,62 +186,149 @@ def create_walk_animation(base_surface, frame, direction):
     
     return surface
 
-def create_sprite_sheet():
-    """Create the complete character sprite sheet"""
-    # Calculate sprite sheet size
-    states = ['idle', 'walk', 'hoe', 'water', 'seed', 'harvest']
-    directions = ['down', 'left', 'right', 'up']
-    max_frames = 4  # Maximum frames for any animation
+# Sprite sheet layout: one row per (state, direction), one column per frame
+STATES = ['idle', 'walk', 'hoe', 'water', 'seed', 'harvest']
+DIRECTIONS = ['down', 'left', 'right', 'up']
+MAX_FRAMES = 4  # Maximum frames for any animation
+
+OUTPUT_DIR = os.path.join("assets", "sprites")
+SHEET_PATH = os.path.join(OUTPUT_DIR, "character.png")
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, "character.json")
+
+def frame_count(state):
+    return 4 if state in ['idle', 'walk'] else 3
+
+def animation_inputs(state):
+    """Drawing functions whose output an animation depends on"""
+    functions = [create_character_base, render_animation]
+    if state == 'walk':
+        functions.append(create_walk_animation)
+    elif state in ['hoe', 'water', 'seed', 'harvest']:
+        functions.append(create_tool_animation)
+    return functions
+
+def animation_hash(state, direction):
+    """Hash everything that affects how an animation is drawn"""
+    digest = hashlib.sha1()
+    digest.update(json.dumps([COLORS, SPRITE_WIDTH, SPRITE_HEIGHT, state, direction,
+                              frame_count(state)]).encode())
+    for function in animation_inputs(state):
+        digest.update(inspect.getsource(function).encode())
+    return digest.hexdigest()
+
+def render_animation(state, direction):
+    """
+    Draw every frame of one animation as a horizontal strip
+    Runs in a worker process, so the strip is returned as raw RGBA bytes
+    """
+    frames = frame_count(state)
+    strip = pygame.Surface((SPRITE_WIDTH * frames, SPRITE_HEIGHT), pygame.SRCALPHA)
     
-    sheet_width = SPRITE_WIDTH * max_frames
-    sheet_height = SPRITE_HEIGHT * len(directions) * len(states)
+    for frame in range(frames):
+        # Create frame surface
+        frame_surface = pygame.Surface((SPRITE_WIDTH, SPRITE_HEIGHT), 
+                                    pygame.SRCALPHA)
+        
+        # Draw base character
+        create_character_base(frame_surface, direction)
+        
+        # Add animation based on state
+        if state == 'walk':
+            frame_surface = create_walk_animation(frame_surface, frame, 
+                                                direction)
+        elif state in ['hoe', 'water', 'seed', 'harvest']:
+            frame_surface = create_tool_animation(frame_surface, state, 
+                                                frame, direction)
+        
+        strip.blit(frame_surface, (frame * SPRITE_WIDTH, 0))
+    
+    return state, direction, pygame.image.tobytes(strip, "RGBA")
+
+def create_sprite_sheet(previous_sheet=None, previous_manifest=None, jobs=None):
+    """
+    Create the complete character sprite sheet
+    previous_sheet, previous_manifest: Output of an earlier build; animations
+        whose inputs are unchanged are copied from it instead of redrawn
+    jobs: Number of worker processes (None = one per CPU, 1 = draw serially)
+    Returns (sprite_sheet, manifest, names of the animations that were redrawn)
+    """
+    sheet_width = SPRITE_WIDTH * MAX_FRAMES
+    sheet_height = SPRITE_HEIGHT * len(DIRECTIONS) * len(STATES)
     
     # Create sprite sheet surface
     sprite_sheet = pygame.Surface((sheet_width, sheet_height), pygame.SRCALPHA)
+    manifest = {
+        'sprite_size': [SPRITE_WIDTH, SPRITE_HEIGHT],
+        'animations': {},
+    }
+    previous_animations = {}
+    if previous_sheet is not None and previous_manifest is not None:
+        if previous_sheet.get_size() == (sheet_width, sheet_height):
+            previous_animations = previous_manifest.get('animations', {})
     
-    # Generate all animations
-    for state_idx, state in enumerate(states):
-        for dir_idx, direction in enumerate(directions):
-            # Calculate base position in sprite sheet
-            base_x = 0
-            base_y = (state_idx * len(directions) + dir_idx) * SPRITE_HEIGHT
-            
-            # Number of frames for this animation
-            frames = 4 if state in ['idle', 'walk'] else 3
+    # Work out which animations need redrawing
+    stale = []
+    for state_idx, state in enumerate(STATES):
+        for dir_idx, direction in enumerate(DIRECTIONS):
+            name = f"{state}/{direction}"
+            rect = [0, (state_idx * len(DIRECTIONS) + dir_idx) * SPRITE_HEIGHT,
+                    SPRITE_WIDTH * frame_count(state), SPRITE_HEIGHT]
+            entry = {'rect': rect, 'frames': frame_count(state),
+                     'hash': animation_hash(state, direction)}
+            manifest['animations'][name] = entry
             
-            for frame in range(frames):
-                # Create frame surface
-                frame_surface = pygame.Surface((SPRITE_WIDTH, SPRITE_HEIGHT), 
-                                            pygame.SRCALPHA)
-                
-                # Draw base character
-                create_character_base(frame_surface, direction)
-                
-                # Add animation based on state
-                if state == 'walk':
-                    frame_surface = create_walk_animation(frame_surface, frame, 
-                                                        direction)
-                elif state in ['hoe', 'water', 'seed', 'harvest']:
-                    frame_surface = create_tool_animation(frame_surface, state, 
-                                                        frame, direction)
-                
-                # Add to sprite sheet
-                sprite_sheet.blit(frame_surface, 
-                                (base_x + frame * SPRITE_WIDTH, base_y))
-    
-    return sprite_sheet
+            previous = previous_animations.get(name)
+            if previous is not None and previous['hash'] == entry['hash'] and previous['rect'] == rect:
+                sprite_sheet.blit(previous_sheet, rect[:2], rect)
+            else:
+                stale.append((state, direction))
+    
+    # Draw the stale animations, in parallel when there is more than one
+    if len(stale) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            strips = list(pool.map(render_animation, *zip(*stale)))
+    else:
+        strips = [render_animation(state, direction) for state, direction in stale]
+    
+    for state, direction, pixels in strips:
+        rect = manifest['animations'][f"{state}/{direction}"]['rect']
+        strip = pygame.image.frombytes(pixels, (rect[2], rect[3]), "RGBA")
+        sprite_sheet.blit(strip, rect[:2])
+    
+    return sprite_sheet, manifest, [f"{state}/{direction}" for state, direction in stale]
 
-def main():
+def load_previous_build():
+    """Return (sheet, manifest) from the last build, or (None, None)"""
+    if not (os.path.exists(SHEET_PATH) and os.path.exists(MANIFEST_PATH)):
+        return None, None
+    with open(MANIFEST_PATH) as f:
+        manifest = json.load(f)
+    return pygame.image.load(SHEET_PATH), manifest
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the character sprite sheet")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true",
+                        help="redraw every animation, ignoring the last build")
+    args = parser.parse_args(argv)
+    
     # Create output directory if it doesn't exist
-    os.makedirs(os.path.join("assets", "sprites"), exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     
-    # Generate sprite sheet
-    sprite_sheet = create_sprite_sheet()
+    previous_sheet, previous_manifest = (None, None) if args.force else load_previous_build()
+    sprite_sheet, manifest, rebuilt = create_sprite_sheet(previous_sheet, previous_manifest,
+                                                          args.jobs)
+    if not rebuilt:
+        print(f"Character sprite sheet {SHEET_PATH} is up to date")
+        return
     
-    # Save sprite sheet
-    output_path = os.path.join("assets", "sprites", "character.png")
-    pygame.image.save(sprite_sheet, output_path)
-    print(f"Character sprite sheet saved to {output_path}")
+    # Save sprite sheet and its manifest
+    pygame.image.save(sprite_sheet, SHEET_PATH)
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    print(f"Character sprite sheet saved to {SHEET_PATH} "
+          f"({len(rebuilt)} of {len(manifest['animations'])} animations redrawn)")
 
 if __name__ == "__main__":
     main()
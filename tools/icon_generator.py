@@ -1,14 +1,14 @@
 import pygame
-import os
-
-# Initialize Pygame
-pygame.init()
 
 # Icon size (32x32 pixels)
 ICON_SIZE = 32
 
-# Create output directory if it doesn't exist
-os.makedirs(os.path.join("assets", "ui"), exist_ok=True)
+# Color of each crop, used both for the picture on its seed packet and for its produce
+CROP_COLORS = {
+    "carrot": (255, 140, 0),     # Dark orange
+    "tomato": (220, 20, 60),     # Crimson
+    "potato": (222, 184, 135),   # Burlywood
+}
 
 def create_hoe_icon():
     surface = pygame.Surface((ICON_SIZE, ICON_SIZE), pygame.SRCALPHA)
@@ -67,15 +67,47 @@ def create_harvest_icon():
     
     return surface
 
-# Generate and save icons
-icons = {
-    "hoe": create_hoe_icon(),
-    "water": create_water_icon(),
-    "seed": create_seed_icon(),
-    "harvest": create_harvest_icon()
-}
+def create_seed_packet_icon(color):
+    surface = pygame.Surface((ICON_SIZE, ICON_SIZE), pygame.SRCALPHA)
+    
+    # Paper packet
+    pygame.draw.rect(surface, (245, 222, 179), (8, 4, 16, 24))
+    pygame.draw.rect(surface, (139, 69, 19), (8, 4, 16, 24), 1)
+    
+    # Picture of the crop on the front
+    pygame.draw.circle(surface, color, (16, 18), 5)
+    pygame.draw.rect(surface, (34, 139, 34), (15, 9, 2, 4))
+    
+    return surface
+
+def create_produce_icon(color):
+    surface = pygame.Surface((ICON_SIZE, ICON_SIZE), pygame.SRCALPHA)
+    
+    # Produce with a leafy top
+    pygame.draw.ellipse(surface, color, (7, 10, 18, 18))
+    pygame.draw.ellipse(surface, (0, 0, 0), (7, 10, 18, 18), 1)
+    pygame.draw.polygon(surface, (34, 139, 34), [(16, 12), (11, 4), (16, 8), (21, 4)])
+    
+    return surface
 
-for name, surface in icons.items():
-    pygame.image.save(surface, os.path.join("assets", "ui", f"{name}.png"))
+def create_item_icon(item_id):
+    # Seeds and produce share their crop's color
+    seeds = item_id.endswith("_seeds")
+    crop = item_id[:-len("_seeds")] if seeds else item_id
+    color = CROP_COLORS.get(crop, (128, 128, 128))
+    return create_seed_packet_icon(color) if seeds else create_produce_icon(color)
 
-pygame.quit() 
\ No newline at end of file
+def create_icons(items):
+    """
+    Draw every UI icon, keyed by its name in the icon atlas
+    items: Item types to draw icons for (Items.get_all_items())
+    """
+    icons = {
+        "tool/hoe": create_hoe_icon(),
+        "tool/water": create_water_icon(),
+        "tool/seed": create_seed_icon(),
+        "tool/harvest": create_harvest_icon()
+    }
+    for item_type in items:
+        icons[f"item/{item_type.id}"] = create_item_icon(item_type.id)
+    return icons 
\ No newline at end of file